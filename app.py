@@ -28,6 +28,10 @@ import services.http_middleware_service as http_middleware_service
 import legacy_ui
 import mitre_store
 import services.db_schema_service as db_schema_service
+import services.db_connection_service as db_connection_service
+import services.db_writer_service as db_writer_service
+import services.data_retention_service as data_retention_service
+import services.extraction_pool_service as extraction_pool_service
 import services.activity_highlight_service as activity_highlight_service
 import services.actor_facade_service as actor_facade_service
 import services.actor_data_facade_service as actor_data_facade_service
@@ -79,6 +83,7 @@ import services.llm_cache_service as llm_cache_service
 import services.llm_facade_service as llm_facade_service
 import services.alert_delivery_service as alert_delivery_service
 import services.timeline_facade_service as timeline_facade_service
+import pipelines.notebook_build_context as notebook_build_context
 import pipelines.timeline_extraction as timeline_extraction
 import services.timeline_analytics_service as timeline_analytics_service
 from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
@@ -90,6 +95,7 @@ from pipelines.generation_runner import run_actor_generation_core as pipeline_ru
 from pipelines.notebook_builder import build_notebook_core
 from pipelines.notebook_pipeline import build_environment_checks as pipeline_build_environment_checks
 from pipelines.notebook_pipeline import fetch_actor_notebook_core as pipeline_fetch_actor_notebook_core
+from pipelines.notebook_pipeline import enrich_notebook_llm_sections_core as pipeline_enrich_notebook_llm_sections_core
 from pipelines.notebook_pipeline import build_recent_activity_highlights as pipeline_build_recent_activity_highlights
 from pipelines.notebook_pipeline import latest_reporting_recency_label as pipeline_latest_reporting_recency_label
 from pipelines.notebook_pipeline import recent_change_summary as pipeline_recent_change_summary
@@ -107,7 +113,18 @@ from pipelines.source_derivation import strip_html as pipeline_strip_html
 @asynccontextmanager
 async def app_lifespan(_: FastAPI):
     global AUTO_REFRESH_STOP_EVENT, AUTO_REFRESH_THREAD, GENERATION_WORKER_STOP_EVENT
+    global MITRE_REFRESH_STOP_EVENT, MITRE_REFRESH_THREAD, RETENTION_STOP_EVENT, RETENTION_THREAD
     initialize_sqlite()
+    if MITRE_ATTACK_REFRESH_ENABLED:
+        # Boot serves the last good local bundle; downloads happen off the startup path.
+        MITRE_REFRESH_STOP_EVENT = Event()
+        MITRE_REFRESH_THREAD = Thread(
+            target=_mitre_refresh_loop,
+            args=(MITRE_REFRESH_STOP_EVENT,),
+            daemon=True,
+            name='mitre-attack-refresh',
+        )
+        MITRE_REFRESH_THREAD.start()
     GENERATION_WORKER_STOP_EVENT = Event()
     generation_service.start_generation_workers_core(
         deps={
@@ -125,6 +142,15 @@ async def app_lifespan(_: FastAPI):
             name='actor-auto-refresh',
         )
         AUTO_REFRESH_THREAD.start()
+    if RETENTION_ENABLED:
+        RETENTION_STOP_EVENT = Event()
+        RETENTION_THREAD = Thread(
+            target=_retention_loop,
+            args=(RETENTION_STOP_EVENT,),
+            daemon=True,
+            name='data-retention',
+        )
+        RETENTION_THREAD.start()
     try:
         yield
     finally:
@@ -132,12 +158,27 @@ async def app_lifespan(_: FastAPI):
             AUTO_REFRESH_STOP_EVENT.set()
         if AUTO_REFRESH_THREAD is not None:
             AUTO_REFRESH_THREAD.join(timeout=2.0)
+        if MITRE_REFRESH_STOP_EVENT is not None:
+            MITRE_REFRESH_STOP_EVENT.set()
+        if MITRE_REFRESH_THREAD is not None:
+            MITRE_REFRESH_THREAD.join(timeout=2.0)
+        if RETENTION_STOP_EVENT is not None:
+            RETENTION_STOP_EVENT.set()
+        if RETENTION_THREAD is not None:
+            RETENTION_THREAD.join(timeout=2.0)
         if GENERATION_WORKER_STOP_EVENT is not None:
             GENERATION_WORKER_STOP_EVENT.set()
             generation_service.stop_generation_workers_core()
+        notebook_service.stop_notebook_revalidation_core()
+        extraction_pool_service.shutdown_extraction_pool_core()
+        db_writer_service.shutdown_db_writer_core()
         AUTO_REFRESH_STOP_EVENT = None
         AUTO_REFRESH_THREAD = None
         GENERATION_WORKER_STOP_EVENT = None
+        MITRE_REFRESH_STOP_EVENT = None
+        MITRE_REFRESH_THREAD = None
+        RETENTION_STOP_EVENT = None
+        RETENTION_THREAD = None
 
 
 app = FastAPI(lifespan=app_lifespan)
@@ -156,6 +197,12 @@ MITRE_TECHNIQUE_PHASE_CACHE: dict[str, list[str]] | None = None
 MITRE_CAMPAIGN_LINK_CACHE: dict[str, dict[str, set[str]]] | None = None
 MITRE_TECHNIQUE_INDEX_CACHE: dict[str, dict[str, str]] | None = None
 MITRE_SOFTWARE_CACHE: list[dict[str, object]] | None = None
+MITRE_DATASET_VERSION = ''
+MITRE_ATTACK_REFRESH_ENABLED = os.environ.get('MITRE_ATTACK_REFRESH_ENABLED', '1').strip().lower() in {
+    '1', 'true', 'yes', 'on',
+}
+MITRE_ATTACK_REFRESH_HOURS = max(1, int(os.environ.get('MITRE_ATTACK_REFRESH_HOURS', '24')))
+MITRE_ATTACK_REFRESH_LOOP_SECONDS = max(60, int(os.environ.get('MITRE_ATTACK_REFRESH_LOOP_SECONDS', '3600')))
 AUTO_REFRESH_ENABLED = os.environ.get('AUTO_REFRESH_ENABLED', '1').strip().lower() in {
     '1', 'true', 'yes', 'on',
 }
@@ -189,9 +236,32 @@ ENFORCE_OLLAMA_SYNTHESIS = os.environ.get('ENFORCE_OLLAMA_SYNTHESIS', '0').strip
 EVIDENCE_PIPELINE_V2 = os.environ.get('EVIDENCE_PIPELINE_V2', '1').strip().lower() in {
     '1', 'true', 'yes', 'on',
 }
+NOTEBOOK_STALE_WHILE_REVALIDATE = os.environ.get('NOTEBOOK_STALE_WHILE_REVALIDATE', '1').strip().lower() in {
+    '1', 'true', 'yes', 'on',
+}
+NOTEBOOK_SWR_MAX_STALE_SECONDS = max(0, int(os.environ.get('NOTEBOOK_SWR_MAX_STALE_SECONDS', '86400')))
+NOTEBOOK_SWR_ACTOR_COOLDOWN_SECONDS = max(0, int(os.environ.get('NOTEBOOK_SWR_ACTOR_COOLDOWN_SECONDS', '60')))
+NOTEBOOK_SWR_MAX_WORKERS = max(1, int(os.environ.get('NOTEBOOK_SWR_MAX_WORKERS', '2')))
+NOTEBOOK_SWR_MAX_PENDING = max(1, int(os.environ.get('NOTEBOOK_SWR_MAX_PENDING', '8')))
+NOTEBOOK_BASE_CACHE_TTL_SECONDS = max(0, int(os.environ.get('NOTEBOOK_BASE_CACHE_TTL_SECONDS', '300')))
+NOTEBOOK_EXTRACTION_WORKERS = max(0, int(os.environ.get('NOTEBOOK_EXTRACTION_WORKERS', '0')))
 TAXII_COLLECTION_URL = str(os.environ.get('TAXII_COLLECTION_URL', '')).strip()
 TAXII_AUTH_TOKEN = str(os.environ.get('TAXII_AUTH_TOKEN', '')).strip()
 TAXII_LOOKBACK_HOURS = max(1, int(os.environ.get('TAXII_LOOKBACK_HOURS', '72')))
+SQLITE_BUSY_TIMEOUT_MS = max(0, int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', '30000')))
+SQLITE_CACHE_SIZE_KIB = max(0, int(os.environ.get('SQLITE_CACHE_SIZE_KIB', '16384')))
+SQLITE_MMAP_SIZE_BYTES = max(0, int(os.environ.get('SQLITE_MMAP_SIZE_BYTES', str(256 * 1024 * 1024))))
+RETENTION_ENABLED = os.environ.get('RETENTION_ENABLED', '0').strip().lower() in {
+    '1', 'true', 'yes', 'on',
+}
+RETENTION_DAYS = max(1, int(os.environ.get('RETENTION_DAYS', '180')))
+RETENTION_KEEP_MIN_ROWS = max(0, int(os.environ.get('RETENTION_KEEP_MIN_ROWS', '500')))
+RETENTION_TABLE_POLICIES = data_retention_service.parse_table_policies_core(
+    os.environ.get('RETENTION_TABLE_POLICIES', '')
+)
+RETENTION_INTERVAL_HOURS = max(1, int(os.environ.get('RETENTION_INTERVAL_HOURS', '24')))
+RETENTION_CHUNK_ROWS = max(1, int(os.environ.get('RETENTION_CHUNK_ROWS', '500')))
+RETENTION_CHUNK_PAUSE_MS = max(0, int(os.environ.get('RETENTION_CHUNK_PAUSE_MS', '50')))
 
 CAPABILITY_GRID_KEYS = domain_config.CAPABILITY_GRID_KEYS
 BEHAVIORAL_MODEL_KEYS = domain_config.BEHAVIORAL_MODEL_KEYS
@@ -254,6 +324,10 @@ _RATE_LIMIT_CLEANUP_EVERY = 512
 AUTO_REFRESH_STOP_EVENT: Event | None = None
 AUTO_REFRESH_THREAD: Thread | None = None
 GENERATION_WORKER_STOP_EVENT: Event | None = None
+MITRE_REFRESH_STOP_EVENT: Event | None = None
+MITRE_REFRESH_THREAD: Thread | None = None
+RETENTION_STOP_EVENT: Event | None = None
+RETENTION_THREAD: Thread | None = None
 LOGGER = logging.getLogger('actorwatch')
 if not LOGGER.handlers:
     _handler = logging.StreamHandler()
@@ -305,6 +379,42 @@ def _auto_refresh_loop(stop_event: Event) -> None:
     )
 
 
+def _mitre_refresh_loop(stop_event: Event) -> None:
+    mitre_facade_service.mitre_refresh_loop_core(
+        stop_event=stop_event,
+        loop_seconds=MITRE_ATTACK_REFRESH_LOOP_SECONDS,
+        refresh_once=lambda: mitre_facade_service.refresh_mitre_attack_dataset_if_stale_core(
+            max_age_seconds=MITRE_ATTACK_REFRESH_HOURS * 3600,
+            configure_mitre_store=_configure_mitre_store,
+            mitre_store=mitre_store,
+        ),
+    )
+
+
+def _run_data_retention_once(stop_event: Event) -> dict[str, object]:
+    outcome = data_retention_service.run_retention_job_core(
+        stop_event=stop_event,
+        deps={
+            'db_path': DB_PATH,
+            'retention_days': RETENTION_DAYS,
+            'keep_min_rows': RETENTION_KEEP_MIN_ROWS,
+            'table_policies': RETENTION_TABLE_POLICIES,
+            'chunk_rows': RETENTION_CHUNK_ROWS,
+            'pause_seconds': RETENTION_CHUNK_PAUSE_MS / 1000,
+        },
+    )
+    _log_event('data_retention_run', **outcome)
+    return outcome
+
+
+def _retention_loop(stop_event: Event) -> None:
+    data_retention_service.retention_loop_core(
+        stop_event=stop_event,
+        loop_seconds=RETENTION_INTERVAL_HOURS * 3600,
+        run_once=lambda: _run_data_retention_once(stop_event),
+    )
+
+
 def _recover_stale_running_states() -> int:
     return runtime_service.recover_stale_running_states_core(
         deps={
@@ -319,34 +429,43 @@ def _recover_stale_running_states() -> int:
 
 
 def _sync_mitre_cache_to_store() -> None:
-    mitre_store.MITRE_GROUP_CACHE = MITRE_GROUP_CACHE
-    mitre_store.MITRE_DATASET_CACHE = MITRE_DATASET_CACHE
-    mitre_store.MITRE_TECHNIQUE_PHASE_CACHE = MITRE_TECHNIQUE_PHASE_CACHE
-    mitre_store.MITRE_CAMPAIGN_LINK_CACHE = MITRE_CAMPAIGN_LINK_CACHE
-    mitre_store.MITRE_TECHNIQUE_INDEX_CACHE = MITRE_TECHNIQUE_INDEX_CACHE
-    mitre_store.MITRE_SOFTWARE_CACHE = MITRE_SOFTWARE_CACHE
+    with mitre_store.MITRE_DATASET_SWAP_LOCK:
+        if MITRE_DATASET_VERSION != mitre_store.MITRE_DATASET_VERSION:
+            # A background refresh swapped the dataset; keep the store's caches.
+            _reset_mitre_caches()
+            return
+        mitre_store.MITRE_GROUP_CACHE = MITRE_GROUP_CACHE
+        mitre_store.MITRE_DATASET_CACHE = MITRE_DATASET_CACHE
+        mitre_store.MITRE_TECHNIQUE_PHASE_CACHE = MITRE_TECHNIQUE_PHASE_CACHE
+        mitre_store.MITRE_CAMPAIGN_LINK_CACHE = MITRE_CAMPAIGN_LINK_CACHE
+        mitre_store.MITRE_TECHNIQUE_INDEX_CACHE = MITRE_TECHNIQUE_INDEX_CACHE
+        mitre_store.MITRE_SOFTWARE_CACHE = MITRE_SOFTWARE_CACHE
 
 
 def _sync_mitre_cache_from_store() -> None:
     global MITRE_GROUP_CACHE, MITRE_DATASET_CACHE, MITRE_TECHNIQUE_PHASE_CACHE
     global MITRE_SOFTWARE_CACHE, MITRE_CAMPAIGN_LINK_CACHE, MITRE_TECHNIQUE_INDEX_CACHE
+    global MITRE_DATASET_VERSION
     MITRE_GROUP_CACHE = mitre_store.MITRE_GROUP_CACHE
     MITRE_DATASET_CACHE = mitre_store.MITRE_DATASET_CACHE
     MITRE_TECHNIQUE_PHASE_CACHE = mitre_store.MITRE_TECHNIQUE_PHASE_CACHE
     MITRE_SOFTWARE_CACHE = mitre_store.MITRE_SOFTWARE_CACHE
     MITRE_CAMPAIGN_LINK_CACHE = mitre_store.MITRE_CAMPAIGN_LINK_CACHE
     MITRE_TECHNIQUE_INDEX_CACHE = mitre_store.MITRE_TECHNIQUE_INDEX_CACHE
+    MITRE_DATASET_VERSION = mitre_store.MITRE_DATASET_VERSION
 
 
 def _reset_mitre_caches() -> None:
     global MITRE_GROUP_CACHE, MITRE_DATASET_CACHE, MITRE_TECHNIQUE_PHASE_CACHE
     global MITRE_SOFTWARE_CACHE, MITRE_CAMPAIGN_LINK_CACHE, MITRE_TECHNIQUE_INDEX_CACHE
+    global MITRE_DATASET_VERSION
     MITRE_GROUP_CACHE = None
     MITRE_DATASET_CACHE = None
     MITRE_TECHNIQUE_PHASE_CACHE = None
     MITRE_SOFTWARE_CACHE = None
     MITRE_CAMPAIGN_LINK_CACHE = None
     MITRE_TECHNIQUE_INDEX_CACHE = None
+    MITRE_DATASET_VERSION = mitre_store.MITRE_DATASET_VERSION
 
 
 def _configure_mitre_store() -> None:
@@ -534,22 +653,15 @@ def normalize_string_list(value: object) -> list[str]:
 
 
 def _normalize_text(value: str) -> str:
-    return text_utils_service.normalize_text_core(value)
+    return text_utils_service.tokenize_text_core(value).normalized
 
 
-def _token_set(value: str) -> set[str]:
-    return text_utils_service.token_set_core(
-        value,
-        normalize_text=_normalize_text,
-    )
+def _token_set(value: str) -> frozenset[str]:
+    return text_utils_service.tokenize_text_core(value).tokens
 
 
 def _token_overlap(a: str, b: str) -> float:
-    return text_utils_service.token_overlap_core(
-        a,
-        b,
-        token_set=_token_set,
-    )
+    return text_utils_service.tokenize_text_core(a).overlap(text_utils_service.tokenize_text_core(b))
 
 
 def _split_sentences(text: str) -> list[str]:
@@ -1163,6 +1275,7 @@ def _extract_major_move_events(
     text: str,
     actor_terms: list[str],
     source_title: str | None = None,
+    sentence_records: list[dict[str, object]] | None = None,
 ) -> list[dict[str, object]]:
     return timeline_extraction.extract_major_move_events(
         source_name,
@@ -1171,6 +1284,7 @@ def _extract_major_move_events(
         text,
         actor_terms,
         source_title=source_title,
+        sentence_records=sentence_records,
         deps={
             'split_sentences': _split_sentences,
             'extract_ttp_ids': _extract_ttp_ids,
@@ -1533,6 +1647,14 @@ def _finish_generation_phase(
     )
 
 
+def _open_notebook_build_context(actor_id: str) -> None:
+    notebook_build_context.open_build_context_core(actor_id, db_path=DB_PATH)
+
+
+def _close_notebook_build_context(actor_id: str) -> None:
+    notebook_build_context.close_build_context_core(actor_id, db_path=DB_PATH)
+
+
 def run_actor_generation(actor_id: str, *, trigger_type: str = 'manual_refresh', job_id: str = '') -> None:
     started = time.perf_counter()
     success = False
@@ -1554,6 +1676,8 @@ def run_actor_generation(actor_id: str, *, trigger_type: str = 'manual_refresh',
                 'start_generation_phase': _start_generation_phase,
                 'finish_generation_phase': _finish_generation_phase,
                 'finalize_generation_job': _finalize_generation_job,
+                'open_build_context': _open_notebook_build_context,
+                'close_build_context': _close_notebook_build_context,
                 'trigger_type': trigger_type,
                 'job_id': job_id,
                 'interactive_feed_import_max_seconds': FEED_IMPORT_INTERACTIVE_MAX_SECONDS,
@@ -1603,8 +1727,10 @@ def run_actor_llm_enrichment(actor_id: str, *, job_id: str = '') -> None:
             'mark_finished': generation_service.mark_actor_llm_enrichment_finished_core,
             'set_actor_notebook_status': set_actor_notebook_status,
             'refresh_actor_notebook_uncached': _refresh_actor_notebook_uncached,
+            'enrich_actor_notebook_llm': _enrich_actor_notebook_llm,
             'start_phase': _start_generation_phase,
             'finish_phase': _finish_generation_phase,
+            'close_build_context': _close_notebook_build_context,
             'job_id': job_id,
             'max_attempts': int(os.environ.get('LLM_ENRICHMENT_MAX_ATTEMPTS', '2')),
             'retry_sleep_seconds': float(os.environ.get('LLM_ENRICHMENT_RETRY_SECONDS', '2')),
@@ -1662,7 +1788,7 @@ def merge_actor_profiles(target_actor_id: str, source_actor_id: str) -> dict[str
 
 
 def get_tracking_intent(actor_id: str) -> dict[str, object]:
-    with sqlite3.connect(DB_PATH) as connection:
+    with db_connection_service.connect_core(DB_PATH) as connection:
         if not actor_exists(connection, actor_id):
             raise HTTPException(status_code=404, detail='actor not found')
         return actor_profile_service.load_tracking_intent_core(connection, actor_id)
@@ -1752,12 +1878,14 @@ def seed_actor_profiles_from_mitre_groups() -> dict[str, int]:
 
 def get_actor_refresh_stats(actor_id: str) -> dict[str, object]:
     try:
-        return refresh_ops_service.actor_refresh_stats_core(
+        stats = refresh_ops_service.actor_refresh_stats_core(
             actor_id=actor_id,
             db_path=DB_PATH,
         )
     except ValueError:
         raise HTTPException(status_code=404, detail='actor not found')
+    stats['stage_timings'] = metrics_service.stage_timings_snapshot_core(actor_id=actor_id)
+    return stats
 
 
 def get_actor_refresh_timeline(actor_id: str) -> dict[str, object]:
@@ -1768,6 +1896,7 @@ def get_actor_refresh_timeline(actor_id: str) -> dict[str, object]:
         'eta_seconds': stats.get('eta_seconds'),
         'avg_duration_ms': stats.get('avg_duration_ms'),
         'llm_cache_state': stats.get('llm_cache_state', {}),
+        'stage_timings': stats.get('stage_timings', {}),
         'queue_state': generation_service.queue_snapshot_core(),
     }
 
@@ -1859,7 +1988,7 @@ def run_cold_actor_backfill(
         actor_aliases=actor_aliases or [],
         deps={
             'db_path': _db_path,
-            'sqlite_connect': sqlite3.connect,
+            'sqlite_connect': db_connection_service.connect_core,
             'utc_now_iso': utc_now_iso,
             'http_get': httpx.get,
             'derive_source_from_url': derive_source_from_url,
@@ -2234,9 +2363,7 @@ def build_notebook(
             'actor_terms_fn': _actor_terms,
             'extract_major_move_events': _extract_major_move_events,
             'normalize_text': _normalize_text,
-            'token_overlap': _token_overlap,
-            'extract_question_sentences': _extract_question_sentences,
-            'sentence_mentions_actor_terms': _sentence_mentions_actor_terms,
+            'token_set': _token_set,
             'sanitize_question_text': _sanitize_question_text,
             'question_from_sentence': _question_from_sentence,
             'ollama_generate_questions': _ollama_generate_questions,
@@ -2244,6 +2371,7 @@ def build_notebook(
             'guidance_for_platform': _guidance_for_platform,
             'ollama_enrich_quick_checks': _ollama_enrich_quick_checks,
             'store_quick_check_overrides': _store_quick_check_overrides,
+            'extraction_workers': NOTEBOOK_EXTRACTION_WORKERS,
         },
     )
 
@@ -2257,6 +2385,7 @@ def _fetch_actor_notebook(
     prefer_cached: bool = True,
     build_on_cache_miss: bool = True,
     allow_stale_cache: bool = False,
+    stale_while_revalidate: bool = False,
 ) -> dict[str, object]:
     return notebook_service.fetch_actor_notebook_wrapper_core(
         actor_id=actor_id,
@@ -2267,6 +2396,7 @@ def _fetch_actor_notebook(
             prefer_cached=prefer_cached,
             build_on_cache_miss=build_on_cache_miss,
             allow_stale_cache=allow_stale_cache,
+            stale_while_revalidate=stale_while_revalidate,
         ),
     )
 
@@ -2279,6 +2409,7 @@ def _fetch_actor_notebook_deps(
     prefer_cached: bool = True,
     build_on_cache_miss: bool = True,
     allow_stale_cache: bool = False,
+    stale_while_revalidate: bool = False,
 ) -> dict[str, object]:
     return app_dependency_maps_service.build_fetch_actor_notebook_deps_core(
         namespace=globals(),
@@ -2288,6 +2419,7 @@ def _fetch_actor_notebook_deps(
         prefer_cached=prefer_cached,
         build_on_cache_miss=build_on_cache_miss,
         allow_stale_cache=allow_stale_cache,
+        stale_while_revalidate=stale_while_revalidate and NOTEBOOK_STALE_WHILE_REVALIDATE,
     )
 
 
@@ -2295,6 +2427,13 @@ def _refresh_actor_notebook_uncached(actor_id: str) -> dict[str, object]:
     return _fetch_actor_notebook(actor_id, prefer_cached=False)
 
 
+def _enrich_actor_notebook_llm(actor_id: str) -> dict[str, object]:
+    return notebook_service.enrich_actor_notebook_llm_wrapper_core(
+        actor_id=actor_id,
+        deps=_fetch_actor_notebook_deps(),
+    )
+
+
 def _initialize_sqlite_deps() -> dict[str, object]:
     return {
         'resolve_startup_db_path': _resolve_startup_db_path,
@@ -2305,7 +2444,13 @@ def _initialize_sqlite_deps() -> dict[str, object]:
         'clear_mitre_store_cache': mitre_store.clear_cache,
         'reset_app_mitre_caches': _reset_mitre_caches,
         'ensure_mitre_attack_dataset': _ensure_mitre_attack_dataset,
-        'sqlite_connect': sqlite3.connect,
+        'configure_db_connections': lambda: db_connection_service.configure(
+            busy_timeout_ms=SQLITE_BUSY_TIMEOUT_MS,
+            cache_size_kib=SQLITE_CACHE_SIZE_KIB,
+            mmap_size_bytes=SQLITE_MMAP_SIZE_BYTES,
+        ),
+        'enable_sqlite_wal': db_connection_service.enable_wal_core,
+        'sqlite_connect': db_connection_service.connect_core,
     }
 
 
@@ -1,7 +1,10 @@
+import hashlib
 import json
 import os
 import re
+import time
 from pathlib import Path
+from threading import Lock
 from typing import Callable
 
 import httpx
@@ -17,6 +20,21 @@ MITRE_TECHNIQUE_PHASE_CACHE: dict[str, list[str]] | None = None
 MITRE_CAMPAIGN_LINK_CACHE: dict[str, dict[str, set[str]]] | None = None
 MITRE_TECHNIQUE_INDEX_CACHE: dict[str, dict[str, str]] | None = None
 MITRE_SOFTWARE_CACHE: list[dict[str, object]] | None = None
+MITRE_RELATIONSHIP_INDEX_CACHE: dict[str, object] | None = None
+MITRE_MATCH_INDEX_CACHE: dict[str, dict[str, object]] | None = None
+MITRE_PROFILE_MEMO_CACHE: dict[str, object] | None = None
+MITRE_PROFILE_MEMO_MAX_ENTRIES = 4096
+# SHA-256 of the bundle behind MITRE_DATASET_CACHE; changes when a refresh swaps the dataset.
+MITRE_DATASET_VERSION = ''
+# Held while the cached dataset is swapped, and by callers that push cache copies back in.
+MITRE_DATASET_SWAP_LOCK = Lock()
+MITRE_DOWNLOAD_TIMEOUT_SECONDS = 45.0
+
+# Bump when the compact object shape changes so existing index files are rebuilt.
+MITRE_COMPACT_INDEX_VERSION = 1
+_COMPACT_OBJECT_TYPES = {'intrusion-set', 'malware', 'tool', 'campaign', 'attack-pattern', 'relationship'}
+_COMPACT_RELATIONSHIP_TYPES = {'uses', 'attributed-to', 'related-to'}
+_COMPACT_DESCRIPTION_TYPES = {'intrusion-set', 'malware', 'tool'}
 
 
 def configure(*, db_path: str | None = None, attack_url: str | None = None) -> None:
@@ -30,12 +48,18 @@ def configure(*, db_path: str | None = None, attack_url: str | None = None) -> N
 def clear_cache() -> None:
     global MITRE_GROUP_CACHE, MITRE_DATASET_CACHE, MITRE_TECHNIQUE_PHASE_CACHE
     global MITRE_SOFTWARE_CACHE, MITRE_CAMPAIGN_LINK_CACHE, MITRE_TECHNIQUE_INDEX_CACHE
+    global MITRE_RELATIONSHIP_INDEX_CACHE, MITRE_DATASET_VERSION
+    global MITRE_MATCH_INDEX_CACHE, MITRE_PROFILE_MEMO_CACHE
     MITRE_GROUP_CACHE = None
     MITRE_DATASET_CACHE = None
     MITRE_TECHNIQUE_PHASE_CACHE = None
     MITRE_SOFTWARE_CACHE = None
     MITRE_CAMPAIGN_LINK_CACHE = None
     MITRE_TECHNIQUE_INDEX_CACHE = None
+    MITRE_RELATIONSHIP_INDEX_CACHE = None
+    MITRE_MATCH_INDEX_CACHE = None
+    MITRE_PROFILE_MEMO_CACHE = None
+    MITRE_DATASET_VERSION = ''
 
 
 def _normalize_actor_key(value: str) -> str:
@@ -66,18 +90,6 @@ def _mitre_alias_values(obj: dict[str, object]) -> list[str]:
     return _dedupe_actor_terms(alias_candidates)
 
 
-def _candidate_overlap_score(actor_tokens: set[str], search_keys: set[str]) -> float:
-    best_score = 0.0
-    for search_key in search_keys:
-        key_tokens = set(search_key.split())
-        if not key_tokens:
-            continue
-        overlap = len(actor_tokens.intersection(key_tokens)) / len(actor_tokens.union(key_tokens))
-        if overlap > best_score:
-            best_score = overlap
-    return best_score
-
-
 def _mitre_dataset_path() -> Path:
     configured = os.environ.get('MITRE_ATTACK_PATH', '').strip()
     if configured:
@@ -85,27 +97,247 @@ def _mitre_dataset_path() -> Path:
     return Path(DB_PATH).resolve().parent / 'mitre_enterprise_attack.json'
 
 
-def ensure_mitre_attack_dataset() -> bool:
+def _mitre_mirror_path() -> Path | None:
+    configured = os.environ.get('MITRE_ATTACK_MIRROR_PATH', '').strip()
+    return Path(configured) if configured else None
+
+
+def _mitre_compact_index_path() -> Path:
+    dataset_path = _mitre_dataset_path()
+    return dataset_path.with_name(f'{dataset_path.stem}.index-v{MITRE_COMPACT_INDEX_VERSION}.json')
+
+
+def _mitre_checked_stamp_path() -> Path:
+    dataset_path = _mitre_dataset_path()
+    return dataset_path.with_name(f'{dataset_path.name}.checked')
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open('rb') as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _compact_stix_object(obj: dict[str, object]) -> dict[str, object] | None:
+    obj_type = str(obj.get('type') or '')
+    if obj_type not in _COMPACT_OBJECT_TYPES:
+        return None
+    if obj_type == 'relationship':
+        relationship_type = str(obj.get('relationship_type') or '').strip().lower()
+        if relationship_type not in _COMPACT_RELATIONSHIP_TYPES:
+            return None
+        compact: dict[str, object] = {
+            'type': obj_type,
+            'relationship_type': obj.get('relationship_type'),
+            'source_ref': obj.get('source_ref'),
+            'target_ref': obj.get('target_ref'),
+        }
+    else:
+        compact = {'type': obj_type, 'id': obj.get('id'), 'name': obj.get('name')}
+        if obj_type in _COMPACT_DESCRIPTION_TYPES and obj.get('description'):
+            compact['description'] = obj.get('description')
+        for field in ('aliases', 'x_mitre_aliases'):
+            if isinstance(obj.get(field), list):
+                compact[field] = obj.get(field)
+        refs = obj.get('external_references')
+        if isinstance(refs, list):
+            compact['external_references'] = [
+                {key: ref[key] for key in ('source_name', 'external_id', 'url') if key in ref}
+                for ref in refs
+                if isinstance(ref, dict) and ref.get('external_id')
+            ]
+        phases = obj.get('kill_chain_phases')
+        if isinstance(phases, list):
+            compact['kill_chain_phases'] = [
+                {'phase_name': phase.get('phase_name')} for phase in phases if isinstance(phase, dict)
+            ]
+    for flag in ('revoked', 'x_mitre_deprecated'):
+        if obj.get(flag):
+            compact[flag] = True
+    return compact
+
+
+def _write_mitre_compact_index(dataset_path: Path, parsed: dict[str, object]) -> dict[str, object]:
+    """Derive the compact index from a parsed bundle and write it next to the bundle."""
+    objects = parsed.get('objects')
+    stat = dataset_path.stat()
+    index = {
+        'format_version': MITRE_COMPACT_INDEX_VERSION,
+        'source_sha256': _file_sha256(dataset_path),
+        'source_size': stat.st_size,
+        'source_mtime_ns': stat.st_mtime_ns,
+        'objects': [
+            compact
+            for obj in (objects if isinstance(objects, list) else [])
+            if isinstance(obj, dict) and (compact := _compact_stix_object(obj)) is not None
+        ],
+    }
+    index_path = _mitre_compact_index_path()
+    tmp_path = index_path.with_name(f'{index_path.name}.tmp')
+    try:
+        tmp_path.write_text(json.dumps(index, separators=(',', ':')), encoding='utf-8')
+        os.replace(tmp_path, index_path)
+    except OSError:
+        # A read-only data directory still gets the compact objects for this process.
+        tmp_path.unlink(missing_ok=True)
+    return index
+
+
+def _load_mitre_compact_index(dataset_path: Path) -> dict[str, object] | None:
+    """Return the compact index if it was derived from the current bundle, else None."""
+    index_path = _mitre_compact_index_path()
+    if not index_path.exists():
+        return None
+    try:
+        index = json.loads(index_path.read_text(encoding='utf-8'))
+    except Exception:
+        return None
+    if not isinstance(index, dict) or index.get('format_version') != MITRE_COMPACT_INDEX_VERSION:
+        return None
+    if not isinstance(index.get('objects'), list):
+        return None
+    stat = dataset_path.stat()
+    if index.get('source_size') == stat.st_size and index.get('source_mtime_ns') == stat.st_mtime_ns:
+        return index
+    # A touched but unchanged bundle keeps its index; the hash is the real key.
+    if index.get('source_sha256') == _file_sha256(dataset_path):
+        return index
+    return None
+
+
+def build_mitre_compact_index(*, force: bool = False) -> bool:
+    """Rebuild the compact index when the bundle changed; True when a current index exists."""
     dataset_path = _mitre_dataset_path()
-    if dataset_path.exists() and dataset_path.stat().st_size > 0:
+    if not dataset_path.exists():
+        return False
+    if not force and _load_mitre_compact_index(dataset_path) is not None:
         return True
+    try:
+        parsed = json.loads(dataset_path.read_text(encoding='utf-8'))
+    except Exception:
+        return False
+    if not isinstance(parsed, dict):
+        return False
+    _write_mitre_compact_index(dataset_path, parsed)
+    return _mitre_compact_index_path().exists()
+
+
+def ensure_mitre_attack_dataset() -> bool:
+    """Make a local ATT&CK bundle available without touching the network.
+
+    Falls back to copying MITRE_ATTACK_MIRROR_PATH when the bundle is
+    missing; downloads are left to refresh_mitre_attack_dataset().
+    """
+    dataset_path = _mitre_dataset_path()
+    if not dataset_path.exists() or dataset_path.stat().st_size <= 0:
+        mirror_path = _mitre_mirror_path()
+        if mirror_path is None or not mirror_path.is_file() or mirror_path.stat().st_size <= 0:
+            return False
+        try:
+            dataset_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = dataset_path.with_name(f'{dataset_path.name}.mirror')
+            tmp_path.write_bytes(mirror_path.read_bytes())
+            os.replace(tmp_path, dataset_path)
+        except OSError:
+            return False
+    build_mitre_compact_index()
+    return True
+
 
-    dataset_path.parent.mkdir(parents=True, exist_ok=True)
+def _is_valid_attack_bundle(parsed: object) -> bool:
+    if not isinstance(parsed, dict) or not isinstance(parsed.get('objects'), list):
+        return False
+    object_types = {obj.get('type') for obj in parsed['objects'] if isinstance(obj, dict)}
+    return {'attack-pattern', 'intrusion-set', 'relationship'}.issubset(object_types)
+
+
+def swap_mitre_dataset(dataset: dict[str, object], *, version: str) -> None:
+    """Replace the cached dataset and drop every cache derived from the old one."""
+    global MITRE_GROUP_CACHE, MITRE_DATASET_CACHE, MITRE_TECHNIQUE_PHASE_CACHE
+    global MITRE_SOFTWARE_CACHE, MITRE_CAMPAIGN_LINK_CACHE, MITRE_TECHNIQUE_INDEX_CACHE
+    global MITRE_RELATIONSHIP_INDEX_CACHE, MITRE_DATASET_VERSION
+    global MITRE_MATCH_INDEX_CACHE, MITRE_PROFILE_MEMO_CACHE
+    with MITRE_DATASET_SWAP_LOCK:
+        MITRE_GROUP_CACHE = None
+        MITRE_TECHNIQUE_PHASE_CACHE = None
+        MITRE_SOFTWARE_CACHE = None
+        MITRE_CAMPAIGN_LINK_CACHE = None
+        MITRE_TECHNIQUE_INDEX_CACHE = None
+        MITRE_RELATIONSHIP_INDEX_CACHE = None
+        MITRE_MATCH_INDEX_CACHE = None
+        MITRE_PROFILE_MEMO_CACHE = None
+        MITRE_DATASET_CACHE = dataset
+        MITRE_DATASET_VERSION = version
+
+
+def warm_mitre_caches() -> None:
+    load_mitre_groups()
+    load_mitre_software()
+    mitre_technique_index()
+    mitre_technique_phase_index()
+    mitre_relationship_index()
+
+
+def mitre_dataset_age_seconds() -> float | None:
+    dataset_path = _mitre_dataset_path()
+    if not dataset_path.exists():
+        return None
+    checked_at = dataset_path.stat().st_mtime
+    stamp_path = _mitre_checked_stamp_path()
+    if stamp_path.exists():
+        checked_at = max(checked_at, stamp_path.stat().st_mtime)
+    return max(0.0, time.time() - checked_at)
+
+
+def refresh_mitre_attack_dataset(*, http_get: Callable[..., httpx.Response] = httpx.get) -> bool:
+    """Download the ATT&CK bundle and swap it in if it is valid and changed.
+
+    The download goes to a temp file next to the bundle and replaces it
+    atomically; the compact index and in-memory caches are rebuilt before
+    returning. Returns True when a new dataset was swapped in; an unchanged
+    download only touches the ``.checked`` stamp next to the bundle, so the
+    bundle's stat stays valid for the compact index fast path.
+    """
+    dataset_path = _mitre_dataset_path()
     try:
-        response = httpx.get(ATTACK_ENTERPRISE_STIX_URL, timeout=45.0, follow_redirects=True)
+        response = http_get(ATTACK_ENTERPRISE_STIX_URL, timeout=MITRE_DOWNLOAD_TIMEOUT_SECONDS, follow_redirects=True)
         response.raise_for_status()
-        parsed = response.json()
-        objects = parsed.get('objects')
-        if not isinstance(objects, list):
-            return False
-        dataset_path.write_text(json.dumps(parsed), encoding='utf-8')
-        return True
+        raw = response.content
+        parsed = json.loads(raw)
     except Exception:
         return False
+    if not _is_valid_attack_bundle(parsed):
+        return False
+    if dataset_path.exists() and hashlib.sha256(raw).hexdigest() == _file_sha256(dataset_path):
+        try:
+            _mitre_checked_stamp_path().touch()
+        except OSError:
+            pass
+        return False
+
+    tmp_path = dataset_path.with_name(f'{dataset_path.name}.download')
+    try:
+        dataset_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(raw)
+        os.replace(tmp_path, dataset_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        return False
+    index = _write_mitre_compact_index(dataset_path, parsed)
+    swap_mitre_dataset({'objects': index['objects']}, version=str(index['source_sha256']))
+    warm_mitre_caches()
+    return True
 
 
 def load_mitre_dataset() -> dict[str, object]:
-    global MITRE_DATASET_CACHE
+    """Return the ATT&CK objects used by this module, read from the compact index.
+
+    The full STIX bundle is parsed only when the index is missing or was
+    derived from a different bundle.
+    """
+    global MITRE_DATASET_CACHE, MITRE_DATASET_VERSION
     if MITRE_DATASET_CACHE is not None:
         return MITRE_DATASET_CACHE
 
@@ -114,14 +346,18 @@ def load_mitre_dataset() -> dict[str, object]:
         MITRE_DATASET_CACHE = {}
         return MITRE_DATASET_CACHE
 
-    try:
-        parsed = json.loads(dataset_path.read_text(encoding='utf-8'))
-        if not isinstance(parsed, dict):
+    index = _load_mitre_compact_index(dataset_path)
+    if index is None:
+        try:
+            parsed = json.loads(dataset_path.read_text(encoding='utf-8'))
+            if not isinstance(parsed, dict):
+                parsed = {}
+        except Exception:
             parsed = {}
-    except Exception:
-        parsed = {}
+        index = _write_mitre_compact_index(dataset_path, parsed) if parsed else {'objects': []}
 
-    MITRE_DATASET_CACHE = parsed
+    MITRE_DATASET_CACHE = {'objects': index['objects']} if index['objects'] else {}
+    MITRE_DATASET_VERSION = str(index.get('source_sha256') or '')
     return MITRE_DATASET_CACHE
 
 
@@ -416,41 +652,74 @@ def load_mitre_groups() -> list[dict[str, object]]:
     return groups
 
 
-def match_mitre_group(actor_name: str) -> dict[str, object] | None:
-    actor_key = _normalize_actor_key(actor_name)
+def _search_match_index(kind: str, items: list[dict[str, object]]) -> dict[str, object]:
+    """Return exact-key and token postings lookups for ``items``, rebuilt when the list changes.
+
+    Positions refer to ``items`` so ties resolve to the earliest record, as a
+    linear scan would.
+    """
+    global MITRE_MATCH_INDEX_CACHE
+    cache = MITRE_MATCH_INDEX_CACHE if MITRE_MATCH_INDEX_CACHE is not None else {}
+    index = cache.get(kind)
+    if index is not None and index.get('items') is items:
+        return index
+
+    base_positions: dict[str, int] = {}
+    campaign_positions: dict[str, int] = {}
+    postings: dict[str, list[tuple[int, frozenset[str]]]] = {}
+    for position, item in enumerate(items):
+        for field, positions in (('base_search_keys', base_positions), ('campaign_search_keys', campaign_positions)):
+            keys = item.get(field)
+            if isinstance(keys, set):
+                for key in keys:
+                    positions.setdefault(key, position)
+        search_keys = item.get('search_keys')
+        if not isinstance(search_keys, set):
+            continue
+        for search_key in search_keys:
+            key_tokens = frozenset(search_key.split())
+            for token in key_tokens:
+                postings.setdefault(token, []).append((position, key_tokens))
+
+    index = {'items': items, 'base': base_positions, 'campaign': campaign_positions, 'postings': postings}
+    MITRE_MATCH_INDEX_CACHE = {**cache, kind: index}
+    return index
+
+
+def _match_search_index(kind: str, items: list[dict[str, object]], name: str) -> dict[str, object] | None:
+    actor_key = _normalize_actor_key(name)
     if not actor_key:
         return None
 
-    groups = load_mitre_groups()
-    for group in groups:
-        base_search_keys = group.get('base_search_keys')
-        if isinstance(base_search_keys, set) and actor_key in base_search_keys:
-            return group
-
-    for group in groups:
-        campaign_search_keys = group.get('campaign_search_keys')
-        if isinstance(campaign_search_keys, set) and actor_key in campaign_search_keys:
-            return group
+    index = _search_match_index(kind, items)
+    for positions in (index['base'], index['campaign']):
+        position = positions.get(actor_key)
+        if position is not None:
+            return items[position]
 
     actor_tokens = set(actor_key.split())
     if not actor_tokens:
         return None
 
-    best: dict[str, object] | None = None
-    best_score = 0.0
-    for group in groups:
-        search_keys = group.get('search_keys')
-        if not isinstance(search_keys, set):
-            continue
-        overlap = _candidate_overlap_score(actor_tokens, search_keys)
-        if overlap > best_score:
-            best_score = overlap
-            best = group
-    if best is not None and best_score >= 0.6:
-        return best
+    # Only keys sharing a token can overlap; score those and keep each record's best key.
+    best_by_position: dict[int, float] = {}
+    for token in actor_tokens:
+        for position, key_tokens in index['postings'].get(token, []):
+            overlap = len(actor_tokens.intersection(key_tokens)) / len(actor_tokens.union(key_tokens))
+            if overlap > best_by_position.get(position, 0.0):
+                best_by_position[position] = overlap
+    if not best_by_position:
+        return None
+    best_position, best_score = min(best_by_position.items(), key=lambda item: (-item[1], item[0]))
+    if best_score >= 0.6:
+        return items[best_position]
     return None
 
 
+def match_mitre_group(actor_name: str) -> dict[str, object] | None:
+    return _match_search_index('groups', load_mitre_groups(), actor_name)
+
+
 def load_mitre_software() -> list[dict[str, object]]:
     global MITRE_SOFTWARE_CACHE
     if MITRE_SOFTWARE_CACHE is not None:
@@ -530,39 +799,33 @@ def load_mitre_software() -> list[dict[str, object]]:
 
 
 def match_mitre_software(name: str) -> dict[str, object] | None:
-    actor_key = _normalize_actor_key(name)
-    if not actor_key:
-        return None
+    return _match_search_index('software', load_mitre_software(), name)
 
-    items = load_mitre_software()
-    for it in items:
-        base_search_keys = it.get('base_search_keys')
-        if isinstance(base_search_keys, set) and actor_key in base_search_keys:
-            return it
-
-    for it in items:
-        campaign_search_keys = it.get('campaign_search_keys')
-        if isinstance(campaign_search_keys, set) and actor_key in campaign_search_keys:
-            return it
-
-    actor_tokens = set(actor_key.split())
-    if not actor_tokens:
-        return None
 
-    best = None
-    best_score = 0.0
-    for it in items:
-        search_keys = it.get('search_keys')
-        if not isinstance(search_keys, set):
-            continue
-        overlap = _candidate_overlap_score(actor_tokens, search_keys)
-        if overlap > best_score:
-            best_score = overlap
-            best = it
-
-    if best is not None and best_score >= 0.6:
-        return best
-    return None
+def _mitre_profile_memo() -> dict[str, dict[str, str]]:
+    global MITRE_PROFILE_MEMO_CACHE
+    groups = load_mitre_groups()
+    software = load_mitre_software()
+    memo = MITRE_PROFILE_MEMO_CACHE
+    if (
+        memo is None
+        or memo.get('groups') is not groups
+        or memo.get('software') is not software
+        or len(memo['profiles']) >= MITRE_PROFILE_MEMO_MAX_ENTRIES
+    ):
+        memo = {'groups': groups, 'software': software, 'profiles': {}}
+        MITRE_PROFILE_MEMO_CACHE = memo
+    return memo['profiles']
+
+
+def _mitre_record_summary(record: dict[str, object], *, kind: str, first_sentences: Callable[[str, int], str]) -> str:
+    description = str(record.get('description') or '').strip()
+    description = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', description)
+    description = re.sub(r'\(Citation:[^)]+\)', '', description, flags=re.IGNORECASE)
+    description = re.sub(r'\s{2,}', ' ', description).strip()
+    if description:
+        return first_sentences(description, 3)
+    return f'MITRE ATT&CK has a {kind} record for {record["name"]}, but no description text was available.'
 
 
 def build_actor_profile_from_mitre(
@@ -570,6 +833,17 @@ def build_actor_profile_from_mitre(
     *,
     first_sentences: Callable[[str, int], str],
 ) -> dict[str, str]:
+    """Return the ATT&CK profile for an actor name.
+
+    Matched profiles are memoized per normalized name until the group or
+    software list is replaced; ``first_sentences`` must be deterministic.
+    """
+    actor_key = _normalize_actor_key(actor_name)
+    profiles = _mitre_profile_memo()
+    cached = profiles.get(actor_key) if actor_key else None
+    if cached is not None:
+        return dict(cached)
+
     group = match_mitre_group(actor_name)
     if group is None:
         sw = match_mitre_software(actor_name)
@@ -585,173 +859,151 @@ def build_actor_profile_from_mitre(
                 'aliases_csv': '',
             }
 
-        description = str(sw.get('description') or '').strip()
-        description = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', description)
-        description = re.sub(r'\(Citation:[^)]+\)', '', description, flags=re.IGNORECASE)
-        description = re.sub(r'\s{2,}', ' ', description).strip()
-        if description:
-            summary = first_sentences(description, 3)
-        else:
-            summary = f'MITRE ATT&CK has a software record for {sw["name"]}, but no description text was available.'
-
-        source_url = str(sw.get('attack_url') or 'https://attack.mitre.org/software/')
         attack_id = str(sw.get('attack_id') or '').strip()
-        return {
-            'summary': summary,
+        record = sw
+        profile = {
+            'summary': _mitre_record_summary(sw, kind='software', first_sentences=first_sentences),
             'source_label': f'MITRE ATT&CK Software {attack_id}'.strip(),
-            'source_url': source_url,
+            'source_url': str(sw.get('attack_url') or 'https://attack.mitre.org/software/'),
             'group_name': str(sw.get('name') or actor_name),
             'stix_id': str(sw.get('stix_id') or ''),
             'aliases_csv': ', '.join(str(alias) for alias in sw.get('aliases', []) if str(alias).strip()),
         }
-
-    description = str(group.get('description') or '').strip()
-    description = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', description)
-    description = re.sub(r'\(Citation:[^)]+\)', '', description, flags=re.IGNORECASE)
-    description = re.sub(r'\s{2,}', ' ', description).strip()
-    if description:
-        summary = first_sentences(description, 3)
     else:
-        summary = f'MITRE ATT&CK has a group record for {group["name"]}, but no description text was available.'
-
-    source_url = str(group.get('attack_url') or 'https://attack.mitre.org/groups/')
-    return {
-        'summary': summary,
-        'source_label': f'MITRE ATT&CK {group.get("attack_id") or ""}'.strip(),
-        'source_url': source_url,
-        'group_name': str(group.get('name') or actor_name),
-        'stix_id': str(group.get('stix_id') or ''),
-        'aliases_csv': ', '.join(str(alias) for alias in group.get('aliases', []) if str(alias).strip()),
-    }
+        record = group
+        profile = {
+            'summary': _mitre_record_summary(group, kind='group', first_sentences=first_sentences),
+            'source_label': f'MITRE ATT&CK {group.get("attack_id") or ""}'.strip(),
+            'source_url': str(group.get('attack_url') or 'https://attack.mitre.org/groups/'),
+            'group_name': str(group.get('name') or actor_name),
+            'stix_id': str(group.get('stix_id') or ''),
+            'aliases_csv': ', '.join(str(alias) for alias in group.get('aliases', []) if str(alias).strip()),
+        }
+    # An unnamed record echoes the requested spelling, so it is not shared across spellings.
+    if actor_key and record.get('name'):
+        profiles[actor_key] = dict(profile)
+    return profile
 
 
-def group_top_techniques(group_stix_id: str, limit: int = 6) -> list[dict[str, str]]:
-    if not group_stix_id:
-        return []
+def mitre_relationship_index() -> dict[str, object]:
+    """Return the attack-pattern and ``uses`` adjacency maps for the loaded dataset.
 
+    Built in one pass over the ATT&CK objects and rebuilt whenever the dataset
+    object changes (clear_cache() or a dataset swap).
+    """
+    global MITRE_RELATIONSHIP_INDEX_CACHE
     dataset = load_mitre_dataset()
+    if MITRE_RELATIONSHIP_INDEX_CACHE is not None and MITRE_RELATIONSHIP_INDEX_CACHE.get('dataset') is dataset:
+        return MITRE_RELATIONSHIP_INDEX_CACHE
+
     objects = dataset.get('objects', []) if isinstance(dataset, dict) else []
     if not isinstance(objects, list):
-        return []
+        objects = []
 
     attack_patterns: dict[str, dict[str, object]] = {}
+    uses_relationships: list[tuple[str, str]] = []
     for obj in objects:
         if not isinstance(obj, dict):
             continue
-        if obj.get('type') != 'attack-pattern':
-            continue
-        if bool(obj.get('revoked')) or bool(obj.get('x_mitre_deprecated')):
-            continue
-        attack_patterns[str(obj.get('id') or '')] = obj
-
-    counts: dict[str, int] = {}
-    for obj in objects:
-        if not isinstance(obj, dict):
-            continue
-        if obj.get('type') != 'relationship':
-            continue
-        if obj.get('relationship_type') != 'uses':
+        obj_type = obj.get('type')
+        if obj_type == 'relationship':
+            if obj.get('relationship_type') == 'uses':
+                uses_relationships.append((str(obj.get('source_ref') or ''), str(obj.get('target_ref') or '')))
             continue
-        if str(obj.get('source_ref') or '') != group_stix_id:
+        if obj_type != 'attack-pattern':
             continue
-        target_ref = str(obj.get('target_ref') or '')
-        if target_ref in attack_patterns:
-            counts[target_ref] = counts.get(target_ref, 0) + 1
-
-    ranked: list[tuple[str, int]] = sorted(counts.items(), key=lambda item: item[1], reverse=True)
-    results: list[dict[str, str]] = []
-    for attack_pattern_id, use_count in ranked:
-        attack_obj = attack_patterns.get(attack_pattern_id, {})
-        name = str(attack_obj.get('name') or '').strip()
-        if not name:
+        if bool(obj.get('revoked')) or bool(obj.get('x_mitre_deprecated')):
             continue
 
+        # Top techniques take the first T-prefixed reference; known IDs only the mitre-attack one.
         technique_id = ''
         technique_url = ''
-        refs = attack_obj.get('external_references', [])
+        attack_technique_id = ''
+        refs = obj.get('external_references', [])
         if isinstance(refs, list):
             for ref in refs:
                 if not isinstance(ref, dict):
                     continue
                 external_id = str(ref.get('external_id') or '')
-                if external_id.startswith('T'):
+                if not technique_id and external_id.startswith('T'):
                     technique_id = external_id
                     technique_url = str(ref.get('url') or '')
+                if not attack_technique_id and str(ref.get('source_name') or '') == 'mitre-attack':
+                    normalized_id = normalize_technique_id(external_id)
+                    if normalized_id.startswith('T'):
+                        attack_technique_id = normalized_id
+                if technique_id and attack_technique_id:
                     break
         if technique_id and not technique_url:
             technique_url = f'https://attack.mitre.org/techniques/{technique_id.replace(".", "/")}/'
 
         phase = ''
-        phases = attack_obj.get('kill_chain_phases', [])
+        phases = obj.get('kill_chain_phases', [])
         if isinstance(phases, list) and phases:
             first = phases[0]
             if isinstance(first, dict):
                 phase = str(first.get('phase_name') or '').replace('-', ' ')
 
-        results.append(
-            {
-                'technique_id': technique_id,
-                'name': name,
-                'phase': phase,
-                'technique_url': technique_url,
-                'use_count': use_count,
-            }
-        )
-        if len(results) >= limit:
-            break
-    return results
+        attack_patterns[str(obj.get('id') or '')] = {
+            'technique_id': technique_id,
+            'name': str(obj.get('name') or '').strip(),
+            'phase': phase,
+            'technique_url': technique_url,
+            'attack_technique_id': attack_technique_id,
+        }
 
+    uses_counts: dict[str, dict[str, int]] = {}
+    for source_ref, target_ref in uses_relationships:
+        if target_ref not in attack_patterns:
+            continue
+        targets = uses_counts.setdefault(source_ref, {})
+        targets[target_ref] = targets.get(target_ref, 0) + 1
 
-def known_technique_ids_for_entity(entity_stix_id: str) -> set[str]:
-    if not entity_stix_id:
-        return set()
+    ranked_techniques: dict[str, list[dict[str, object]]] = {}
+    known_technique_ids: dict[str, frozenset[str]] = {}
+    for source_ref, targets in uses_counts.items():
+        ranked: list[dict[str, object]] = []
+        for attack_pattern_id, use_count in sorted(targets.items(), key=lambda item: item[1], reverse=True):
+            attack_pattern = attack_patterns[attack_pattern_id]
+            if not attack_pattern['name']:
+                continue
+            ranked.append(
+                {
+                    'technique_id': attack_pattern['technique_id'],
+                    'name': attack_pattern['name'],
+                    'phase': attack_pattern['phase'],
+                    'technique_url': attack_pattern['technique_url'],
+                    'use_count': use_count,
+                }
+            )
+        ranked_techniques[source_ref] = ranked
+        known_technique_ids[source_ref] = frozenset(
+            str(attack_patterns[attack_pattern_id]['attack_technique_id'])
+            for attack_pattern_id in targets
+            if attack_patterns[attack_pattern_id]['attack_technique_id']
+        )
 
-    dataset = load_mitre_dataset()
-    objects = dataset.get('objects', []) if isinstance(dataset, dict) else []
-    if not isinstance(objects, list):
-        return set()
+    MITRE_RELATIONSHIP_INDEX_CACHE = {
+        'dataset': dataset,
+        'attack_patterns': attack_patterns,
+        'uses': uses_counts,
+        'ranked_techniques': ranked_techniques,
+        'known_technique_ids': known_technique_ids,
+    }
+    return MITRE_RELATIONSHIP_INDEX_CACHE
 
-    attack_pattern_to_tid: dict[str, str] = {}
-    for obj in objects:
-        if not isinstance(obj, dict):
-            continue
-        if obj.get('type') != 'attack-pattern':
-            continue
-        if bool(obj.get('revoked')) or bool(obj.get('x_mitre_deprecated')):
-            continue
-        attack_pattern_id = str(obj.get('id') or '')
-        if not attack_pattern_id:
-            continue
 
-        refs = obj.get('external_references', [])
-        if not isinstance(refs, list):
-            continue
-        for ref in refs:
-            if not isinstance(ref, dict):
-                continue
-            if str(ref.get('source_name') or '') != 'mitre-attack':
-                continue
-            external_id = normalize_technique_id(str(ref.get('external_id') or ''))
-            if external_id.startswith('T'):
-                attack_pattern_to_tid[attack_pattern_id] = external_id
-                break
+def group_top_techniques(group_stix_id: str, limit: int = 6) -> list[dict[str, str]]:
+    if not group_stix_id:
+        return []
+    ranked = mitre_relationship_index()['ranked_techniques'].get(group_stix_id, [])
+    return [dict(item) for item in ranked[:limit]]
 
-    known: set[str] = set()
-    for obj in objects:
-        if not isinstance(obj, dict):
-            continue
-        if obj.get('type') != 'relationship':
-            continue
-        if obj.get('relationship_type') != 'uses':
-            continue
-        if str(obj.get('source_ref') or '') != entity_stix_id:
-            continue
 
-        target_ref = str(obj.get('target_ref') or '')
-        tid = attack_pattern_to_tid.get(target_ref)
-        if tid:
-            known.add(tid)
-    return known
+def known_technique_ids_for_entity(entity_stix_id: str) -> set[str]:
+    if not entity_stix_id:
+        return set()
+    return set(mitre_relationship_index()['known_technique_ids'].get(entity_stix_id, frozenset()))
 
 
 def favorite_attack_vectors(techniques: list[dict[str, str]], limit: int = 3) -> list[str]:
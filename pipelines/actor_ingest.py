@@ -79,6 +79,10 @@ def upsert_source_for_actor(
                 'UPDATE question_updates SET source_id = ? WHERE source_id = ?',
                 (existing_id, duplicate_id),
             )
+            connection.execute(
+                'DELETE FROM source_sentences WHERE source_id = ?',
+                (duplicate_id,),
+            )
             connection.execute(
                 'DELETE FROM sources WHERE id = ?',
                 (duplicate_id,),
@@ -113,7 +117,10 @@ def upsert_source_for_actor(
                     publisher = COALESCE(?, publisher),
                     site_name = COALESCE(?, site_name),
                     source_type = COALESCE(?, source_type),
-                    source_tier = COALESCE(?, source_tier)
+                    source_tier = COALESCE(?, source_tier),
+                    iocs_extracted_at = NULL,
+                    timeline_extractor_version = NULL,
+                    sentences_indexed_at = NULL
                 WHERE id = ?
                 ''',
                 (
@@ -8,6 +8,7 @@ from typing import Callable
 from urllib.parse import urlparse
 
 from fastapi import HTTPException
+import services.db_connection_service as db_connection_service
 import services.source_evidence_service as source_evidence_service
 
 
@@ -503,7 +504,8 @@ def _promote_soft_sources_from_corroboration(
         UPDATE sources
         SET source_type = ?,
             source_tier = ?,
-            confidence_weight = ?
+            confidence_weight = ?,
+            timeline_extractor_version = NULL
         WHERE actor_id = ?
           AND id IN ({placeholders})
           AND COALESCE(source_type, '') = 'feed_soft_match'
@@ -945,7 +947,7 @@ def import_default_feeds_for_actor_core(
     effective_soft_match_cap = soft_match_cap
     if evidence_pipeline_v2 and retain_soft_candidates and (not interactive_mode) and effective_soft_match_cap <= 0:
         effective_soft_match_cap = max(12, int(max(10, int(feed_imported_limit)) * 2))
-    with sqlite3.connect(db_path) as connection:
+    with db_connection_service.connect_core(db_path) as connection:
         _ensure_actor_feed_state_schema(connection)
         if not _actor_exists(connection, actor_id):
             raise HTTPException(status_code=404, detail='actor not found')
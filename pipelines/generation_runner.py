@@ -1,6 +1,7 @@
-import sqlite3
 import time
 
+import services.db_connection_service as db_connection_service
+
 
 def run_actor_generation_core(
     actor_id: str,
@@ -18,6 +19,8 @@ def run_actor_generation_core(
     _interactive_high_signal_target = int(deps.get('interactive_high_signal_target', 2) or 2)
     _start_phase = deps.get('start_phase')
     _finish_phase = deps.get('finish_phase')
+    _open_build_context = deps.get('open_build_context')
+    _close_build_context = deps.get('close_build_context')
 
     def _phase_start(*, key: str, label: str, message: str, attempt: int = 1) -> str | None:
         if not callable(_start_phase):
@@ -45,6 +48,10 @@ def run_actor_generation_core(
         )
 
     started_at = time.perf_counter()
+    # Both build passes and the LLM refresh share one context; the LLM worker closes it when handed off.
+    build_context_handed_off = False
+    if callable(_open_build_context):
+        _open_build_context(actor_id)
     try:
         phase_started_at = time.perf_counter()
         source_phase_id = _phase_start(
@@ -111,7 +118,7 @@ def run_actor_generation_core(
             duration_ms=int((time.perf_counter() - phase_started_at) * 1000),
         )
         elapsed_ms = int((time.perf_counter() - started_at) * 1000)
-        with sqlite3.connect(db_path) as connection:
+        with db_connection_service.connect_core(db_path) as connection:
             connection.execute(
                 '''
                 UPDATE actor_profiles
@@ -132,6 +139,7 @@ def run_actor_generation_core(
                 'running',
                 f'Sources collected ({imported} update(s)). Building AI summary...',
             )
+            build_context_handed_off = True
             _enqueue_actor_llm_enrichment(actor_id, job_id=_job_id)
         else:
             _set_actor_notebook_status(
@@ -162,7 +170,7 @@ def run_actor_generation_core(
             duration_ms=int((time.perf_counter() - locals().get('phase_started_at', started_at)) * 1000),
         )
         try:
-            with sqlite3.connect(db_path) as connection:
+            with db_connection_service.connect_core(db_path) as connection:
                 connection.execute(
                     '''
                     UPDATE actor_profiles
@@ -184,3 +192,6 @@ def run_actor_generation_core(
             'message': f'Notebook generation failed: {exc}',
             'error': str(exc),
         }
+    finally:
+        if callable(_close_build_context) and not build_context_handed_off:
+            _close_build_context(actor_id)
@@ -0,0 +1,80 @@
+import time
+from collections.abc import Callable
+from threading import Lock
+
+BUILD_CONTEXT_TTL_SECONDS = 900
+
+
+class NotebookBuildContext:
+    """Actor data resolved once per generation job and shared by its build stages.
+
+    The timeline, question and notebook stages each look up the active context
+    for their actor; the MITRE profile and actor terms are resolved by the
+    first stage that needs them, and ingest catch-up passes run only once.
+    """
+
+    __slots__ = ('actor_id', 'db_path', 'opened_at', 'actor_name', 'mitre_profile', 'actor_terms', 'catch_up_done')
+
+    def __init__(self, actor_id: str, db_path: str) -> None:
+        self.actor_id = actor_id
+        self.db_path = db_path
+        self.opened_at = time.monotonic()
+        self.actor_name: str | None = None
+        self.mitre_profile: dict[str, object] | None = None
+        self.actor_terms: list[str] | None = None
+        self.catch_up_done = False
+
+
+_BUILD_CONTEXTS_LOCK = Lock()
+_BUILD_CONTEXTS: dict[tuple[str, str], NotebookBuildContext] = {}
+
+
+def open_build_context_core(actor_id: str, *, db_path: str) -> NotebookBuildContext:
+    context = NotebookBuildContext(actor_id, db_path)
+    with _BUILD_CONTEXTS_LOCK:
+        _BUILD_CONTEXTS[(db_path, actor_id)] = context
+    return context
+
+
+def active_build_context_core(actor_id: str, *, db_path: str) -> NotebookBuildContext | None:
+    with _BUILD_CONTEXTS_LOCK:
+        context = _BUILD_CONTEXTS.get((db_path, actor_id))
+        if context is None:
+            return None
+        if time.monotonic() - context.opened_at > BUILD_CONTEXT_TTL_SECONDS:
+            _BUILD_CONTEXTS.pop((db_path, actor_id), None)
+            return None
+        return context
+
+
+def close_build_context_core(actor_id: str, *, db_path: str) -> None:
+    with _BUILD_CONTEXTS_LOCK:
+        _BUILD_CONTEXTS.pop((db_path, actor_id), None)
+
+
+def actor_profile_and_terms_core(
+    context: NotebookBuildContext | None,
+    *,
+    actor_name: str,
+    build_actor_profile_from_mitre: Callable[[str], dict[str, object]],
+    actor_terms_fn: Callable[[str, str, str], list[str]],
+) -> tuple[dict[str, object], list[str]]:
+    """Return the MITRE profile and actor terms, reusing the context's copy for the same name."""
+    if (
+        context is not None
+        and context.actor_name == actor_name
+        and context.mitre_profile is not None
+        and context.actor_terms is not None
+    ):
+        return context.mitre_profile, list(context.actor_terms)
+    mitre_profile = build_actor_profile_from_mitre(actor_name)
+    actor_terms = actor_terms_fn(
+        actor_name,
+        str(mitre_profile.get('group_name') or ''),
+        str(mitre_profile.get('aliases_csv') or ''),
+    )
+    if context is not None:
+        context.actor_name = actor_name
+        context.mitre_profile = mitre_profile
+        context.actor_terms = list(actor_terms)
+    return mitre_profile, actor_terms
@@ -6,6 +6,30 @@ from collections.abc import Callable
 
 from fastapi import HTTPException
 
+import pipelines.notebook_build_context as notebook_build_context
+import services.db_connection_service as db_connection_service
+import services.extraction_pool_service as extraction_pool_service
+import services.source_ioc_service as source_ioc_service
+import services.source_sentence_service as source_sentence_service
+import services.text_utils_service as text_utils_service
+
+# Bump when extract_major_move_events() or the fallback event rules change so
+# every actor's timeline is rebuilt from scratch on its next build.
+TIMELINE_EXTRACTOR_VERSION = '1'
+SOURCE_ROW_COLUMNS = '''
+    id, source_name, url, published_at, retrieved_at, pasted_text,
+    title, headline, og_title, html_title, source_type, source_tier, confidence_weight
+'''
+
+
+def timeline_extractor_key(actor_terms: list[str]) -> str:
+    """Version stamp stored on each source once its timeline events are extracted.
+
+    Actor terms feed the extractor, so a change in aliases invalidates the
+    timeline the same way an extractor version bump does.
+    """
+    return f'{TIMELINE_EXTRACTOR_VERSION}:{source_sentence_service.actor_terms_digest_core(actor_terms)}'
+
 
 def build_notebook_core(
     actor_id: str,
@@ -17,11 +41,12 @@ def build_notebook_core(
     actor_exists: Callable[[sqlite3.Connection, str], bool],
     build_actor_profile_from_mitre: Callable[[str], dict[str, object]],
     actor_terms_fn: Callable[[str, str, str], list[str]],
-    extract_major_move_events: Callable[[str, str, str, str, list[str], str | None], list[dict[str, object]]],
+    extract_major_move_events: Callable[
+        [str, str, str, str, list[str], str | None, list[dict[str, object]] | None],
+        list[dict[str, object]],
+    ],
     normalize_text: Callable[[str], str],
-    token_overlap: Callable[[str, str], float],
-    extract_question_sentences: Callable[[str], list[str]],
-    sentence_mentions_actor_terms: Callable[[str, list[str]], bool],
+    token_set: Callable[[str], set[str]],
     sanitize_question_text: Callable[[str], str],
     question_from_sentence: Callable[[str], str],
     ollama_generate_questions: Callable[[str, str | None, list[str]], list[str]],
@@ -29,6 +54,7 @@ def build_notebook_core(
     guidance_for_platform: Callable[[str, str], dict[str, str]],
     ollama_enrich_quick_checks: Callable[[str, list[dict[str, object]]], dict[str, dict[str, str]]] | None = None,
     store_quick_check_overrides: Callable[[sqlite3.Connection, str, dict[str, dict[str, str]], str], None] | None = None,
+    extraction_workers: int = 0,
 ) -> None:
     def _fallback_category(text: str) -> str:
         lowered = str(text or '').lower()
@@ -51,9 +77,10 @@ def build_notebook_core(
         return first
 
     now = now_iso()
-    with sqlite3.connect(db_path) as connection:
+    with db_connection_service.connect_core(db_path) as connection:
         if not actor_exists(connection, actor_id):
             raise HTTPException(status_code=404, detail='actor not found')
+        build_context = notebook_build_context.active_build_context_core(actor_id, db_path=db_path)
 
         actor_row = connection.execute(
             'SELECT display_name, scope_statement FROM actor_profiles WHERE id = ?',
@@ -61,33 +88,106 @@ def build_notebook_core(
         ).fetchone()
         actor_name = actor_row[0] if actor_row else 'actor'
         actor_scope = actor_row[1] if actor_row else None
-        mitre_profile = build_actor_profile_from_mitre(actor_name)
-        actor_terms = actor_terms_fn(
-            actor_name,
-            str(mitre_profile.get('group_name') or ''),
-            str(mitre_profile.get('aliases_csv') or ''),
+        mitre_profile, actor_terms = notebook_build_context.actor_profile_and_terms_core(
+            build_context,
+            actor_name=actor_name,
+            build_actor_profile_from_mitre=build_actor_profile_from_mitre,
+            actor_terms_fn=actor_terms_fn,
         )
-
-        sources = connection.execute(
-            '''
-            SELECT
-                id, source_name, url, published_at, retrieved_at, pasted_text,
-                title, headline, og_title, html_title, source_type, source_tier, confidence_weight
-            FROM sources
-            WHERE actor_id = ?
-            ORDER BY retrieved_at ASC
-            ''',
-            (actor_id,),
-        ).fetchall()
+        if build_context is None or not build_context.catch_up_done:
+            # Catch up on sources stored outside the upsert path (bulk imports, migrations).
+            source_ioc_service.extract_pending_source_iocs_core(connection, actor_id=actor_id, now_iso=now)
+            source_sentence_service.index_source_sentences_core(
+                connection,
+                actor_id=actor_id,
+                limit=None,
+                now_iso=now,
+                workers=extraction_workers,
+            )
+            source_sentence_service.refresh_sentence_actor_mentions_core(
+                connection,
+                actor_id=actor_id,
+                actor_terms=actor_terms,
+            )
+            if build_context is not None:
+                build_context.catch_up_done = True
 
         if rebuild_timeline:
-            connection.execute('DELETE FROM timeline_events WHERE actor_id = ?', (actor_id,))
+            extractor_key = timeline_extractor_key(actor_terms)
+            full_rebuild = connection.execute(
+                '''
+                SELECT 1
+                FROM sources
+                WHERE actor_id = ?
+                  AND timeline_extractor_version IS NOT NULL
+                  AND timeline_extractor_version <> ?
+                LIMIT 1
+                ''',
+                (actor_id, extractor_key),
+            ).fetchone() is not None
+            # {SOURCE_ROW_COLUMNS} is a module constant — no user data — safe from SQL injection.
+            if full_rebuild:
+                connection.execute('DELETE FROM timeline_events WHERE actor_id = ?', (actor_id,))
+                pending_sources = connection.execute(
+                    f'''
+                    SELECT {SOURCE_ROW_COLUMNS}
+                    FROM sources
+                    WHERE actor_id = ?
+                    ORDER BY retrieved_at ASC
+                    ''',  # nosec B608
+                    (actor_id,),
+                ).fetchall()
+            else:
+                # Only new or refreshed sources are extracted; events of sources
+                # that were refreshed or removed are dropped before re-extraction.
+                pending_sources = connection.execute(
+                    f'''
+                    SELECT {SOURCE_ROW_COLUMNS}
+                    FROM sources
+                    WHERE actor_id = ? AND timeline_extractor_version IS NULL
+                    ORDER BY retrieved_at ASC
+                    ''',  # nosec B608
+                    (actor_id,),
+                ).fetchall()
+                connection.execute(
+                    '''
+                    DELETE FROM timeline_events
+                    WHERE actor_id = ?
+                      AND (
+                        source_id IS NULL
+                        OR source_id NOT IN (
+                            SELECT id FROM sources WHERE actor_id = ? AND timeline_extractor_version IS NOT NULL
+                        )
+                      )
+                    ''',
+                    (actor_id, actor_id),
+                )
             timeline_candidates: list[dict[str, object]] = []
-            for source in sources:
+            pending_sentences = source_sentence_service.load_source_sentences_core(
+                connection,
+                actor_id=actor_id,
+                source_ids=[str(source[0]) for source in pending_sources],
+            ) if pending_sources else {}
+            moves_by_source = extraction_pool_service.map_extraction_core(
+                extract_major_move_events,
+                [
+                    (
+                        source[1],
+                        source[0],
+                        source[3] or source[4],
+                        source[5] or '',
+                        actor_terms,
+                        str(source[6] or source[7] or source[8] or source[9] or '').strip() or None,
+                        pending_sentences.get(str(source[0]), []),
+                    )
+                    for source in pending_sources
+                ],
+                workers=extraction_workers,
+            )
+            for source, moves in zip(pending_sources, moves_by_source):
                 occurred_at = source[3] or source[4]
                 text = source[5] or ''
                 source_title = str(source[6] or source[7] or source[8] or source[9] or '').strip() or None
-                moves = extract_major_move_events(source[1], source[0], occurred_at, text, actor_terms, source_title)
                 if moves:
                     timeline_candidates.extend(moves[:6])
                 source_type = str(source[10] or '').strip().lower()
@@ -106,14 +206,40 @@ def build_notebook_core(
                         }
                     )
 
+            # Stored events and new candidates are deduped together, newest first,
+            # so a newer near-duplicate replaces the stored event exactly as it
+            # would on a full rebuild. Stored events go first to win ties.
             deduped_timeline: list[dict[str, object]] = []
-            seen_summaries: list[str] = []
-            for event in sorted(timeline_candidates, key=lambda item: str(item['occurred_at']), reverse=True):
-                norm = normalize_text(str(event['summary']))
-                if any(token_overlap(norm, existing) >= 0.75 for existing in seen_summaries):
+            superseded_event_ids: list[str] = []
+            stored_events = [
+                {'id': str(row[0]), 'occurred_at': row[1], 'summary': row[2], 'stored': True}
+                for row in connection.execute(
+                    'SELECT id, occurred_at, summary FROM timeline_events WHERE actor_id = ? ORDER BY occurred_at DESC',
+                    (actor_id,),
+                ).fetchall()
+            ]
+            seen_summaries = text_utils_service.near_duplicate_index_core(
+                expected_items=len(stored_events) + len(timeline_candidates),
+                token_set=token_set,
+            )
+            for event in sorted(
+                [*stored_events, *timeline_candidates],
+                key=lambda item: str(item['occurred_at']),
+                reverse=True,
+            ):
+                norm = normalize_text(str(event['summary'] or ''))
+                if seen_summaries.max_overlap(norm) >= 0.75:
+                    if event.get('stored'):
+                        superseded_event_ids.append(str(event['id']))
                     continue
-                deduped_timeline.append(event)
-                seen_summaries.append(norm)
+                if not event.get('stored'):
+                    deduped_timeline.append(event)
+                seen_summaries.add(norm)
+            if superseded_event_ids:
+                connection.executemany(
+                    'DELETE FROM timeline_events WHERE id = ?',
+                    [(event_id,) for event_id in superseded_event_ids],
+                )
 
             for event in deduped_timeline:
                 connection.execute(
@@ -135,6 +261,10 @@ def build_notebook_core(
                         json.dumps(event.get('ttp_ids') or []),
                     ),
                 )
+            connection.executemany(
+                'UPDATE sources SET timeline_extractor_version = ? WHERE id = ?',
+                [(extractor_key, source[0]) for source in pending_sources],
+            )
 
         if not generate_questions:
             connection.commit()
@@ -159,14 +289,21 @@ def build_notebook_core(
             }
             for row in thread_rows
         ]
+        thread_index = text_utils_service.TokenOverlapIndex(token_set=token_set)
+        for thread in thread_cache:
+            thread_index.add(str(thread['question_text'] or ''))
 
         source_sentence_records: list[dict[str, str]] = []
-        for source in sources:
-            source_id = source[0]
-            text = source[5] or ''
-            for sentence in extract_question_sentences(text):
-                if actor_terms and not sentence_mentions_actor_terms(sentence, actor_terms):
+        question_sentences = source_sentence_service.load_source_sentences_core(
+            connection,
+            actor_id=actor_id,
+            question_candidates_only=True,
+        )
+        for source_id, sentence_rows in question_sentences.items():
+            for sentence_row in sentence_rows:
+                if actor_terms and not sentence_row['mentions_actor']:
                     continue
+                sentence = str(sentence_row['sentence'])
                 source_sentence_records.append(
                     {
                         'source_id': source_id,
@@ -180,16 +317,15 @@ def build_notebook_core(
             actor_scope,
             [record['sentence'] for record in source_sentence_records],
         )
+        sentence_index = text_utils_service.TokenOverlapIndex(token_set=token_set)
+        for record in source_sentence_records:
+            sentence_index.add(record['sentence'])
         for candidate in llm_candidates:
-            best_sentence = None
-            best_source = None
-            best_score = 0.0
-            for record in source_sentence_records:
-                score = token_overlap(candidate, record['sentence'])
-                if score > best_score:
-                    best_score = score
-                    best_sentence = record['sentence']
-                    best_source = record['source_id']
+            best_position, best_score = sentence_index.best_match(candidate)
+            if best_position is None:
+                continue
+            best_sentence = source_sentence_records[best_position]['sentence']
+            best_source = source_sentence_records[best_position]['source_id']
             if best_sentence and best_source and best_score >= 0.20:
                 source_sentence_records.append(
                     {
@@ -199,35 +335,23 @@ def build_notebook_core(
                     }
                 )
 
+        # Matches are resolved in memory; writes go out as one batch per statement.
+        touched_thread_ids: set[str] = set()
+        new_thread_rows: list[tuple[str, str, str, str, str]] = []
+        update_rows: dict[tuple[str, str, str], tuple[str, str, str, str, None, str]] = {}
         for record in source_sentence_records:
             source_id = record['source_id']
             sentence = record['sentence']
             question_text = record['question_text']
-            best_thread: dict[str, str] | None = None
-            best_score = 0.0
-            for candidate in thread_cache:
-                score = token_overlap(question_text, candidate['question_text'])
-                if score > best_score:
-                    best_score = score
-                    best_thread = candidate
+            best_position, best_score = thread_index.best_match(question_text)
+            best_thread = thread_cache[best_position] if best_position is not None else None
 
             if best_thread is not None and best_score >= 0.45:
                 thread_id = best_thread['id']
-                connection.execute(
-                    'UPDATE question_threads SET updated_at = ? WHERE id = ?',
-                    (now, thread_id),
-                )
+                touched_thread_ids.add(thread_id)
             else:
                 thread_id = str(uuid.uuid4())
-                connection.execute(
-                    '''
-                    INSERT INTO question_threads (
-                        id, actor_id, question_text, status, created_at, updated_at
-                    )
-                    VALUES (?, ?, ?, 'open', ?, ?)
-                    ''',
-                    (thread_id, actor_id, question_text, now, now),
-                )
+                new_thread_rows.append((thread_id, actor_id, question_text, now, now))
                 thread_cache.append(
                     {
                         'id': thread_id,
@@ -237,25 +361,39 @@ def build_notebook_core(
                         'updated_at': now,
                     }
                 )
+                thread_index.add(question_text)
+
+            update_key = (thread_id, source_id, sentence)
+            if update_key not in update_rows:
+                update_rows[update_key] = (str(uuid.uuid4()), thread_id, source_id, sentence, None, now)
 
-            existing_update = connection.execute(
+        if new_thread_rows:
+            connection.executemany(
                 '''
-                SELECT id
-                FROM question_updates
-                WHERE thread_id = ? AND source_id = ? AND trigger_excerpt = ?
+                INSERT INTO question_threads (
+                    id, actor_id, question_text, status, created_at, updated_at
+                )
+                VALUES (?, ?, ?, 'open', ?, ?)
                 ''',
-                (thread_id, source_id, sentence),
-            ).fetchone()
-            if existing_update is None:
-                connection.execute(
-                    '''
-                    INSERT INTO question_updates (
-                        id, thread_id, source_id, trigger_excerpt, update_note, created_at
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    ''',
-                    (str(uuid.uuid4()), thread_id, source_id, sentence, None, now),
+                new_thread_rows,
+            )
+        new_thread_ids = {row[0] for row in new_thread_rows}
+        if touched_thread_ids - new_thread_ids:
+            connection.executemany(
+                'UPDATE question_threads SET updated_at = ? WHERE id = ?',
+                [(now, thread_id) for thread_id in sorted(touched_thread_ids - new_thread_ids)],
+            )
+        if update_rows:
+            # The unique (thread_id, source_id, trigger_excerpt) index skips updates already recorded.
+            connection.executemany(
+                '''
+                INSERT OR IGNORE INTO question_updates (
+                    id, thread_id, source_id, trigger_excerpt, update_note, created_at
                 )
+                VALUES (?, ?, ?, ?, ?, ?)
+                ''',
+                list(update_rows.values()),
+            )
 
         connection.execute('DELETE FROM environment_guidance WHERE actor_id = ?', (actor_id,))
         open_threads = connection.execute(
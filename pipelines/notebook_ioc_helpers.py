@@ -269,7 +269,8 @@ def _extract_ioc_candidates_from_text(
 def _derived_ioc_items_from_sources(
     source_items: list[dict[str, object]],
     *,
-    max_items: int = 40,
+    max_items: int | None = 40,
+    ignored_domains: set[str] | None = None,
 ) -> list[dict[str, str]]:
     if not source_items:
         return []
@@ -368,7 +369,7 @@ def _derived_ioc_items_from_sources(
         recency_rank = -int(source_order.get(id(source), 0))
         return (tier_rank, recency_rank)
 
-    ignored_domains: set[str] = set()
+    ignored_domains = set(ignored_domains or ())
     for source in source_items:
         source_url = str(source.get('url') or '').strip()
         match = re.match(r'^https?://([^/:?#]+)', source_url, flags=re.IGNORECASE)
@@ -415,7 +416,7 @@ def _derived_ioc_items_from_sources(
                     'observed_at': str(source.get('published_at') or source.get('retrieved_at') or ''),
                 }
             )
-            if len(derived) >= max_items:
+            if max_items is not None and len(derived) >= max_items:
                 return derived
     return derived
 
@@ -1,11 +1,15 @@
-import sqlite3
+import copy
+import logging
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
+from threading import Lock
 
 from fastapi import HTTPException
-import services.ioc_store_service as ioc_store_service
-import services.ioc_validation_service as ioc_validation_service
+import pipelines.notebook_build_context as notebook_build_context
+import services.db_connection_service as db_connection_service
 import services.quick_checks_view_service as quick_checks_view_service
-from pipelines.notebook_ioc_helpers import _derived_ioc_items_from_sources
+import services.text_utils_service as text_utils_service
 from pipelines.notebook_ioc_helpers import _extract_ioc_candidates_from_text
 from pipelines.notebook_ioc_helpers import _relevant_iocs_for_quick_check
 from pipelines.notebook_ioc_helpers import _ioc_seen_within_days
@@ -22,6 +26,40 @@ from pipelines.notebook_quickcheck_helpers import _quick_check_is_evidence_backe
 from pipelines.notebook_quickcheck_helpers import _quick_check_update_effective_dt
 from pipelines.notebook_quickcheck_helpers import _select_event_ids_for_where_to_start_core
 from pipelines.notebook_quickcheck_helpers import QUICK_CHECK_TEMPLATE_HINTS
+from pipelines.notebook_source_loader import hydrate_source_text_core
+from pipelines.notebook_source_loader import hydrate_source_text_for_db_core
+from pipelines.notebook_source_loader import load_source_metadata_core
+from pipelines.notebook_source_loader import sources_within_days_core
+
+LOGGER = logging.getLogger(__name__)
+
+SOURCE_TEXT_WINDOW_DAYS = 365
+NOTEBOOK_BASE_CACHE_MAX_ENTRIES = 16
+_NOTEBOOK_BASE_CACHE: OrderedDict[tuple[str, ...], tuple[float, dict[str, object]]] = OrderedDict()
+_NOTEBOOK_BASE_CACHE_LOCK = Lock()
+
+
+class _StageTimer:
+    """Records the elapsed time between consecutive pipeline stage marks."""
+
+    def __init__(self, *, actor_id: str, record_stage_timing) -> None:
+        self._actor_id = actor_id
+        self._record_stage_timing = record_stage_timing if callable(record_stage_timing) else None
+        self._started_at = time.perf_counter()
+
+    def mark(self, stage: str, *, rows: int | None = None) -> None:
+        now = time.perf_counter()
+        if self._record_stage_timing is not None:
+            try:
+                self._record_stage_timing(
+                    stage=f'notebook.{stage}',
+                    duration_ms=(now - self._started_at) * 1000.0,
+                    rows=rows,
+                    actor_id=self._actor_id,
+                )
+            except Exception as exc:
+                LOGGER.debug('recording notebook stage timing %s failed: %s', stage, exc)
+        self._started_at = now
 
 
 def fetch_actor_notebook_core(
@@ -32,6 +70,140 @@ def fetch_actor_notebook_core(
     min_confidence_weight: int | None = None,
     source_days: int | None = None,
     deps: dict[str, object],
+) -> dict[str, object]:
+    base_fingerprint = str(deps.get('base_cache_fingerprint') or '')
+    base_ttl_seconds = float(deps.get('base_cache_ttl_seconds') or 0)
+    if not base_fingerprint or base_ttl_seconds <= 0:
+        base = build_actor_notebook_base_core(actor_id, db_path=db_path, deps=deps)
+        return project_actor_notebook_core(
+            base,
+            source_tier=source_tier,
+            min_confidence_weight=min_confidence_weight,
+            source_days=source_days,
+            deps=deps,
+        )
+
+    base_key = (
+        str(db_path),
+        actor_id,
+        base_fingerprint,
+        '1' if bool(deps.get('enforce_ollama_synthesis', False)) else '0',
+        '1' if bool(deps.get('backfill_debug_ui_enabled', False)) else '0',
+    )
+    now = time.monotonic()
+    with _NOTEBOOK_BASE_CACHE_LOCK:
+        cached_entry = _NOTEBOOK_BASE_CACHE.get(base_key)
+        if cached_entry is not None and now - cached_entry[0] <= base_ttl_seconds:
+            _NOTEBOOK_BASE_CACHE.move_to_end(base_key)
+            base = cached_entry[1]
+        else:
+            base = None
+    if base is None:
+        base = build_actor_notebook_base_core(actor_id, db_path=db_path, deps=deps)
+        with _NOTEBOOK_BASE_CACHE_LOCK:
+            _NOTEBOOK_BASE_CACHE[base_key] = (now, base)
+            _NOTEBOOK_BASE_CACHE.move_to_end(base_key)
+            while len(_NOTEBOOK_BASE_CACHE) > NOTEBOOK_BASE_CACHE_MAX_ENTRIES:
+                _NOTEBOOK_BASE_CACHE.popitem(last=False)
+    # The base is shared between projections; callers mutate the payload in place.
+    return copy.deepcopy(
+        project_actor_notebook_core(
+            base,
+            source_tier=source_tier,
+            min_confidence_weight=min_confidence_weight,
+            source_days=source_days,
+            deps=deps,
+        )
+    )
+
+
+def clear_notebook_base_cache_core(actor_id: str | None = None) -> None:
+    with _NOTEBOOK_BASE_CACHE_LOCK:
+        if actor_id is None:
+            _NOTEBOOK_BASE_CACHE.clear()
+            return
+        for key in [key for key in _NOTEBOOK_BASE_CACHE if key[1] == actor_id]:
+            _NOTEBOOK_BASE_CACHE.pop(key, None)
+
+
+def enrich_notebook_llm_sections_core(
+    notebook: dict[str, object],
+    *,
+    db_path: str,
+    deps: dict[str, object],
+) -> dict[str, object]:
+    """Fill the LLM-backed sections of a cached notebook snapshot in place.
+
+    Only sections still marked degraded are recomputed, from the sources,
+    highlights and filters stored in the snapshot; the deterministic sections
+    are left as they are.
+    """
+    _parse_published_datetime = deps['parse_published_datetime']
+    _ollama_review_change_signals = deps.get('ollama_review_change_signals') or (lambda *_args, **_kwargs: [])
+    _ollama_synthesize_recent_activity = deps.get('ollama_synthesize_recent_activity') or (lambda *_args, **_kwargs: [])
+    _recent_change_max_days = int(deps.get('recent_change_max_days', 45))
+
+    actor = notebook.get('actor') if isinstance(notebook.get('actor'), dict) else {}
+    actor_name = str(actor.get('display_name') or '')
+    recent_activity_highlights = [
+        item for item in (notebook.get('recent_activity_highlights') or []) if isinstance(item, dict)
+    ]
+    stage_timer = _StageTimer(
+        actor_id=str(actor.get('id') or ''),
+        record_stage_timing=deps.get('record_stage_timing'),
+    )
+
+    if bool(notebook.get('llm_change_signals_degraded')):
+        filters = notebook.get('source_quality_filters') if isinstance(notebook.get('source_quality_filters'), dict) else {}
+        optional_ints: dict[str, int | None] = {}
+        for field in ('min_confidence_weight', 'source_days'):
+            try:
+                optional_ints[field] = int(str(filters.get(field) or '').strip())
+            except ValueError:
+                optional_ints[field] = None
+        source_days = optional_ints['source_days']
+        source_items_for_changes = _filter_sources_for_changes(
+            [item for item in (notebook.get('sources') or []) if isinstance(item, dict)],
+            source_tier=str(filters.get('source_tier') or '').strip().lower() or None,
+            min_confidence_weight=optional_ints['min_confidence_weight'],
+            source_cutoff_dt=(
+                datetime.now(timezone.utc) - timedelta(days=source_days)
+                if source_days is not None and source_days > 0
+                else None
+            ),
+            parse_published_datetime=_parse_published_datetime,
+        )
+        hydrate_source_text_for_db_core(db_path, source_items_for_changes)
+        llm_change_signals = _validate_llm_change_signals(
+            _ollama_review_change_signals(actor_name, source_items_for_changes, recent_activity_highlights),
+            source_items_for_changes,
+            recent_activity_highlights,
+            parse_published_datetime=_parse_published_datetime,
+            recent_change_max_days=_recent_change_max_days,
+        )
+        stage_timer.mark('llm_change_signals', rows=len(llm_change_signals))
+        top_change_signals = _top_llm_change_signals(llm_change_signals)
+        if top_change_signals:
+            notebook['top_change_signals'] = top_change_signals
+            notebook['llm_change_signals_degraded'] = False
+
+    if bool(notebook.get('llm_recent_synthesis_degraded')):
+        recent_activity_synthesis = _ollama_synthesize_recent_activity(actor_name, recent_activity_highlights)
+        stage_timer.mark(
+            'llm_recent_synthesis',
+            rows=len(recent_activity_synthesis) if isinstance(recent_activity_synthesis, list) else 0,
+        )
+        if isinstance(recent_activity_synthesis, list) and recent_activity_synthesis:
+            notebook['recent_activity_synthesis'] = recent_activity_synthesis
+            notebook['llm_recent_synthesis_degraded'] = False
+    return notebook
+
+
+def build_actor_notebook_base_core(
+    actor_id: str,
+    *,
+    db_path: str,
+    deps: dict[str, object],
 ) -> dict[str, object]:
     _parse_published_datetime = deps['parse_published_datetime']
     _safe_json_string_list = deps['safe_json_string_list']
@@ -55,25 +227,17 @@ def fetch_actor_notebook_core(
     _org_alignment_label = deps['org_alignment_label']
     _fallback_priority_questions = deps['fallback_priority_questions']
     _token_overlap = deps['token_overlap']
+    _token_set = deps.get('token_set') or (
+        lambda value: text_utils_service.token_set_core(value, normalize_text=text_utils_service.normalize_text_core)
+    )
     _build_actor_profile_from_mitre = deps['build_actor_profile_from_mitre']
     _group_top_techniques = deps['group_top_techniques']
     _favorite_attack_vectors = deps['favorite_attack_vectors']
     _known_technique_ids_for_entity = deps['known_technique_ids_for_entity']
-    _emerging_techniques_from_timeline = deps['emerging_techniques_from_timeline']
     _build_timeline_graph = deps['build_timeline_graph']
     _compact_timeline_rows = deps['compact_timeline_rows']
     _actor_terms = deps['actor_terms']
-    _build_recent_activity_highlights = deps['build_recent_activity_highlights']
-    _build_top_change_signals = deps.get('build_top_change_signals', build_top_change_signals)
-    _ollama_review_change_signals = deps.get('ollama_review_change_signals', lambda *_args, **_kwargs: [])
-    _ollama_synthesize_recent_activity = deps.get('ollama_synthesize_recent_activity', lambda *_args, **_kwargs: [])
-    _enforce_ollama_synthesis = bool(deps.get('enforce_ollama_synthesis', False))
-    _build_recent_activity_synthesis = deps['build_recent_activity_synthesis']
-    _recent_change_summary = deps['recent_change_summary']
-    _build_environment_checks = deps['build_environment_checks']
     _build_notebook_kpis = deps['build_notebook_kpis']
-    _format_date_or_unknown = deps['format_date_or_unknown']
-    _recent_change_max_days = int(deps.get('recent_change_max_days', 45))
     _load_quick_check_overrides = deps.get('load_quick_check_overrides')
     _load_source_reliability_map = deps.get(
         'load_source_reliability_map',
@@ -84,13 +248,15 @@ def fetch_actor_notebook_core(
     _run_cold_actor_backfill = deps.get('run_cold_actor_backfill')
     _rebuild_notebook = deps.get('rebuild_notebook')
     _backfill_debug_ui_enabled = bool(deps.get('backfill_debug_ui_enabled', False))
+    _source_text_window_days = int(deps.get('source_text_window_days', SOURCE_TEXT_WINDOW_DAYS))
 
     quick_check_overrides: dict[str, dict[str, str]] = {}
     question_feedback: dict[str, dict[str, int]] = {}
     source_reliability_map: dict[str, dict[str, object]] = {}
     backfill_notice = ''
     backfill_debug = ''
-    with sqlite3.connect(db_path) as precheck_connection:
+    stage_timer = _StageTimer(actor_id=actor_id, record_stage_timing=deps.get('record_stage_timing'))
+    with db_connection_service.connect_core(db_path) as precheck_connection:
         actor_row_pre = precheck_connection.execute(
             'SELECT display_name FROM actor_profiles WHERE id = ?',
             (actor_id,),
@@ -158,7 +324,9 @@ def fetch_actor_notebook_core(
             except Exception:
                 pass
 
-    with sqlite3.connect(db_path) as connection:
+    stage_timer.mark('precheck_backfill')
+
+    with db_connection_service.connect_core(db_path) as connection:
         actor_row = connection.execute(
             '''
             SELECT
@@ -174,59 +342,15 @@ def fetch_actor_notebook_core(
         if actor_row is None:
             raise HTTPException(status_code=404, detail='actor not found')
 
-        sources = connection.execute(
-            '''
-            SELECT
-                id, source_name, url, published_at, ingested_at, source_date_type, retrieved_at, pasted_text,
-                title, headline, og_title, html_title, publisher, site_name,
-                source_type, source_tier, confidence_weight
-            FROM sources
-            WHERE actor_id = ?
-            ORDER BY COALESCE(published_at, ingested_at, retrieved_at) DESC
-            ''',
-            (actor_id,),
-        ).fetchall()
-        source_items_for_ioc = [
-            {
-                'id': row[0],
-                'source_name': row[1],
-                'url': row[2],
-                'published_at': row[3],
-                'ingested_at': row[4],
-                'source_date_type': row[5],
-                'retrieved_at': row[6],
-                'pasted_text': row[7],
-                'title': row[8],
-                'headline': row[9],
-                'og_title': row[10],
-                'html_title': row[11],
-                'publisher': row[12],
-                'site_name': row[13],
-                'source_type': row[14],
-                'source_tier': row[15],
-                'confidence_weight': row[16],
-            }
-            for row in sources
-        ]
-        derived_ioc_candidates = _derived_ioc_items_from_sources(source_items_for_ioc, max_items=80)
-        if derived_ioc_candidates:
-            now_iso = datetime.now(timezone.utc).isoformat()
-            for candidate in derived_ioc_candidates:
-                ioc_store_service.upsert_ioc_item_core(
-                    connection,
-                    actor_id=actor_id,
-                    raw_ioc_type=str(candidate.get('ioc_type') or 'indicator'),
-                    raw_ioc_value=str(candidate.get('ioc_value') or ''),
-                    source_ref=str(candidate.get('source_ref') or '') or None,
-                    source_id=str(candidate.get('source_id') or '') or None,
-                    source_tier=str(candidate.get('source_tier') or '') or None,
-                    extraction_method='auto_source_regex',
-                    now_iso=now_iso,
-                    observed_at=str(candidate.get('observed_at') or '') or None,
-                    deps={
-                        'validate_ioc_candidate': ioc_validation_service.validate_ioc_candidate_core,
-                    },
-                )
+        # Only metadata is loaded for the whole corpus; body text is read for the
+        # recent window here and for older sources only when a section needs it.
+        source_items = load_source_metadata_core(connection, actor_id)
+        text_window_sources = sources_within_days_core(
+            source_items,
+            days=_source_text_window_days,
+            parse_published_datetime=_parse_published_datetime,
+        )
+        hydrate_source_text_core(connection, text_window_sources)
 
         timeline_rows = connection.execute(
             '''
@@ -248,44 +372,51 @@ def fetch_actor_notebook_core(
             (actor_id,),
         ).fetchall()
 
-        updates_by_thread: dict[str, list[dict[str, object]]] = {}
-        for thread_row in thread_rows:
-            thread_id = thread_row[0]
-            update_rows = connection.execute(
-                '''
-                SELECT
-                    qu.id,
-                    qu.trigger_excerpt,
-                    qu.update_note,
-                    qu.created_at,
-                    s.source_name,
-                    s.url,
-                    s.published_at,
-                    s.ingested_at,
-                    s.source_date_type,
-                    s.retrieved_at
-                FROM question_updates qu
-                JOIN sources s ON s.id = qu.source_id
-                WHERE qu.thread_id = ?
-                ORDER BY COALESCE(s.published_at, s.ingested_at, s.retrieved_at, qu.created_at) DESC, qu.created_at DESC
-                ''',
-                (thread_id,),
-            ).fetchall()
-            updates_by_thread[thread_id] = [
+        # One set-based load for every thread's updates instead of a query per thread.
+        updates_by_thread: dict[str, list[dict[str, object]]] = {str(row[0]): [] for row in thread_rows}
+        update_rows = connection.execute(
+            '''
+            SELECT
+                qu.thread_id,
+                qu.id,
+                qu.trigger_excerpt,
+                qu.update_note,
+                qu.created_at,
+                s.source_name,
+                s.url,
+                s.published_at,
+                s.ingested_at,
+                s.source_date_type,
+                s.retrieved_at
+            FROM question_updates qu
+            JOIN question_threads qt ON qt.id = qu.thread_id
+            JOIN sources s ON s.id = qu.source_id
+            WHERE qt.actor_id = ?
+            ORDER BY
+                qu.thread_id,
+                COALESCE(s.published_at, s.ingested_at, s.retrieved_at, qu.created_at) DESC,
+                qu.created_at DESC
+            ''',
+            (actor_id,),
+        ).fetchall()
+        for update_row in update_rows:
+            thread_updates = updates_by_thread.get(str(update_row[0]))
+            if thread_updates is None:
+                continue
+            thread_updates.append(
                 {
-                    'id': update_row[0],
-                    'trigger_excerpt': update_row[1],
-                    'update_note': update_row[2],
-                    'created_at': update_row[3],
-                    'source_name': update_row[4],
-                    'source_url': update_row[5],
-                    'source_published_at': update_row[6],
-                    'source_ingested_at': update_row[7],
-                    'source_date_type': update_row[8],
-                    'source_retrieved_at': update_row[9],
+                    'id': update_row[1],
+                    'trigger_excerpt': update_row[2],
+                    'update_note': update_row[3],
+                    'created_at': update_row[4],
+                    'source_name': update_row[5],
+                    'source_url': update_row[6],
+                    'source_published_at': update_row[7],
+                    'source_ingested_at': update_row[8],
+                    'source_date_type': update_row[9],
+                    'source_retrieved_at': update_row[10],
                 }
-                for update_row in update_rows
-            ]
+            )
 
         guidance_rows = connection.execute(
             '''
@@ -507,6 +638,7 @@ def fetch_actor_notebook_core(
         except Exception:
             source_reliability_map = {}
 
+    stage_timer.mark('load_rows', rows=len(source_items) + len(timeline_rows) + len(thread_rows))
     actor = {
         'id': actor_row[0],
         'display_name': actor_row[1],
@@ -522,7 +654,7 @@ def fetch_actor_notebook_core(
         'last_confirmed_by': actor_row[11],
         'last_confirmed_note': actor_row[12],
     }
-    with sqlite3.connect(db_path) as connection:
+    with db_connection_service.connect_core(db_path) as connection:
         tracking_intent_row = connection.execute(
             '''
             SELECT
@@ -716,6 +848,7 @@ def fetch_actor_notebook_core(
             'updated_by': str(report_pref_row[3] or ''),
             'updated_at': str(report_pref_row[4] or ''),
         }
+    stage_timer.mark('load_context')
     timeline_items: list[dict[str, object]] = [
         {
             'id': row[0],
@@ -761,26 +894,29 @@ def fetch_actor_notebook_core(
         }
         for thread_id in open_thread_ids
     ]
+    stage_timer.mark('timeline_threads', rows=len(timeline_items) + len(thread_items))
     priority_questions: list[dict[str, object]] = []
     open_threads = [thread for thread in thread_items if thread['status'] == 'open']
     actor_categories = _actor_signal_categories(timeline_recent_items)
     signal_text = ' '.join([str(item.get('summary') or '') for item in timeline_recent_items]).lower()
     org_context_text = str(context_row[0]) if context_row and context_row[0] else ''
     source_relevance_cutoff_30 = datetime.now(timezone.utc) - timedelta(days=30)
-    recent_source_blobs_30: list[str] = []
-    for source_row in sources:
-        effective_dt = _parse_published_datetime(str(source_row[3] or source_row[4] or source_row[6] or ''))
+    recent_source_index_30 = text_utils_service.TokenOverlapIndex(token_set=_token_set)
+    for source in source_items:
+        effective_dt = _parse_published_datetime(
+            str(source.get('published_at') or source.get('ingested_at') or source.get('retrieved_at') or '')
+        )
         if effective_dt is None or effective_dt < source_relevance_cutoff_30:
             continue
-        recent_source_blobs_30.append(
+        recent_source_index_30.add(
             ' '.join(
                 [
-                    str(source_row[1] or ''),
-                    str(source_row[8] or ''),
-                    str(source_row[9] or ''),
-                    str(source_row[10] or ''),
-                    str(source_row[11] or ''),
-                    str(source_row[7] or ''),
+                    str(source.get('source_name') or ''),
+                    str(source.get('title') or ''),
+                    str(source.get('headline') or ''),
+                    str(source.get('og_title') or ''),
+                    str(source.get('html_title') or ''),
+                    str(source.get('pasted_text') or ''),
                 ]
             )
         )
@@ -788,11 +924,8 @@ def fetch_actor_notebook_core(
     for thread in open_threads:
         question_text = str(thread.get('question_text') or '')
         relevance = _question_actor_relevance(question_text, actor_categories, signal_text)
-        if relevance <= 0 and recent_source_blobs_30:
-            max_overlap = 0.0
-            for source_blob in recent_source_blobs_30:
-                max_overlap = max(max_overlap, float(_token_overlap(question_text, source_blob)))
-            if max_overlap >= 0.08:
+        if relevance <= 0 and len(recent_source_index_30):
+            if recent_source_index_30.max_overlap(question_text) >= 0.08:
                 relevance = 1
         if relevance <= 0:
             continue
@@ -963,28 +1096,6 @@ def fetch_actor_notebook_core(
                 card['expected_output'] = expected_output
     priority_phase_groups: list[dict[str, object]] = []
 
-    source_items = [
-        {
-            'id': row[0],
-            'source_name': row[1],
-            'url': row[2],
-            'published_at': row[3],
-            'ingested_at': row[4],
-            'source_date_type': row[5],
-            'retrieved_at': row[6],
-            'pasted_text': row[7],
-            'title': row[8],
-            'headline': row[9],
-            'og_title': row[10],
-            'html_title': row[11],
-            'publisher': row[12],
-            'site_name': row[13],
-            'source_type': row[14],
-            'source_tier': row[15],
-            'confidence_weight': row[16],
-        }
-        for row in sources
-    ]
     for source in source_items:
         source_url = str(source.get('url') or '').strip()
         domain = _domain_from_url(source_url)
@@ -1000,25 +1111,7 @@ def fetch_actor_notebook_core(
         source['source_reliability_votes'] = int(reliability.get('helpful_count') or 0) + int(
             reliability.get('unhelpful_count') or 0
         )
-    allowed_tiers = {'high', 'medium', 'trusted', 'context', 'unrated'}
-    normalized_source_tier = str(source_tier or '').strip().lower() or None
-    if normalized_source_tier not in allowed_tiers:
-        normalized_source_tier = None
-
-    normalized_min_confidence: int | None = None
-    if min_confidence_weight is not None:
-        try:
-            normalized_min_confidence = max(0, min(4, int(min_confidence_weight)))
-        except Exception:
-            normalized_min_confidence = None
-
-    normalized_source_days: int | None = None
-    if source_days is not None:
-        try:
-            parsed_days = int(source_days)
-            normalized_source_days = parsed_days if parsed_days > 0 else None
-        except Exception:
-            normalized_source_days = None
+    stage_timer.mark('priority_scoring', rows=len(priority_questions))
 
     ioc_recency_days = 30
     ioc_items = [
@@ -1116,6 +1209,28 @@ def fetch_actor_notebook_core(
         reverse=True,
     )
 
+    # Body text for quick-check evidence is hydrated in one batch for every card
+    # rather than per matched update.
+    source_by_url: dict[str, dict[str, object]] = {}
+    for source in source_items:
+        if isinstance(source, dict):
+            source_by_url.setdefault(str(source.get('url') or '').strip(), source)
+    evidence_sources = [pool_item['source'] for pool_item in recent_source_pool]
+    for card in priority_questions:
+        thread = thread_by_id.get(str(card.get('id') or '').strip(), {})
+        updates_raw = thread.get('updates') if isinstance(thread, dict) else []
+        for update in updates_raw if isinstance(updates_raw, list) else []:
+            if not isinstance(update, dict):
+                continue
+            evidence_dt = _quick_check_update_effective_dt(
+                update,
+                parse_published_datetime=_parse_published_datetime,
+            )
+            source_match = source_by_url.get(str(update.get('source_url') or '').strip())
+            if source_match is not None and evidence_dt is not None and evidence_dt >= cutoff_30:
+                evidence_sources.append(source_match)
+    hydrate_source_text_for_db_core(db_path, evidence_sources)
+
     for card in priority_questions:
         related = _relevant_iocs_for_quick_check(card, quick_check_ioc_pool, limit=4)
         card['related_iocs'] = related
@@ -1219,13 +1334,7 @@ def fetch_actor_notebook_core(
             trigger_excerpt = str(update.get('trigger_excerpt') or '').strip()
             if trigger_excerpt:
                 evidence_text_parts.append(trigger_excerpt)
-            source_match = None
-            for source_item in source_items:
-                if not isinstance(source_item, dict):
-                    continue
-                if str(source_item.get('url') or '').strip() == source_url:
-                    source_match = source_item
-                    break
+            source_match = source_by_url.get(source_url)
             if source_match is not None:
                 source_text = str(source_match.get('pasted_text') or '').strip()
                 if source_text:
@@ -1524,75 +1633,14 @@ def fetch_actor_notebook_core(
         phase_groups_map[phase].append(card)
     priority_phase_groups = [{'phase': phase, 'cards': phase_groups_map[phase]} for phase in phase_group_order]
 
-    strict_default_mode = (
-        normalized_source_tier is None
-        and normalized_min_confidence is None
-        and normalized_source_days is None
-    )
-    if strict_default_mode:
-        # Rich-by-default analyst view: retain broader source context by default.
-        normalized_min_confidence = 1
-        normalized_source_days = 365
+    stage_timer.mark('quick_checks', rows=len(priority_questions))
 
-    source_cutoff_dt = (
-        datetime.now(timezone.utc) - timedelta(days=normalized_source_days)
-        if normalized_source_days is not None
-        else None
+    mitre_profile, actor_terms = notebook_build_context.actor_profile_and_terms_core(
+        notebook_build_context.active_build_context_core(actor_id, db_path=db_path),
+        actor_name=str(actor['display_name']),
+        build_actor_profile_from_mitre=_build_actor_profile_from_mitre,
+        actor_terms_fn=_actor_terms,
     )
-
-    source_items_for_changes = source_items
-    if (
-        normalized_source_tier is not None
-        or normalized_min_confidence is not None
-        or source_cutoff_dt is not None
-    ):
-        filtered_sources: list[dict[str, object]] = []
-        for source in source_items:
-            source_tier_value = str(source.get('source_tier') or '').strip().lower() or 'unrated'
-            if normalized_source_tier is not None and source_tier_value != normalized_source_tier:
-                continue
-            try:
-                source_weight = int(source.get('confidence_weight') or 0)
-            except Exception:
-                source_weight = 0
-            if normalized_min_confidence is not None and source_weight < normalized_min_confidence:
-                continue
-            raw_date = str(source.get('published_at') or source.get('ingested_at') or source.get('retrieved_at') or '')
-            source_dt = _parse_published_datetime(raw_date)
-            if source_cutoff_dt is not None and source_dt is not None:
-                if source_dt < source_cutoff_dt:
-                    continue
-            filtered_sources.append(source)
-        source_items_for_changes = filtered_sources
-
-    allowed_source_ids_for_changes = {
-        str(source.get('id') or '').strip()
-        for source in source_items_for_changes
-        if str(source.get('id') or '').strip()
-    }
-    timeline_items_for_changes = (
-        [
-            item
-            for item in timeline_items
-            if str(item.get('source_id') or '').strip() in allowed_source_ids_for_changes
-        ]
-        if (
-            normalized_source_tier is not None
-            or normalized_min_confidence is not None
-            or source_cutoff_dt is not None
-        )
-        else timeline_items
-    )
-    timeline_recent_items_for_changes = [
-        item
-        for item in timeline_items_for_changes
-        if (
-            (dt := _parse_published_datetime(str(item.get('occurred_at') or ''))) is not None
-            and dt >= cutoff_90
-        )
-    ]
-    mitre_profile = _build_actor_profile_from_mitre(str(actor['display_name']))
-    actor_profile_summary = str(mitre_profile['summary'])
     top_techniques = _group_top_techniques(str(mitre_profile.get('stix_id') or ''))
     favorite_vectors = _favorite_attack_vectors(top_techniques)
     known_technique_ids = _known_technique_ids_for_entity(str(mitre_profile.get('stix_id') or ''))
@@ -1602,35 +1650,96 @@ def fetch_actor_notebook_core(
             for item in top_techniques
             if item.get('technique_id')
         }
-    emerging_techniques = _emerging_techniques_from_timeline(
-        timeline_recent_items_for_changes,
-        known_technique_ids,
-    )
-    emerging_technique_ids = [str(item.get('technique_id') or '') for item in emerging_techniques]
-    emerging_techniques_with_dates = [
-        {
-            'technique_id': str(item.get('technique_id') or ''),
-            'first_seen': str(item.get('first_seen') or ''),
-        }
-        for item in emerging_techniques
-    ]
     timeline_graph = _build_timeline_graph(timeline_recent_items)
     timeline_compact_rows = _compact_timeline_rows(timeline_items, known_technique_ids)
-    actor_terms = _actor_terms(
-        str(actor['display_name']),
-        str(mitre_profile.get('group_name') or ''),
-        str(mitre_profile.get('aliases_csv') or ''),
-    )
-    recent_activity_highlights = _build_recent_activity_highlights(
-        timeline_items_for_changes,
-        source_items_for_changes,
-        actor_terms,
-    )
-    llm_change_signals_raw = _ollama_review_change_signals(
-        str(actor.get('display_name') or ''),
-        source_items_for_changes,
-        recent_activity_highlights,
+    notebook_kpis = _build_notebook_kpis(
+        timeline_items,
+        known_technique_ids,
+        len(open_thread_ids),
+        source_items,
     )
+
+    stage_timer.mark('mitre_profile_kpis', rows=len(top_techniques))
+
+    return {
+        'actor': actor,
+        'alert_queue': alert_queue,
+        'backfill_debug': backfill_debug,
+        'backfill_notice': backfill_notice,
+        'change_conflicts': change_conflicts,
+        'change_items': change_items,
+        'collection_plan': collection_plan,
+        'context_row': context_row,
+        'cutoff_90': cutoff_90,
+        'guidance_for_open': guidance_for_open,
+        'ioc_items': ioc_items,
+        'open_thread_ids': open_thread_ids,
+        'operational_outcomes': operational_outcomes,
+        'ops_tasks': ops_tasks,
+        'priority_phase_groups': priority_phase_groups,
+        'priority_questions': priority_questions,
+        'relationship_items': relationship_items,
+        'report_preferences': report_preferences,
+        'requirement_rows': requirement_rows,
+        'source_items': source_items,
+        'technique_coverage': technique_coverage,
+        'thread_items': thread_items,
+        'timeline_items': timeline_items,
+        'timeline_recent_items': timeline_recent_items,
+        'tracking_intent': tracking_intent,
+        'mitre_profile': mitre_profile,
+        'top_techniques': top_techniques,
+        'favorite_vectors': favorite_vectors,
+        'known_technique_ids': known_technique_ids,
+        'timeline_graph': timeline_graph,
+        'timeline_compact_rows': timeline_compact_rows,
+        'actor_terms': actor_terms,
+        'notebook_kpis': notebook_kpis,
+        'source_count': len(source_items),
+        'db_path': db_path,
+        'timeline_event_count': len(timeline_rows),
+        'llm_memo': {},
+    }
+
+
+def _filter_sources_for_changes(
+    source_items: list[dict[str, object]],
+    *,
+    source_tier: str | None,
+    min_confidence_weight: int | None,
+    source_cutoff_dt: datetime | None,
+    parse_published_datetime,
+) -> list[dict[str, object]]:
+    if source_tier is None and min_confidence_weight is None and source_cutoff_dt is None:
+        return source_items
+    filtered_sources: list[dict[str, object]] = []
+    for source in source_items:
+        source_tier_value = str(source.get('source_tier') or '').strip().lower() or 'unrated'
+        if source_tier is not None and source_tier_value != source_tier:
+            continue
+        try:
+            source_weight = int(source.get('confidence_weight') or 0)
+        except Exception:
+            source_weight = 0
+        if min_confidence_weight is not None and source_weight < min_confidence_weight:
+            continue
+        raw_date = str(source.get('published_at') or source.get('ingested_at') or source.get('retrieved_at') or '')
+        source_dt = parse_published_datetime(raw_date)
+        if source_cutoff_dt is not None and source_dt is not None:
+            if source_dt < source_cutoff_dt:
+                continue
+        filtered_sources.append(source)
+    return filtered_sources
+
+
+def _validate_llm_change_signals(
+    llm_change_signals_raw: object,
+    source_items_for_changes: list[dict[str, object]],
+    recent_activity_highlights: list[dict[str, object]],
+    *,
+    parse_published_datetime,
+    recent_change_max_days: int,
+) -> list[dict[str, object]]:
     llm_change_signals = (
         [item for item in llm_change_signals_raw if isinstance(item, dict)]
         if isinstance(llm_change_signals_raw, list)
@@ -1649,7 +1758,7 @@ def fetch_actor_notebook_core(
         if str(item.get('source_url') or '').strip()
     }
     now_utc = datetime.now(timezone.utc)
-    min_recent_dt = now_utc - timedelta(days=max(1, _recent_change_max_days))
+    min_recent_dt = now_utc - timedelta(days=max(1, recent_change_max_days))
     for item in llm_change_signals:
         evidence_values = item.get('validated_sources')
         if not isinstance(evidence_values, list):
@@ -1666,9 +1775,9 @@ def fetch_actor_notebook_core(
                 continue
             original = highlight_by_url.get(source_url)
             evidence_date_raw = str(evidence.get('source_date') or (original.get('date') if original else '') or '').strip()
-            evidence_dt = _parse_published_datetime(evidence_date_raw)
+            evidence_dt = parse_published_datetime(evidence_date_raw)
             if evidence_dt is None and original is not None:
-                evidence_dt = _parse_published_datetime(str(original.get('date') or ''))
+                evidence_dt = parse_published_datetime(str(original.get('date') or ''))
             if evidence_dt is None or evidence_dt < min_recent_dt:
                 continue
             if original is not None:
@@ -1677,14 +1786,197 @@ def fetch_actor_notebook_core(
                 evidence.setdefault('source_date', str(evidence.get('source_date') or original.get('date') or ''))
             validated_recent.append(evidence)
         item['validated_sources'] = validated_recent
+    return llm_change_signals
+
 
-    top_change_signals = [
+def _top_llm_change_signals(llm_change_signals: list[dict[str, object]]) -> list[dict[str, object]]:
+    return [
         item
         for item in llm_change_signals[:8]
         if str(item.get('change_summary') or '').strip()
         and isinstance(item.get('validated_sources'), list)
         and len(item.get('validated_sources') or []) > 0
     ]
+
+
+def project_actor_notebook_core(
+    base: dict[str, object],
+    *,
+    source_tier: str | None = None,
+    min_confidence_weight: int | None = None,
+    source_days: int | None = None,
+    deps: dict[str, object],
+) -> dict[str, object]:
+    _parse_published_datetime = deps['parse_published_datetime']
+    _emerging_techniques_from_timeline = deps['emerging_techniques_from_timeline']
+    _build_recent_activity_highlights = deps['build_recent_activity_highlights']
+    _build_top_change_signals = deps.get('build_top_change_signals', build_top_change_signals)
+    _ollama_review_change_signals = deps.get('ollama_review_change_signals', lambda *_args, **_kwargs: [])
+    _ollama_synthesize_recent_activity = deps.get('ollama_synthesize_recent_activity', lambda *_args, **_kwargs: [])
+    _build_recent_activity_synthesis = deps['build_recent_activity_synthesis']
+    _recent_change_summary = deps['recent_change_summary']
+    _build_environment_checks = deps['build_environment_checks']
+    _format_date_or_unknown = deps['format_date_or_unknown']
+    _recent_change_max_days = int(deps.get('recent_change_max_days', 45))
+
+    actor = base['actor']
+    alert_queue = base['alert_queue']
+    backfill_debug = base['backfill_debug']
+    backfill_notice = base['backfill_notice']
+    change_conflicts = base['change_conflicts']
+    change_items = base['change_items']
+    collection_plan = base['collection_plan']
+    context_row = base['context_row']
+    cutoff_90 = base['cutoff_90']
+    guidance_for_open = base['guidance_for_open']
+    ioc_items = base['ioc_items']
+    open_thread_ids = base['open_thread_ids']
+    operational_outcomes = base['operational_outcomes']
+    ops_tasks = base['ops_tasks']
+    priority_phase_groups = base['priority_phase_groups']
+    priority_questions = base['priority_questions']
+    relationship_items = base['relationship_items']
+    report_preferences = base['report_preferences']
+    requirement_rows = base['requirement_rows']
+    source_items = base['source_items']
+    technique_coverage = base['technique_coverage']
+    thread_items = base['thread_items']
+    timeline_items = base['timeline_items']
+    timeline_recent_items = base['timeline_recent_items']
+    tracking_intent = base['tracking_intent']
+    mitre_profile = base['mitre_profile']
+    top_techniques = base['top_techniques']
+    favorite_vectors = base['favorite_vectors']
+    known_technique_ids = base['known_technique_ids']
+    timeline_graph = base['timeline_graph']
+    timeline_compact_rows = base['timeline_compact_rows']
+    actor_terms = base['actor_terms']
+    notebook_kpis = base['notebook_kpis']
+    llm_memo = base['llm_memo']
+    stage_timer = _StageTimer(
+        actor_id=str(actor.get('id') or ''),
+        record_stage_timing=deps.get('record_stage_timing'),
+    )
+    actor_profile_summary = str(mitre_profile['summary'])
+
+    allowed_tiers = {'high', 'medium', 'trusted', 'context', 'unrated'}
+    normalized_source_tier = str(source_tier or '').strip().lower() or None
+    if normalized_source_tier not in allowed_tiers:
+        normalized_source_tier = None
+
+    normalized_min_confidence: int | None = None
+    if min_confidence_weight is not None:
+        try:
+            normalized_min_confidence = max(0, min(4, int(min_confidence_weight)))
+        except Exception:
+            normalized_min_confidence = None
+
+    normalized_source_days: int | None = None
+    if source_days is not None:
+        try:
+            parsed_days = int(source_days)
+            normalized_source_days = parsed_days if parsed_days > 0 else None
+        except Exception:
+            normalized_source_days = None
+
+    strict_default_mode = (
+        normalized_source_tier is None
+        and normalized_min_confidence is None
+        and normalized_source_days is None
+    )
+    if strict_default_mode:
+        # Rich-by-default analyst view: retain broader source context by default.
+        normalized_min_confidence = 1
+        normalized_source_days = 365
+
+    source_cutoff_dt = (
+        datetime.now(timezone.utc) - timedelta(days=normalized_source_days)
+        if normalized_source_days is not None
+        else None
+    )
+
+    source_items_for_changes = _filter_sources_for_changes(
+        source_items,
+        source_tier=normalized_source_tier,
+        min_confidence_weight=normalized_min_confidence,
+        source_cutoff_dt=source_cutoff_dt,
+        parse_published_datetime=_parse_published_datetime,
+    )
+    # Wider projections (e.g. source_days beyond the base text window) load the
+    # remaining bodies on demand; the default window is already hydrated.
+    hydrate_source_text_for_db_core(str(base['db_path']), source_items_for_changes)
+
+    allowed_source_ids_for_changes = {
+        str(source.get('id') or '').strip()
+        for source in source_items_for_changes
+        if str(source.get('id') or '').strip()
+    }
+    timeline_items_for_changes = (
+        [
+            item
+            for item in timeline_items
+            if str(item.get('source_id') or '').strip() in allowed_source_ids_for_changes
+        ]
+        if (
+            normalized_source_tier is not None
+            or normalized_min_confidence is not None
+            or source_cutoff_dt is not None
+        )
+        else timeline_items
+    )
+    timeline_recent_items_for_changes = [
+        item
+        for item in timeline_items_for_changes
+        if (
+            (dt := _parse_published_datetime(str(item.get('occurred_at') or ''))) is not None
+            and dt >= cutoff_90
+        )
+    ]
+    emerging_techniques = _emerging_techniques_from_timeline(
+        timeline_recent_items_for_changes,
+        known_technique_ids,
+    )
+    emerging_technique_ids = [str(item.get('technique_id') or '') for item in emerging_techniques]
+    emerging_techniques_with_dates = [
+        {
+            'technique_id': str(item.get('technique_id') or ''),
+            'first_seen': str(item.get('first_seen') or ''),
+        }
+        for item in emerging_techniques
+    ]
+    stage_timer.mark('filter_sources', rows=len(source_items_for_changes))
+    recent_activity_highlights = _build_recent_activity_highlights(
+        timeline_items_for_changes,
+        source_items_for_changes,
+        actor_terms,
+    )
+    stage_timer.mark('recent_activity', rows=len(recent_activity_highlights))
+    # LLM outputs depend only on the filtered source set, so projections that
+    # land on the same set reuse the review/synthesis results from the base.
+    # Only usable results are memoized so a transient LLM failure is retried
+    # on the next projection instead of being served until the base expires.
+    llm_memo_key = tuple(sorted(allowed_source_ids_for_changes))
+    llm_memo_entry = llm_memo.setdefault(llm_memo_key, {})
+    raw_change_signals = llm_memo_entry.get('change_signals')
+    if raw_change_signals is None:
+        raw_change_signals = _ollama_review_change_signals(
+            str(actor.get('display_name') or ''),
+            source_items_for_changes,
+            recent_activity_highlights,
+        )
+    llm_change_signals = _validate_llm_change_signals(
+        copy.deepcopy(raw_change_signals),
+        source_items_for_changes,
+        recent_activity_highlights,
+        parse_published_datetime=_parse_published_datetime,
+        recent_change_max_days=_recent_change_max_days,
+    )
+    stage_timer.mark('llm_change_signals', rows=len(llm_change_signals))
+
+    top_change_signals = _top_llm_change_signals(llm_change_signals)
+    if top_change_signals:
+        llm_memo_entry['change_signals'] = raw_change_signals
+    min_recent_dt = datetime.now(timezone.utc) - timedelta(days=max(1, _recent_change_max_days))
     llm_change_signals_degraded = False
     if not top_change_signals:
         llm_change_signals_degraded = True
@@ -1737,16 +2029,23 @@ def fetch_actor_notebook_core(
                     else [],
                 }
             )
-    recent_activity_synthesis = _ollama_synthesize_recent_activity(
-        str(actor.get('display_name') or ''),
-        recent_activity_highlights,
-    )
+    stage_timer.mark('change_signals', rows=len(top_change_signals))
+    raw_recent_synthesis = llm_memo_entry.get('recent_synthesis')
+    if raw_recent_synthesis is None:
+        raw_recent_synthesis = _ollama_synthesize_recent_activity(
+            str(actor.get('display_name') or ''),
+            recent_activity_highlights,
+        )
+    recent_activity_synthesis = copy.deepcopy(raw_recent_synthesis)
     if not isinstance(recent_activity_synthesis, list):
         recent_activity_synthesis = []
+    if recent_activity_synthesis:
+        llm_memo_entry['recent_synthesis'] = raw_recent_synthesis
     llm_recent_synthesis_degraded = False
     if not recent_activity_synthesis:
         llm_recent_synthesis_degraded = True
         recent_activity_synthesis = _build_recent_activity_synthesis(recent_activity_highlights)
+    stage_timer.mark('llm_recent_synthesis', rows=len(recent_activity_synthesis))
     recent_change_summary = _recent_change_summary(
         timeline_recent_items_for_changes,
         recent_activity_highlights,
@@ -1757,12 +2056,8 @@ def fetch_actor_notebook_core(
         recent_activity_highlights,
         top_techniques,
     )
-    notebook_kpis = _build_notebook_kpis(
-        timeline_items,
-        known_technique_ids,
-        len(open_thread_ids),
-        source_items,
-    )
+
+    stage_timer.mark('summaries')
 
     return {
         'actor': actor,
@@ -1839,8 +2134,8 @@ def fetch_actor_notebook_core(
         'backfill_notice': backfill_notice,
         'backfill_debug': backfill_debug,
         'counts': {
-            'sources': len(sources),
-            'timeline_events': len(timeline_rows),
+            'sources': base['source_count'],
+            'timeline_events': base['timeline_event_count'],
             'open_questions': len(open_thread_ids),
         },
     }
@@ -0,0 +1,112 @@
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import services.db_connection_service as db_connection_service
+
+SOURCE_METADATA_COLUMNS = (
+    'id',
+    'source_name',
+    'url',
+    'published_at',
+    'ingested_at',
+    'source_date_type',
+    'retrieved_at',
+    'title',
+    'headline',
+    'og_title',
+    'html_title',
+    'publisher',
+    'site_name',
+    'source_type',
+    'source_tier',
+    'confidence_weight',
+)
+SOURCE_TEXT_BATCH_SIZE = 200
+
+
+def load_source_metadata_core(connection: sqlite3.Connection, actor_id: str) -> list[dict[str, object]]:
+    """Load actor sources without their body text, newest first.
+
+    ``pasted_text`` is left as ``None`` until hydrate_source_text_core() fills it.
+    """
+    # The column list is the SOURCE_METADATA_COLUMNS constant — no user data — safe from SQL injection.
+    rows = connection.execute(
+        f'''
+        SELECT {', '.join(SOURCE_METADATA_COLUMNS)}
+        FROM sources
+        WHERE actor_id = ?
+        ORDER BY COALESCE(published_at, ingested_at, retrieved_at) DESC
+        ''',  # nosec B608
+        (actor_id,),
+    ).fetchall()
+    items: list[dict[str, object]] = []
+    for row in rows:
+        item = dict(zip(SOURCE_METADATA_COLUMNS, row))
+        item['pasted_text'] = None
+        items.append(item)
+    return items
+
+
+def hydrate_source_text_core(
+    connection: sqlite3.Connection,
+    source_items: list[dict[str, object]],
+    *,
+    batch_size: int = SOURCE_TEXT_BATCH_SIZE,
+) -> int:
+    """Fill ``pasted_text`` in place for items that have not been loaded yet."""
+    pending: dict[str, list[dict[str, object]]] = {}
+    for item in source_items:
+        if not isinstance(item, dict) or item.get('pasted_text') is not None:
+            continue
+        source_id = str(item.get('id') or '').strip()
+        if source_id:
+            pending.setdefault(source_id, []).append(item)
+    if not pending:
+        return 0
+    source_ids = list(pending)
+    safe_batch_size = max(1, int(batch_size))
+    loaded = 0
+    for start in range(0, len(source_ids), safe_batch_size):
+        batch = source_ids[start:start + safe_batch_size]
+        # {placeholders} is only '?,?,...' — no user data — safe from SQL injection.
+        placeholders = ','.join('?' for _ in batch)
+        rows = connection.execute(
+            f'SELECT id, pasted_text FROM sources WHERE id IN ({placeholders})',  # nosec B608
+            batch,
+        ).fetchall()
+        for source_id, pasted_text in rows:
+            for item in pending.pop(str(source_id), []):
+                item['pasted_text'] = str(pasted_text or '')
+                loaded += 1
+    for items in pending.values():
+        for item in items:
+            item['pasted_text'] = ''
+    return loaded
+
+
+def hydrate_source_text_for_db_core(db_path: str, source_items: list[dict[str, object]]) -> int:
+    if not any(isinstance(item, dict) and item.get('pasted_text') is None for item in source_items):
+        return 0
+    with db_connection_service.connect_core(db_path) as connection:
+        return hydrate_source_text_core(connection, source_items)
+
+
+def sources_within_days_core(
+    source_items: list[dict[str, object]],
+    *,
+    days: int,
+    parse_published_datetime,
+    include_undated: bool = True,
+) -> list[dict[str, object]]:
+    cutoff = datetime.now(timezone.utc) - timedelta(days=max(0, int(days)))
+    selected: list[dict[str, object]] = []
+    for item in source_items:
+        raw_date = str(item.get('published_at') or item.get('ingested_at') or item.get('retrieved_at') or '')
+        source_dt = parse_published_datetime(raw_date)
+        if source_dt is None:
+            if include_undated:
+                selected.append(item)
+            continue
+        if source_dt >= cutoff:
+            selected.append(item)
+    return selected
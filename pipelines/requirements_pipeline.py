@@ -1,12 +1,12 @@
 import json
 import os
 import re
-import sqlite3
 from typing import Callable
 
 import httpx
 from fastapi import HTTPException
 
+import services.db_connection_service as db_connection_service
 from services.llm_schema_service import parse_ollama_json_object
 from services.prompt_templates import with_template_header
 
@@ -293,7 +293,7 @@ def generate_actor_requirements_core(
     _new_id = deps['new_id']
 
     now = _now_iso()
-    with sqlite3.connect(db_path) as connection:
+    with db_connection_service.connect_core(db_path) as connection:
         if not _actor_exists(connection, actor_id):
             raise HTTPException(status_code=404, detail='actor not found')
 
@@ -169,8 +169,15 @@ def extract_major_move_events(
     actor_terms: list[str],
     source_title: str | None = None,
     *,
+    sentence_records: list[dict[str, object]] | None = None,
     deps: dict[str, object],
 ) -> list[dict[str, object]]:
+    """Extract timeline events from one source.
+
+    ``sentence_records`` are the source's precomputed ``source_sentences`` rows;
+    when given, the per-sentence checks are read from them instead of
+    re-splitting and re-classifying ``text``.
+    """
     _split_sentences = deps['split_sentences']
     _extract_ttp_ids = deps['extract_ttp_ids']
     _new_id = deps['new_id']
@@ -340,20 +347,32 @@ def extract_major_move_events(
                 }
             ]
 
+    if sentence_records is None:
+        sentence_records = [
+            {
+                'sentence': sentence,
+                'mentions_actor': sentence_mentions_actor_terms(sentence, actor_terms),
+                'is_activity': looks_like_activity_sentence(sentence),
+                'category': timeline_category_from_sentence(sentence),
+                'ttp_ids': None,
+            }
+            for sentence in _split_sentences(text)
+        ]
     events: list[dict[str, object]] = []
-    for sentence in _split_sentences(text):
-        if not sentence_mentions_actor_terms(sentence, actor_terms):
-            continue
-        if not looks_like_activity_sentence(sentence):
+    for record in sentence_records:
+        if not record.get('mentions_actor') or not record.get('is_activity'):
             continue
-        category = timeline_category_from_sentence(sentence)
+        category = record.get('category')
         if category is None:
             continue
+        sentence = str(record.get('sentence') or '')
         summary = ' '.join(sentence.split())
         if len(summary) > 260:
             summary = summary[:260].rsplit(' ', 1)[0] + '...'
         target_hint = extract_target_hint(sentence)
-        ttp_ids = _extract_ttp_ids(sentence)
+        stored_ttp_ids = record.get('ttp_ids')
+        # Stored IDs are unvalidated regex hits; re-check them against the current technique set.
+        ttp_ids = _extract_ttp_ids(sentence if stored_ttp_ids is None else ' '.join(stored_ttp_ids))
         clean_source_title = ' '.join(str(source_title or '').split()).strip()
         if clean_source_title.startswith(('http://', 'https://')):
             clean_source_title = ''
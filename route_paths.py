@@ -49,3 +49,5 @@ ACTOR_TAXII_RUNS = '/actors/{actor_id}/taxii/runs'
 ACTOR_IOC_DELETE = '/actors/{actor_id}/iocs/{ioc_id}/delete'
 ACTOR_IOCS_BULK_DELETE = '/actors/{actor_id}/iocs/bulk-delete'
 CHAT_MESSAGE = '/chat/message'
+ACTOR_SEARCH = '/actors/{actor_id}/search'
+SEARCH = '/search'
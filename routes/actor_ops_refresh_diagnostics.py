@@ -1,6 +1,7 @@
 import sqlite3
 
 import route_paths
+import services.db_connection_service as db_connection_service
 from fastapi import APIRouter, BackgroundTasks, HTTPException
 from fastapi.responses import JSONResponse, RedirectResponse
 
@@ -17,7 +18,7 @@ def register_actor_refresh_and_diagnostic_routes(*, router: APIRouter, deps: dic
 
     @router.post('/actors/{actor_id}/refresh')
     def refresh_notebook(actor_id: str, background_tasks: BackgroundTasks) -> RedirectResponse:
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
         _set_actor_notebook_status(
@@ -36,7 +37,7 @@ def register_actor_refresh_and_diagnostic_routes(*, router: APIRouter, deps: dic
 
     @router.post(route_paths.ACTOR_REFRESH_JOBS, response_class=JSONResponse)
     def submit_refresh_job(actor_id: str) -> dict[str, object]:
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
         if callable(_submit_actor_refresh_job):
@@ -52,14 +53,14 @@ def register_actor_refresh_and_diagnostic_routes(*, router: APIRouter, deps: dic
 
     @router.get('/actors/{actor_id}/refresh/stats')
     def actor_refresh_stats(actor_id: str) -> dict[str, object]:
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
         return _get_actor_refresh_stats(actor_id)
 
     @router.get(route_paths.ACTOR_REFRESH_TIMELINE, response_class=JSONResponse)
     def actor_refresh_timeline(actor_id: str) -> dict[str, object]:
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
         if callable(_get_actor_refresh_timeline):
@@ -76,7 +77,7 @@ def register_actor_refresh_and_diagnostic_routes(*, router: APIRouter, deps: dic
 
     @router.get(route_paths.ACTOR_REFRESH_JOB_DETAIL, response_class=JSONResponse)
     def actor_refresh_job_detail(actor_id: str, job_id: str) -> dict[str, object]:
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
         if not callable(_get_actor_refresh_job):
@@ -85,7 +86,7 @@ def register_actor_refresh_and_diagnostic_routes(*, router: APIRouter, deps: dic
 
     @router.get(route_paths.ACTOR_INGEST_DIAGNOSTICS, response_class=JSONResponse)
     def actor_ingest_diagnostics(actor_id: str) -> dict[str, object]:
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             try:
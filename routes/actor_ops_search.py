@@ -0,0 +1,45 @@
+import route_paths
+import services.db_connection_service as db_connection_service
+import services.search_service as search_service
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse
+
+
+def register_search_routes(*, router: APIRouter, deps: dict[str, object]) -> None:
+    _db_path = deps['db_path']
+    _actor_exists = deps['actor_exists']
+
+    def _search(*, q: str, actor_id: str | None, kinds: str, limit: int, offset: int) -> dict[str, object]:
+        with db_connection_service.connect_core(_db_path()) as connection:
+            if actor_id is not None and not _actor_exists(connection, actor_id):
+                raise HTTPException(status_code=404, detail='actor not found')
+            try:
+                return search_service.search_corpus_core(
+                    connection,
+                    query=q,
+                    actor_id=actor_id,
+                    kinds=kinds.split(','),
+                    limit=limit,
+                    offset=offset,
+                )
+            except ValueError as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    @router.get(route_paths.ACTOR_SEARCH, response_class=JSONResponse)
+    def search_actor(
+        actor_id: str,
+        q: str = '',
+        kinds: str = '',
+        limit: int = search_service.SEARCH_DEFAULT_LIMIT,
+        offset: int = 0,
+    ) -> dict[str, object]:
+        return _search(q=q, actor_id=actor_id, kinds=kinds, limit=limit, offset=offset)
+
+    @router.get(route_paths.SEARCH, response_class=JSONResponse)
+    def search_all(
+        q: str = '',
+        kinds: str = '',
+        limit: int = search_service.SEARCH_DEFAULT_LIMIT,
+        offset: int = 0,
+    ) -> dict[str, object]:
+        return _search(q=q, actor_id=None, kinds=kinds, limit=limit, offset=offset)
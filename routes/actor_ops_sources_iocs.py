@@ -1,10 +1,10 @@
-import sqlite3
 import uuid
 from urllib.parse import urlparse
 
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import RedirectResponse
 
+import services.db_connection_service as db_connection_service
 from services.ioc_store_service import bulk_delete_ioc_items_core, delete_ioc_item_core
 
 
@@ -24,7 +24,7 @@ def register_actor_source_and_ioc_routes(*, router: APIRouter, deps: dict[str, o
     @router.post('/actors/{actor_id}/sources')
     async def add_source(actor_id: str, request: Request) -> RedirectResponse:
         await _enforce_request_size(request, _source_upload_body_limit_bytes)
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
 
@@ -62,7 +62,7 @@ def register_actor_source_and_ioc_routes(*, router: APIRouter, deps: dict[str, o
             parsed = urlparse(source_url)
             source_name = (parsed.hostname or parsed.netloc or 'Manual source').strip()
 
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             _upsert_source_for_actor(
                 connection,
                 actor_id,
@@ -90,7 +90,7 @@ def register_actor_source_and_ioc_routes(*, router: APIRouter, deps: dict[str, o
     @router.post('/actors/{actor_id}/iocs')
     async def add_iocs(actor_id: str, request: Request) -> RedirectResponse:
         await _enforce_request_size(request, _default_body_limit_bytes)
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
 
@@ -108,7 +108,7 @@ def register_actor_source_and_ioc_routes(*, router: APIRouter, deps: dict[str, o
 
         inserted = 0
         skipped: list[str] = []
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             for value in values:
                 result = _upsert_ioc_item(
                     connection,
@@ -148,7 +148,7 @@ def register_actor_source_and_ioc_routes(*, router: APIRouter, deps: dict[str, o
         status_reason = str(form_data.get('status_reason', '')).strip()[:240]
         updated_at = _utc_now_iso()
 
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             row = connection.execute(
@@ -226,7 +226,7 @@ def register_actor_source_and_ioc_routes(*, router: APIRouter, deps: dict[str, o
     @router.post('/actors/{actor_id}/iocs/{ioc_id}/delete')
     async def delete_ioc(actor_id: str, ioc_id: str, request: Request) -> RedirectResponse:
         await _enforce_request_size(request, _default_body_limit_bytes)
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             deleted = delete_ioc_item_core(connection, actor_id=actor_id, ioc_id=ioc_id)
@@ -241,7 +241,7 @@ def register_actor_source_and_ioc_routes(*, router: APIRouter, deps: dict[str, o
         ioc_ids = [str(v).strip() for v in form_data.getlist('ioc_ids') if str(v).strip()]
         if not ioc_ids:
             return RedirectResponse(url=f'/?actor_id={actor_id}&notice=No+IOCs+selected', status_code=303)
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             deleted = bulk_delete_ioc_items_core(connection, actor_id=actor_id, ioc_ids=ioc_ids)
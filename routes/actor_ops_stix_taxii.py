@@ -1,6 +1,5 @@
-import sqlite3
-
 import route_paths
+import services.db_connection_service as db_connection_service
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import JSONResponse
 
@@ -22,7 +21,7 @@ def register_actor_stix_and_taxii_routes(*, router: APIRouter, deps: dict[str, o
 
     @router.get(route_paths.ACTOR_STIX_EXPORT, response_class=JSONResponse)
     def export_stix_bundle(actor_id: str) -> dict[str, object]:
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             row = connection.execute(
                 'SELECT display_name FROM actor_profiles WHERE id = ?',
                 (actor_id,),
@@ -39,7 +38,7 @@ def register_actor_stix_and_taxii_routes(*, router: APIRouter, deps: dict[str, o
     def ranked_evidence(actor_id: str, limit: int = 100, entity_type: str = '') -> dict[str, object]:
         if not callable(_list_ranked_evidence):
             raise HTTPException(status_code=404, detail='ranked evidence endpoint unavailable')
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             items = _list_ranked_evidence(
@@ -72,7 +71,7 @@ def register_actor_stix_and_taxii_routes(*, router: APIRouter, deps: dict[str, o
                 status_code=400,
                 detail='collection_url required (set TAXII_COLLECTION_URL or provide in request body)',
             )
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             result = _sync_taxii_collection(
@@ -92,7 +91,7 @@ def register_actor_stix_and_taxii_routes(*, router: APIRouter, deps: dict[str, o
     def taxii_runs(actor_id: str, limit: int = 20) -> dict[str, object]:
         if not callable(_list_taxii_sync_runs):
             raise HTTPException(status_code=404, detail='taxii runs endpoint unavailable')
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             runs = _list_taxii_sync_runs(connection, actor_id=actor_id, limit=limit)
@@ -108,7 +107,7 @@ def register_actor_stix_and_taxii_routes(*, router: APIRouter, deps: dict[str, o
         payload = await request.json()
         if not isinstance(payload, dict):
             raise HTTPException(status_code=400, detail='invalid STIX bundle payload')
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             result = _import_actor_stix_bundle(
@@ -1,8 +1,8 @@
 import csv
 import io
-import sqlite3
 
 import route_paths
+import services.db_connection_service as db_connection_service
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse, Response
 
@@ -33,7 +33,7 @@ def register_notebook_export_routes(*, router: APIRouter, deps: dict[str, object
 
     @router.get(route_paths.ACTOR_EXPORT_TASKS_JSON, response_class=JSONResponse)
     def export_tasks_json(actor_id: str) -> dict[str, object]:
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             rows = connection.execute(
@@ -97,7 +97,7 @@ def register_notebook_export_routes(*, router: APIRouter, deps: dict[str, object
 
     @router.get(route_paths.ACTOR_EXPORT_OUTCOMES_JSON, response_class=JSONResponse)
     def export_outcomes_json(actor_id: str) -> dict[str, object]:
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             rows = connection.execute(
@@ -157,7 +157,7 @@ def register_notebook_export_routes(*, router: APIRouter, deps: dict[str, object
 
     @router.get(route_paths.ACTOR_EXPORT_COVERAGE_JSON, response_class=JSONResponse)
     def export_coverage_json(actor_id: str) -> dict[str, object]:
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             rows = connection.execute(
@@ -1,6 +1,6 @@
-import sqlite3
-
 import route_paths
+import services.db_connection_service as db_connection_service
+import services.db_writer_service as db_writer_service
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import JSONResponse
 
@@ -19,7 +19,7 @@ def register_notebook_feedback_routes(*, router: APIRouter, deps: dict[str, obje
 
     @router.get(route_paths.ACTOR_ENVIRONMENT_PROFILE, response_class=JSONResponse)
     def actor_environment_profile(actor_id: str) -> dict[str, object]:
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             return _load_environment_profile(connection, actor_id=actor_id)
@@ -31,12 +31,13 @@ def register_notebook_feedback_routes(*, router: APIRouter, deps: dict[str, obje
         if not isinstance(payload, dict):
             raise HTTPException(status_code=400, detail='invalid profile payload')
         profile = _normalize_environment_profile(payload)
-        with sqlite3.connect(_db_path()) as connection:
+
+        def _write(connection) -> dict[str, object]:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
-            response = _upsert_environment_profile(connection, actor_id=actor_id, profile=profile)
-            connection.commit()
-        return response
+            return _upsert_environment_profile(connection, actor_id=actor_id, profile=profile)
+
+        return await db_writer_service.run_write_async_core(_db_path(), _write, priority=True)
 
     @router.post(route_paths.ACTOR_FEEDBACK, response_class=JSONResponse)
     async def submit_feedback(actor_id: str, request: Request) -> dict[str, object]:
@@ -51,8 +52,8 @@ def register_notebook_feedback_routes(*, router: APIRouter, deps: dict[str, obje
         source_id = str(payload.get('source_id') or '').strip() or None
         metadata_raw = payload.get('metadata')
         metadata = metadata_raw if isinstance(metadata_raw, dict) else {}
-        source_reliability_updates = 0
-        with sqlite3.connect(_db_path()) as connection:
+
+        def _write(connection) -> tuple[dict[str, object], int]:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             stored = _store_feedback_event(
@@ -67,6 +68,7 @@ def register_notebook_feedback_routes(*, router: APIRouter, deps: dict[str, obje
             )
             if not bool(stored.get('stored')):
                 raise HTTPException(status_code=400, detail=str(stored.get('reason') or 'failed to store feedback'))
+            source_reliability_updates = 0
             evidence_ids_raw = metadata.get('evidence_source_ids')
             evidence_ids = [str(item).strip() for item in evidence_ids_raw if str(item).strip()] if isinstance(evidence_ids_raw, list) else []
             if evidence_ids:
@@ -86,7 +88,13 @@ def register_notebook_feedback_routes(*, router: APIRouter, deps: dict[str, obje
                     source_urls=urls,
                     rating_score=int(stored.get('rating_score') or 0),
                 )
-            connection.commit()
+            return stored, source_reliability_updates
+
+        stored, source_reliability_updates = await db_writer_service.run_write_async_core(
+            _db_path(),
+            _write,
+            priority=True,
+        )
         return {
             'actor_id': actor_id,
             **stored,
@@ -95,7 +103,7 @@ def register_notebook_feedback_routes(*, router: APIRouter, deps: dict[str, obje
 
     @router.get(route_paths.ACTOR_FEEDBACK_SUMMARY, response_class=JSONResponse)
     def feedback_summary(actor_id: str, item_type: str | None = None) -> dict[str, object]:
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             return _feedback_summary_for_actor(connection, actor_id=actor_id, item_type=item_type)
@@ -1,10 +1,10 @@
 import csv
 import io
-import sqlite3
 import uuid
 from datetime import datetime, timedelta, timezone
 
 import route_paths
+import services.db_connection_service as db_connection_service
 import services.quick_checks_view_service as quick_checks_view_service
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse, JSONResponse, Response
@@ -80,6 +80,7 @@ def register_notebook_hunts_routes(*, router: APIRouter, deps: dict[str, object]
             source_days=source_days or '30',
             build_on_cache_miss=False,
             allow_stale_cache=True,
+            stale_while_revalidate=True,
         )
         actor_meta = notebook.get('actor', {}) if isinstance(notebook, dict) else {}
         actor_name = str(actor_meta.get('display_name') or actor_id)
@@ -118,7 +119,7 @@ def register_notebook_hunts_routes(*, router: APIRouter, deps: dict[str, object]
         cards_for_hunts: list[dict[str, object]] = []
         card_behavior_queries: dict[str, list[dict[str, str]]] = {}
         environment_profile: dict[str, object] = {}
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             environment_profile = _load_environment_profile(connection, actor_id=actor_id)
             for card in cards_list:
                 if not isinstance(card, dict):
@@ -282,7 +283,7 @@ def register_notebook_hunts_routes(*, router: APIRouter, deps: dict[str, object]
             {'hours': 24 * 30, 'label': '30d', 'active': default_lookback_hours == 24 * 30},
         ]
 
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             feedback_rows = connection.execute(
                 '''
                 SELECT item_id, COUNT(*), SUM(rating_score)
@@ -2,6 +2,7 @@ import logging
 import sqlite3
 
 import route_paths
+import services.db_connection_service as db_connection_service
 import services.notebook_service as notebook_service
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse
@@ -152,7 +153,7 @@ def register_notebook_live_routes(*, router: APIRouter, deps: dict[str, object])
                 _recover_stale_running_states()
             except Exception:
                 pass
-        with sqlite3.connect(_db_path(), timeout=5.0) as connection:
+        with db_connection_service.connect_core(_db_path(), timeout=5.0) as connection:
             actor_row = connection.execute(
                 '''
                 SELECT notebook_status, notebook_message
@@ -174,6 +175,7 @@ def register_notebook_live_routes(*, router: APIRouter, deps: dict[str, object])
                     source_days=source_days,
                     build_on_cache_miss=False,
                     allow_stale_cache=True,
+                    stale_while_revalidate=True,
                 )
                 if isinstance(running_notebook, dict):
                     running_actor = dict(running_notebook.get('actor', {})) if isinstance(running_notebook.get('actor'), dict) else {}
@@ -212,6 +214,7 @@ def register_notebook_live_routes(*, router: APIRouter, deps: dict[str, object])
                 source_days=source_days,
                 build_on_cache_miss=False,
                 allow_stale_cache=True,
+                stale_while_revalidate=True,
             )
         except sqlite3.OperationalError as exc:
             if 'database is locked' not in str(exc).lower():
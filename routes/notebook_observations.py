@@ -1,11 +1,12 @@
 import csv
 import io
-import sqlite3
 import uuid
 from datetime import datetime
 from urllib.parse import urlparse
 
 import route_paths
+import services.db_connection_service as db_connection_service
+import services.db_writer_service as db_writer_service
 import services.observation_service as observation_service
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import JSONResponse, RedirectResponse, Response
@@ -213,7 +214,7 @@ def register_notebook_observation_routes(*, router: APIRouter, deps: dict[str, o
         if not safe_item_type or not safe_item_key:
             raise HTTPException(status_code=400, detail='invalid observation key')
 
-        with sqlite3.connect(_db_path()) as connection:
+        def _write(connection) -> None:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             _upsert_observation_with_history(
@@ -232,7 +233,8 @@ def register_notebook_observation_routes(*, router: APIRouter, deps: dict[str, o
                 updated_by=updated_by,
                 updated_at=updated_at,
             )
-            connection.commit()
+
+        await db_writer_service.run_write_async_core(_db_path(), _write, priority=True)
 
         return {
             'ok': True,
@@ -257,9 +259,10 @@ def register_notebook_observation_routes(*, router: APIRouter, deps: dict[str, o
         notebook = _fetch_actor_notebook(actor_id)
         highlights = notebook.get('recent_activity_highlights', [])
         entries = highlights if isinstance(highlights, list) else []
-        saved = 0
         updated_at = _utc_now_iso()
-        with sqlite3.connect(_db_path()) as connection:
+
+        def _write(connection) -> int:
+            saved = 0
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             for item in entries[:5]:
@@ -325,7 +328,9 @@ def register_notebook_observation_routes(*, router: APIRouter, deps: dict[str, o
                         updated_at=updated_at,
                     )
                     saved += 1
-            connection.commit()
+            return saved
+
+        saved = await db_writer_service.run_write_async_core(_db_path(), _write, priority=True)
         return RedirectResponse(
             url=f'/?actor_id={actor_id}&notice=Auto-noted+{saved}+recent+changes',
             status_code=303,
@@ -339,7 +344,7 @@ def register_notebook_observation_routes(*, router: APIRouter, deps: dict[str, o
             raise HTTPException(status_code=400, detail='invalid observation key')
         safe_limit = max(1, min(100, int(limit)))
 
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             rows = connection.execute(
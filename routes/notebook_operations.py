@@ -1,8 +1,8 @@
 import json
-import sqlite3
 import uuid
 
 import route_paths
+import services.db_connection_service as db_connection_service
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import JSONResponse, RedirectResponse, Response
 
@@ -39,7 +39,7 @@ def register_notebook_operation_routes(*, router: APIRouter, deps: dict[str, obj
         await _enforce_request_size(request, _default_body_limit_bytes)
         form_data = await request.form()
         actor_id = str(form_data.get('actor_id', '')).strip()
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             row = connection.execute(
                 'SELECT actor_id FROM requirement_items WHERE id = ?',
                 (requirement_id,),
@@ -60,7 +60,7 @@ def register_notebook_operation_routes(*, router: APIRouter, deps: dict[str, obj
         form_data = await request.form()
         actor_id = str(form_data.get('actor_id', '')).strip()
 
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             row = connection.execute(
                 'SELECT actor_id, status FROM question_threads WHERE id = ?',
                 (thread_id,),
@@ -164,7 +164,7 @@ def register_notebook_operation_routes(*, router: APIRouter, deps: dict[str, obj
                 return [line.strip() for line in raw_value.splitlines() if line.strip()]
             return []
 
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             now_iso = _utc_now_iso()
@@ -244,7 +244,7 @@ def register_notebook_operation_routes(*, router: APIRouter, deps: dict[str, obj
         enabled = 1 if enabled_raw in {'1', 'true', 'yes', 'on'} else 0
         updated_by = str(payload.get('updated_by') or '').strip()[:120]
         now_iso = _utc_now_iso()
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             connection.execute(
@@ -301,7 +301,7 @@ def register_notebook_operation_routes(*, router: APIRouter, deps: dict[str, obj
         analyst = str(payload.get('analyst') or '').strip()[:120]
         now_iso = _utc_now_iso()
         row_id = str(uuid.uuid4())
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             connection.execute(
@@ -372,7 +372,7 @@ def register_notebook_operation_routes(*, router: APIRouter, deps: dict[str, obj
             'timing': _flag('timing_tag'),
             'access_vector': _flag('access_vector_tag'),
         }
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             connection.execute(
@@ -464,7 +464,7 @@ def register_notebook_operation_routes(*, router: APIRouter, deps: dict[str, obj
             payload = {str(key): form.get(key) for key in form.keys()}
         analyst = str(payload.get('analyst') or '').strip()[:120]
         now_iso = _utc_now_iso()
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             row = connection.execute(
@@ -515,7 +515,7 @@ def register_notebook_operation_routes(*, router: APIRouter, deps: dict[str, obj
         analyst = str(payload.get('analyst') or '').strip()[:120]
         resolved_at = _utc_now_iso()
         row_id = str(uuid.uuid4())
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             connection.execute(
@@ -569,7 +569,7 @@ def register_notebook_operation_routes(*, router: APIRouter, deps: dict[str, obj
         validation_evidence = str(payload.get('validation_evidence') or '').strip()[:1200]
         updated_by = str(payload.get('updated_by') or '').strip()[:120]
         now_iso = _utc_now_iso()
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             existing = connection.execute(
@@ -640,7 +640,7 @@ def register_notebook_operation_routes(*, router: APIRouter, deps: dict[str, obj
         linked_key = str(payload.get('linked_key') or '').strip()[:160]
         row_id = str(uuid.uuid4())
         now_iso = _utc_now_iso()
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             connection.execute(
@@ -686,7 +686,7 @@ def register_notebook_operation_routes(*, router: APIRouter, deps: dict[str, obj
         if next_status not in {'open', 'in_progress', 'blocked', 'done'}:
             raise HTTPException(status_code=400, detail='status is required')
         now_iso = _utc_now_iso()
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             row = connection.execute(
@@ -728,7 +728,7 @@ def register_notebook_operation_routes(*, router: APIRouter, deps: dict[str, obj
         created_by = str(payload.get('created_by') or '').strip()[:120]
         row_id = str(uuid.uuid4())
         now_iso = _utc_now_iso()
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             connection.execute(
@@ -6,6 +6,7 @@ import zlib
 
 from fastapi import HTTPException
 
+import services.db_connection_service as db_connection_service
 import services.observation_service as observation_service
 
 
@@ -234,7 +235,7 @@ def build_analyst_pack_payload(
         source_days=source_days,
     )
     observations = fetch_analyst_observations(actor_id, limit=safe_observations_limit, offset=0)
-    with sqlite3.connect(db_path()) as connection:
+    with db_connection_service.connect_core(db_path()) as connection:
         if not actor_exists(connection, actor_id):
             raise HTTPException(status_code=404, detail='actor not found')
         history_rows = connection.execute(
@@ -438,7 +439,7 @@ def fetch_analyst_observations(
     except Exception:
         safe_offset = 0
 
-    with sqlite3.connect(db_path()) as connection:
+    with db_connection_service.connect_core(db_path()) as connection:
         if not actor_exists(connection, actor_id):
             raise HTTPException(status_code=404, detail='actor not found')
         rows = connection.execute(
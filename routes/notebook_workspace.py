@@ -1,8 +1,8 @@
 import csv
 import io
-import sqlite3
 
 import route_paths
+import services.db_connection_service as db_connection_service
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import HTMLResponse, JSONResponse, Response
 
@@ -73,7 +73,7 @@ def register_notebook_workspace_routes(*, router: APIRouter, deps: dict[str, obj
                     }
                 )
 
-            with sqlite3.connect(_db_path()) as connection:
+            with db_connection_service.connect_core(_db_path()) as connection:
                 obs_rows = connection.execute(
                     '''
                     SELECT item_type, item_key, note, citation_url, observed_on,
@@ -379,7 +379,7 @@ def register_notebook_workspace_routes(*, router: APIRouter, deps: dict[str, obj
     ) -> dict[str, object]:
         pref_period = 'weekly'
         pref_window_days = 7
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             pref_row = connection.execute(
                 '''
                 SELECT delta_brief_period, delta_brief_window_days
@@ -421,7 +421,7 @@ def register_notebook_workspace_routes(*, router: APIRouter, deps: dict[str, obj
     def actor_timeline_details(request: Request, actor_id: str, limit: int = 300, offset: int = 0) -> HTMLResponse:
         safe_limit = max(1, min(1000, int(limit)))
         safe_offset = max(0, int(offset))
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             actor_row = connection.execute(
                 'SELECT id, display_name FROM actor_profiles WHERE id = ?',
                 (actor_id,),
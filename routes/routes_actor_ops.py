@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from routes.actor_ops_refresh_diagnostics import register_actor_refresh_and_diagnostic_routes
+from routes.actor_ops_search import register_search_routes
 from routes.actor_ops_sources_iocs import register_actor_source_and_ioc_routes
 from routes.actor_ops_stix_taxii import register_actor_stix_and_taxii_routes
 
@@ -58,4 +59,12 @@ def create_actor_ops_router(*, deps: dict[str, object]) -> APIRouter:
         },
     )
 
+    register_search_routes(
+        router=router,
+        deps={
+            'db_path': deps['db_path'],
+            'actor_exists': deps['actor_exists'],
+        },
+    )
+
     return router
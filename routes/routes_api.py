@@ -1,8 +1,8 @@
-import sqlite3
-
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
 from fastapi.responses import RedirectResponse
 
+import services.db_connection_service as db_connection_service
+
 
 def create_api_router(*, deps: dict[str, object]) -> APIRouter:
     router = APIRouter()
@@ -69,7 +69,7 @@ def create_api_router(*, deps: dict[str, object]) -> APIRouter:
 
     @router.post('/actors/{actor_id}/track')
     def track_actor(actor_id: str, background_tasks: BackgroundTasks) -> RedirectResponse:
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             connection.execute('UPDATE actor_profiles SET is_tracked = 1 WHERE id = ?', (actor_id,))
@@ -90,7 +90,7 @@ def create_api_router(*, deps: dict[str, object]) -> APIRouter:
 
     @router.post('/actors/{actor_id}/untrack')
     def untrack_actor(actor_id: str) -> RedirectResponse:
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             connection.execute('UPDATE actor_profiles SET is_tracked = 0 WHERE id = ?', (actor_id,))
@@ -235,6 +235,7 @@ def render_dashboard_root(
                 source_days=normalized_source_days,
                 build_on_cache_miss=False,
                 allow_stale_cache=True,
+                stale_while_revalidate=True,
             )
             if selected_actor_status == 'running' and isinstance(notebook, dict):
                 actor_meta = notebook.get('actor', {}) if isinstance(notebook.get('actor'), dict) else {}
@@ -1,10 +1,10 @@
 import html
 import json
-import sqlite3
 import uuid
 from urllib.parse import quote
 
 import route_paths
+import services.db_connection_service as db_connection_service
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 
@@ -27,7 +27,7 @@ def create_evolution_router(*, deps: dict[str, object]) -> APIRouter:
 
     @router.get('/actors/{actor_id}/state')
     def get_actor_state(actor_id: str) -> dict[str, object]:
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             row = connection.execute(
                 '''
                 SELECT actor_id, capability_grid_json, behavioral_model_json, created_at
@@ -78,7 +78,7 @@ def create_evolution_router(*, deps: dict[str, object]) -> APIRouter:
             'created_at': _utc_now_iso(),
         }
 
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             connection.execute(
@@ -158,7 +158,7 @@ def create_evolution_router(*, deps: dict[str, object]) -> APIRouter:
 
     @router.get(route_paths.ACTOR_STATE_OBSERVATIONS)
     def list_observations(actor_id: str) -> list[dict[str, object]]:
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             rows = connection.execute(
@@ -190,7 +190,7 @@ def create_evolution_router(*, deps: dict[str, object]) -> APIRouter:
 
     @router.get('/actors/{actor_id}/deltas')
     def list_deltas(actor_id: str) -> list[dict[str, str]]:
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             rows = connection.execute(
@@ -226,7 +226,7 @@ def create_evolution_router(*, deps: dict[str, object]) -> APIRouter:
 
     @router.get('/actors/{actor_id}/transitions')
     def list_transitions(actor_id: str) -> list[dict[str, str]]:
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             rows = connection.execute(
@@ -255,7 +255,7 @@ def create_evolution_router(*, deps: dict[str, object]) -> APIRouter:
 
     @router.get('/actors/{actor_id}/deltas/ui', response_class=HTMLResponse)
     def deltas_ui(actor_id: str) -> str:
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             rows = connection.execute(
@@ -291,7 +291,7 @@ def create_evolution_router(*, deps: dict[str, object]) -> APIRouter:
 
     @router.get('/actors/{actor_id}/deltas/{delta_id}')
     def get_delta(actor_id: str, delta_id: str) -> dict[str, object]:
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             row = connection.execute(
@@ -319,7 +319,7 @@ def create_evolution_router(*, deps: dict[str, object]) -> APIRouter:
 
     @router.get('/actors/{actor_id}/deltas/{delta_id}/review', response_class=HTMLResponse)
     def delta_review_ui(actor_id: str, delta_id: str) -> str:
-        with sqlite3.connect(_db_path()) as connection:
+        with db_connection_service.connect_core(_db_path()) as connection:
             if not _actor_exists(connection, actor_id):
                 raise HTTPException(status_code=404, detail='actor not found')
             delta_row = connection.execute(
@@ -0,0 +1,67 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Times ensure_schema at startup for growing source counts: the one-time
+# upgrade from a pre-migration database and the boots that follow it.
+# Usage: scripts/bench_schema_startup.sh [source counts...]
+if [ "$#" -eq 0 ]; then
+  set -- 1000 10000 100000
+fi
+
+python - <<'PY' "$@"
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+from services import db_schema_service
+
+
+def seed(db_path, source_count):
+    with sqlite3.connect(db_path) as connection:
+        db_schema_service.ensure_schema(connection)
+        connection.executemany(
+            '''
+            INSERT INTO sources (
+                id, actor_id, source_name, url, published_at, ingested_at, source_date_type,
+                retrieved_at, pasted_text, source_type
+            )
+            VALUES (?, ?, 'Bench Feed', ?, ?, '', '', '2026-01-01T00:00:00+00:00', ?, '')
+            ''',
+            (
+                (
+                    f'source-{index}',
+                    f'actor-{index % 40}',
+                    f'https://example.com/bench/{index}',
+                    '2026-01-01T00:00:00+00:00' if index % 2 else None,
+                    f'Bench report {index} ' * 20,
+                )
+                for index in range(source_count)
+            ),
+        )
+        # Pretend the database predates numbered migrations.
+        connection.execute("DELETE FROM schema_meta WHERE key LIKE 'migration.%'")
+        connection.execute("UPDATE schema_meta SET value = '2026-02-27.3' WHERE key = 'schema_version'")
+    connection.close()
+
+
+def timed_boot(db_path):
+    started = time.perf_counter()
+    with sqlite3.connect(db_path) as connection:
+        db_schema_service.ensure_schema(connection)
+    connection.close()
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+results = []
+for source_count in (int(value) for value in sys.argv[1:]):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        seed(db_path, source_count)
+        upgrade_ms = timed_boot(db_path)
+        warm_ms = sorted(timed_boot(db_path) for _ in range(5))[2]
+        results.append({'sources': source_count, 'upgrade_ms': upgrade_ms, 'warm_boot_ms': warm_ms})
+print(json.dumps(results, indent=2))
+PY
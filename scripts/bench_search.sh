@@ -0,0 +1,76 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Times full-text search over a synthetic corpus: global and per-actor queries
+# for common, rare and prefix terms.
+# Usage: scripts/bench_search.sh [source_count] [actor_count]
+SOURCE_COUNT="${1:-200000}"
+ACTOR_COUNT="${2:-200}"
+
+python - <<'PY' "$SOURCE_COUNT" "$ACTOR_COUNT"
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+from services import db_schema_service
+from services import search_service
+
+source_count = int(sys.argv[1])
+actor_count = int(sys.argv[2])
+vocabulary = [f'term{index}' for index in range(5000)] + ['ivanti', 'fortinet', 'phishing', 'ransomware', 'vpn']
+
+
+def seed(db_path):
+    rng = random.Random(7)
+    with sqlite3.connect(db_path) as connection:
+        db_schema_service.ensure_schema(connection)
+        connection.executemany(
+            '''
+            INSERT INTO sources (
+                id, actor_id, source_name, url, published_at, retrieved_at, pasted_text, title
+            )
+            VALUES (?, ?, 'Bench Feed', ?, '2026-01-01T00:00:00+00:00', '2026-01-01T00:00:00+00:00', ?, ?)
+            ''',
+            (
+                (
+                    f'source-{index}',
+                    f'actor-{index % actor_count}',
+                    f'https://example.com/bench/{index}',
+                    ' '.join(rng.choice(vocabulary) for _ in range(120)),
+                    f'Bench report {index} ' + ' '.join(rng.choice(vocabulary) for _ in range(4)),
+                )
+                for index in range(source_count)
+            ),
+        )
+    connection.close()
+
+
+def timed(connection, **kwargs):
+    samples = []
+    for _ in range(7):
+        started = time.perf_counter()
+        result = search_service.search_corpus_core(connection, **kwargs)
+        samples.append(time.perf_counter() - started)
+    return round(sorted(samples)[3] * 1000, 2), result['count']
+
+
+with tempfile.TemporaryDirectory() as tmp:
+    db_path = os.path.join(tmp, 'bench.db')
+    started = time.perf_counter()
+    seed(db_path)
+    seed_seconds = round(time.perf_counter() - started, 1)
+    connection = sqlite3.connect(db_path)
+    results = []
+    for query in ('ivanti', 'ivanti vpn', '"phishing ransomware"', 'term42', 'term12*', 'nomatchterm'):
+        for actor_id in (None, 'actor-7'):
+            median_ms, count = timed(connection, query=query, actor_id=actor_id)
+            results.append({'query': query, 'actor_id': actor_id, 'median_ms': median_ms, 'results': count})
+    median_ms, count = timed(connection, query='ivanti', offset=200)
+    results.append({'query': 'ivanti', 'actor_id': None, 'offset': 200, 'median_ms': median_ms, 'results': count})
+    connection.close()
+print(json.dumps({'sources': source_count, 'actors': actor_count, 'seed_seconds': seed_seconds, 'queries': results}, indent=2))
+PY
@@ -0,0 +1,118 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Times dashboard reads while a refresh-style writer holds write transactions,
+# once with the rollback journal and once with WAL.
+# Usage: scripts/bench_sqlite_contention.sh [seconds] [readers]
+SECONDS_PER_MODE="${1:-5}"
+READERS="${2:-4}"
+
+python - <<'PY' "$SECONDS_PER_MODE" "$READERS"
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+os.environ.setdefault('MITRE_ATTACK_REFRESH_ENABLED', '0')
+import app as app_module
+from services import db_connection_service
+
+duration = float(sys.argv[1])
+reader_count = int(sys.argv[2])
+
+
+def seed(db_path):
+    app_module.DB_PATH = db_path
+    app_module.initialize_sqlite()
+    actor_ids = [app_module.create_actor_profile(f'Bench Actor {index}', 'Contention benchmark')['id'] for index in range(40)]
+    with db_connection_service.connect_core(db_path) as connection:
+        for index in range(2000):
+            app_module._upsert_source_for_actor(  # noqa: SLF001
+                connection,
+                actor_ids[index % len(actor_ids)],
+                'Bench Feed',
+                f'https://example.com/bench/{index}',
+                '2026-01-01T00:00:00+00:00',
+                f'Bench Actor {index % 40} exploited VPN appliances in report {index}.',
+            )
+    return actor_ids
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] * 1000, 2) if ordered else None
+
+
+def run(journal_mode):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        actor_ids = seed(db_path)
+        db_connection_service.close_thread_connections_core()
+        with sqlite3.connect(db_path) as raw:
+            active_mode = raw.execute(f'PRAGMA journal_mode = {journal_mode}').fetchone()[0]
+        raw.close()
+        stop = threading.Event()
+        latencies = []
+        errors = []
+        write_latencies = []
+
+        def reader():
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    app_module.list_actor_profiles()
+                    with db_connection_service.connect_core(db_path) as connection:
+                        connection.execute('SELECT actor_id, COUNT(*) FROM sources GROUP BY actor_id').fetchall()
+                except sqlite3.OperationalError as exc:
+                    errors.append(str(exc))
+                latencies.append(time.perf_counter() - started)
+            db_connection_service.close_thread_connections_core()
+
+        def writer():
+            index = 0
+            while not stop.is_set():
+                started = time.perf_counter()
+                with db_connection_service.connect_core(db_path) as connection:
+                    for _ in range(50):
+                        app_module._upsert_source_for_actor(  # noqa: SLF001
+                            connection,
+                            actor_ids[index % len(actor_ids)],
+                            'Bench Refresh',
+                            f'https://example.com/refresh/{index}',
+                            '2026-02-01T00:00:00+00:00',
+                            f'Refresh report {index} about VPN exploitation.',
+                        )
+                        index += 1
+                    connection.execute(
+                        'UPDATE actor_profiles SET notebook_updated_at = ? WHERE id = ?',
+                        (app_module.utc_now_iso(), actor_ids[index % len(actor_ids)]),
+                    )
+                    time.sleep(0.02)
+                write_latencies.append(time.perf_counter() - started)
+            db_connection_service.close_thread_connections_core()
+
+        threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(reader_count)]
+        for thread in threads:
+            thread.start()
+        time.sleep(duration)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        return {
+            'journal_mode': active_mode,
+            'reads': len(latencies),
+            'read_p50_ms': percentile(latencies, 0.5),
+            'read_p95_ms': percentile(latencies, 0.95),
+            'read_max_ms': percentile(latencies, 1.0),
+            'read_errors': len(errors),
+            'write_batches': len(write_latencies),
+            'write_p95_ms': percentile(write_latencies, 0.95),
+        }
+
+
+for mode in ('delete', 'wal'):
+    print(json.dumps(run(mode)))
+PY
@@ -0,0 +1,76 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Compares timeline summary dedupe strategies on synthetic candidates.
+# Usage: scripts/bench_timeline_dedupe.sh [sizes] [pairwise_max]
+SIZES="${1:-1000,10000,50000}"
+PAIRWISE_MAX="${2:-2000}"
+
+python - <<'PY' "$SIZES" "$PAIRWISE_MAX"
+import json
+import random
+import sys
+import time
+
+from services import text_utils_service
+
+sizes = [int(value) for value in sys.argv[1].split(',') if value.strip()]
+pairwise_max = int(sys.argv[2])
+threshold = 0.75
+
+
+def token_set(value):
+    return text_utils_service.token_set_core(value, normalize_text=text_utils_service.normalize_text_core)
+
+
+def synthetic_summaries(count, seed=7):
+    # Event summaries share actor/verb tokens; ~30% are one-word rewrites of an earlier summary.
+    rng = random.Random(seed)
+    vocab = [f'term{index}' for index in range(3000)]
+    originals = []
+    summaries = []
+    for _ in range(count):
+        if originals and rng.random() < 0.3:
+            tokens = rng.choice(originals).split()
+            tokens[rng.randrange(2, len(tokens))] = rng.choice(vocab)
+        else:
+            tokens = ['actor', 'targeted'] + rng.sample(vocab, 16)
+            originals.append(' '.join(tokens))
+        summaries.append(' '.join(tokens))
+    return summaries
+
+
+def run_pairwise(summaries):
+    kept = []
+    for summary in summaries:
+        if any(text_utils_service.token_overlap_core(summary, existing, token_set=token_set) >= threshold for existing in kept):
+            continue
+        kept.append(summary)
+    return len(kept)
+
+
+def run_index(index, summaries):
+    kept = 0
+    for summary in summaries:
+        if index.max_overlap(summary) >= threshold:
+            continue
+        index.add(summary)
+        kept += 1
+    return kept
+
+
+for size in sizes:
+    summaries = synthetic_summaries(size)
+    result = {'candidates': size}
+    strategies = {
+        'inverted_index': lambda: run_index(text_utils_service.TokenOverlapIndex(token_set=token_set), summaries),
+        'minhash_lsh': lambda: run_index(text_utils_service.MinHashLSHIndex(token_set=token_set), summaries),
+    }
+    if size <= pairwise_max:
+        strategies = {'pairwise': lambda: run_pairwise(summaries), **strategies}
+    for name, strategy in strategies.items():
+        started = time.perf_counter()
+        kept = strategy()
+        result[name] = {'seconds': round(time.perf_counter() - started, 3), 'kept': kept}
+    print(json.dumps(result))
+PY
@@ -4,13 +4,19 @@ set -euo pipefail
 DB_PATH="${1:-./actor_notebook.db}"
 
 python - <<'PY' "$DB_PATH"
-import sqlite3
 import sys
 
+from services import db_connection_service
 from services import db_schema_service
 
 db_path = sys.argv[1]
-with sqlite3.connect(db_path) as conn:
+journal_mode = db_connection_service.enable_wal_core(db_path)
+if journal_mode != 'wal':
+    sys.exit(f"could not switch {db_path} to WAL journal mode (still {journal_mode or 'unknown'})")
+with db_connection_service.connect_core(db_path) as conn:
     db_schema_service.ensure_schema(conn)
-print(f"schema migration complete: {db_path}")
+print(
+    f"schema migration complete: {db_path} "
+    f"(schema_version={db_schema_service.SCHEMA_VERSION}, journal_mode={journal_mode})"
+)
 PY
@@ -1,30 +1,68 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
+# Prunes rows past their retention policy in short chunked transactions, then
+# returns free pages to the filesystem with incremental vacuum.
+#   DRY_RUN=1                        report what would be deleted, delete nothing
+#   RETENTION_TABLE_POLICIES=...     per-table overrides, e.g. "llm_synthesis_cache=30,ingest_decisions=90:1000"
+#   ENABLE_INCREMENTAL_VACUUM=1      one-off full VACUUM converting an older database to auto_vacuum=INCREMENTAL
 DB_PATH="${1:-./actor_notebook.db}"
 RETENTION_DAYS="${RETENTION_DAYS:-180}"
 KEEP_MIN_ROWS="${KEEP_MIN_ROWS:-500}"
+RETENTION_TABLE_POLICIES="${RETENTION_TABLE_POLICIES:-}"
+RETENTION_CHUNK_ROWS="${RETENTION_CHUNK_ROWS:-500}"
+DRY_RUN="${DRY_RUN:-0}"
+ENABLE_INCREMENTAL_VACUUM="${ENABLE_INCREMENTAL_VACUUM:-0}"
 
-python - <<'PY' "$DB_PATH" "$RETENTION_DAYS" "$KEEP_MIN_ROWS"
+python - <<'PY' "$DB_PATH" "$RETENTION_DAYS" "$KEEP_MIN_ROWS" "$RETENTION_TABLE_POLICIES" "$RETENTION_CHUNK_ROWS" "$DRY_RUN" "$ENABLE_INCREMENTAL_VACUUM"
 import json
-import sqlite3
 import sys
 
 from services import data_retention_service
+from services import db_connection_service
 from services import db_schema_service
 
 db_path = sys.argv[1]
 retention_days = int(sys.argv[2])
 keep_min_rows = int(sys.argv[3])
+table_policies = data_retention_service.parse_table_policies_core(sys.argv[4])
+chunk_rows = int(sys.argv[5])
+dry_run = sys.argv[6] == '1'
+enable_incremental_vacuum = sys.argv[7] == '1'
 
-with sqlite3.connect(db_path) as connection:
+with db_connection_service.connect_core(db_path) as connection:
     db_schema_service.ensure_schema(connection)
+    policies = data_retention_service.retention_policies_core(
+        retention_days=retention_days,
+        keep_min_rows_per_table=keep_min_rows,
+        table_policies=table_policies,
+    )
     results = data_retention_service.prune_data_core(
         connection,
         retention_days=retention_days,
         keep_min_rows_per_table=keep_min_rows,
+        table_policies=table_policies,
+        chunk_rows=chunk_rows,
+        dry_run=dry_run,
     )
-    connection.commit()
+    auto_vacuum = None
+    vacuum = None
+    if not dry_run:
+        if enable_incremental_vacuum:
+            auto_vacuum = data_retention_service.enable_incremental_vacuum_core(connection)
+        vacuum = data_retention_service.reclaim_space_core(connection)
 
-print(json.dumps({"db_path": db_path, "retention_days": retention_days, "keep_min_rows": keep_min_rows, "results": results}, indent=2))
+print(
+    json.dumps(
+        {
+            "db_path": db_path,
+            "dry_run": dry_run,
+            "policies": policies,
+            "results": results,
+            "auto_vacuum": auto_vacuum,
+            "vacuum": vacuum,
+        },
+        indent=2,
+    )
+)
 PY
@@ -4,6 +4,8 @@ from datetime import datetime, timedelta, timezone
 
 from fastapi import HTTPException
 
+import services.db_connection_service as db_connection_service
+import services.db_writer_service as db_writer_service
 from services import event_service
 
 
@@ -20,7 +22,7 @@ def set_actor_notebook_status_core(*, actor_id: str, status: str, message: str,
     _db_path = deps['db_path']
     _utc_now_iso = deps['utc_now_iso']
 
-    with sqlite3.connect(_db_path()) as connection:
+    def _write(connection) -> None:
         connection.execute(
             '''
             UPDATE actor_profiles
@@ -29,13 +31,14 @@ def set_actor_notebook_status_core(*, actor_id: str, status: str, message: str,
             ''',
             (status, message, _utc_now_iso(), actor_id),
         )
-        connection.commit()
+
+    db_writer_service.run_write_core(_db_path(), _write)
 
 
 def list_actor_profiles_core(*, deps: dict[str, object]) -> list[dict[str, object]]:
     _db_path = deps['db_path']
 
-    with sqlite3.connect(_db_path()) as connection:
+    with db_connection_service.connect_core(_db_path()) as connection:
         rows = connection.execute(
             '''
             SELECT
@@ -153,7 +156,7 @@ def upsert_tracking_intent_core(
         if ' '.join(str(item).split()).strip()
     ][:12]
     now_iso = _utc_now_iso()
-    with sqlite3.connect(_db_path()) as connection:
+    with db_connection_service.connect_core(_db_path()) as connection:
         if not _actor_exists(connection, actor_id):
             raise HTTPException(status_code=404, detail='actor not found')
         connection.execute(
@@ -215,7 +218,7 @@ def confirm_actor_assessment_core(
         raise HTTPException(status_code=400, detail='analyst is required')
     confirm_note = str(note or '').strip()[:1000]
     now_iso = _utc_now_iso()
-    with sqlite3.connect(_db_path()) as connection:
+    with db_connection_service.connect_core(_db_path()) as connection:
         if not _actor_exists(connection, actor_id):
             raise HTTPException(status_code=404, detail='actor not found')
         intent = load_tracking_intent_core(connection, actor_id)
@@ -280,7 +283,7 @@ def seed_actor_profiles_from_mitre_groups_core(*, deps: dict[str, object]) -> di
     seeded = 0
     existing = 0
     now_iso = _utc_now_iso()
-    with sqlite3.connect(_db_path()) as connection:
+    with db_connection_service.connect_core(_db_path()) as connection:
         existing_rows = connection.execute(
             'SELECT canonical_name, display_name FROM actor_profiles'
         ).fetchall()
@@ -363,7 +366,7 @@ def create_actor_profile_core(
         'scope_statement': scope_statement,
         'created_at': _utc_now_iso(),
     }
-    with sqlite3.connect(_db_path()) as connection:
+    with db_connection_service.connect_core(_db_path()) as connection:
         duplicate = connection.execute(
             '''
             SELECT id, display_name
@@ -462,7 +465,7 @@ def merge_actor_profiles_core(
     if target_actor_id == source_actor_id:
         raise HTTPException(status_code=400, detail='source and target actor ids must differ')
 
-    with sqlite3.connect(_db_path()) as connection:
+    with db_connection_service.connect_core(_db_path()) as connection:
         target_row = connection.execute(
             '''
             SELECT id, display_name, scope_statement, is_tracked, canonical_name
@@ -493,6 +496,7 @@ def merge_actor_profiles_core(
 
         for table in (
             'sources',
+            'source_sentences',
             'timeline_events',
             'observation_records',
             'delta_proposals',
@@ -725,7 +729,7 @@ def auto_merge_duplicate_actors_core(*, deps: dict[str, object]) -> int:
     _utc_now_iso = deps['utc_now_iso']
     _new_id = deps['new_id']
     merged_count = 0
-    with sqlite3.connect(_db_path()) as connection:
+    with db_connection_service.connect_core(_db_path()) as connection:
         dup_keys = connection.execute(
             '''
             SELECT canonical_name
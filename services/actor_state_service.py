@@ -1,7 +1,8 @@
 import json
-import sqlite3
 import uuid
 
+import services.db_connection_service as db_connection_service
+
 from fastapi import HTTPException
 
 
@@ -16,7 +17,7 @@ def initialize_actor_state_core(*, actor_id: str, deps: dict[str, object]) -> di
     capability_grid_json = json.dumps(_baseline_capability_grid())
     behavioral_model_json = json.dumps(_baseline_behavioral_model())
 
-    with sqlite3.connect(_db_path()) as connection:
+    with db_connection_service.connect_core(_db_path()) as connection:
         if not _actor_exists(connection, actor_id):
             raise HTTPException(status_code=404, detail='actor not found')
 
@@ -58,7 +59,7 @@ def resolve_delta_action_core(
 
     created_at = _utc_now_iso()
 
-    with sqlite3.connect(_db_path()) as connection:
+    with db_connection_service.connect_core(_db_path()) as connection:
         if not _actor_exists(connection, actor_id):
             raise HTTPException(status_code=404, detail='actor not found')
 
@@ -1,7 +1,8 @@
-import sqlite3
 import uuid
 from datetime import datetime, timezone
 
+import services.db_connection_service as db_connection_service
+
 
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -42,7 +43,7 @@ def dispatch_alert_deliveries_core(
     queued = 0
     unsupported = 0
     targets = subscriptions if isinstance(subscriptions, list) and subscriptions else ['in_app']
-    with sqlite3.connect(db_path) as connection:
+    with db_connection_service.connect_core(db_path) as connection:
         for raw_target in targets:
             channel, target = _parse_subscription_target(str(raw_target or ''))
             status = 'queued'
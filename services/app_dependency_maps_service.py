@@ -13,10 +13,12 @@ def build_fetch_actor_notebook_deps_core(
     prefer_cached: bool = True,
     build_on_cache_miss: bool = True,
     allow_stale_cache: bool = False,
+    stale_while_revalidate: bool = False,
 ) -> dict[str, object]:
     quick_check_service = _require(namespace, 'quick_check_service')
     return {
         'pipeline_fetch_actor_notebook_core': _require(namespace, 'pipeline_fetch_actor_notebook_core'),
+        'pipeline_enrich_notebook_llm_sections_core': _require(namespace, 'pipeline_enrich_notebook_llm_sections_core'),
         'db_path': _require(namespace, '_db_path'),
         'source_tier': source_tier,
         'min_confidence_weight': min_confidence_weight,
@@ -24,6 +26,13 @@ def build_fetch_actor_notebook_deps_core(
         'prefer_cached': prefer_cached,
         'build_on_cache_miss': build_on_cache_miss,
         'allow_stale_cache': allow_stale_cache,
+        'stale_while_revalidate': stale_while_revalidate,
+        'swr_max_stale_seconds': _require(namespace, 'NOTEBOOK_SWR_MAX_STALE_SECONDS'),
+        'swr_actor_cooldown_seconds': _require(namespace, 'NOTEBOOK_SWR_ACTOR_COOLDOWN_SECONDS'),
+        'swr_max_workers': _require(namespace, 'NOTEBOOK_SWR_MAX_WORKERS'),
+        'swr_max_pending': _require(namespace, 'NOTEBOOK_SWR_MAX_PENDING'),
+        'base_cache_ttl_seconds': _require(namespace, 'NOTEBOOK_BASE_CACHE_TTL_SECONDS'),
+        'record_stage_timing': _require(namespace, 'metrics_service').record_stage_timing_core,
         'parse_published_datetime': _require(namespace, '_parse_published_datetime'),
         'safe_json_string_list': _require(namespace, '_safe_json_string_list'),
         'actor_signal_categories': _require(namespace, '_actor_signal_categories'),
@@ -48,6 +57,7 @@ def build_fetch_actor_notebook_deps_core(
         'org_alignment_label': _require(namespace, '_org_alignment_label'),
         'fallback_priority_questions': _require(namespace, '_fallback_priority_questions'),
         'token_overlap': _require(namespace, '_token_overlap'),
+        'token_set': _require(namespace, '_token_set'),
         'build_actor_profile_from_mitre': _require(namespace, '_build_actor_profile_from_mitre'),
         'group_top_techniques': _require(namespace, '_group_top_techniques'),
         'favorite_attack_vectors': _require(namespace, '_favorite_attack_vectors'),
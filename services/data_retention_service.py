@@ -1,68 +1,364 @@
+import logging
+import sqlite3
+from collections.abc import Callable
+
+import services.db_connection_service as db_connection_service
+import services.db_schema_service as db_schema_service
+import services.db_writer_service as db_writer_service
+
+LOGGER = logging.getLogger(__name__)
+
+RETENTION_CHUNK_ROWS = 500
+RETENTION_ORPHAN_SCAN_ROWS = 5000
+RETENTION_VACUUM_PAGES = 2000
+
 # Allowlist for tables managed by data retention.
-# Maps table_name -> (timestamp_column, result_key).
+# Maps table_name -> (timestamp_expression, result_key, extra_condition).
 # These are compile-time constants — never derived from user input.
-_RETENTION_TABLES: tuple[tuple[str, str, str], ...] = (
-    ('question_updates', 'created_at', 'question_updates_deleted'),
-    ('analyst_observation_history', 'updated_at', 'observation_history_deleted'),
-    ('ioc_history', 'created_at', 'ioc_history_deleted'),
-    ('analyst_feedback_events', 'created_at', 'feedback_events_deleted'),
+_RETENTION_TABLES: tuple[tuple[str, str, str, str], ...] = (
+    ('sources', 'COALESCE(retrieved_at, published_at)', 'sources_deleted', ''),
+    ('question_updates', 'created_at', 'question_updates_deleted', ''),
+    ('analyst_observation_history', 'updated_at', 'observation_history_deleted', ''),
+    ('ioc_history', 'created_at', 'ioc_history_deleted', ''),
+    ('analyst_feedback_events', 'created_at', 'feedback_events_deleted', ''),
+    ('ingest_decisions', 'created_at', 'ingest_decisions_deleted', ''),
+    # Superseded fetches only: the newest document of every source is kept.
+    (
+        'source_documents',
+        'fetched_at',
+        'source_documents_deleted',
+        'fetched_at < (SELECT MAX(newer.fetched_at) FROM source_documents newer '
+        'WHERE newer.source_id = source_documents.source_id)',
+    ),
+    ('notebook_generation_phases', 'started_at', 'generation_phases_deleted', ''),
+    ('llm_synthesis_cache', 'updated_at', 'llm_cache_deleted', ''),
+    ('actor_alert_delivery_events', 'created_at', 'alert_delivery_events_deleted', ''),
+)
+# Rows owned by a source: deleted with it, and swept when a source is already gone.
+_SOURCE_CHILD_TABLES: tuple[str, ...] = (
+    'source_sentences',
+    'source_documents',
+    'source_entities',
+    'source_scoring',
+    'actor_resolution',
+)
+_ALLOWED_TABLE_NAMES: frozenset[str] = frozenset(t[0] for t in _RETENTION_TABLES) | frozenset(_SOURCE_CHILD_TABLES)
+_ALLOWED_TS_EXPRESSIONS: frozenset[str] = frozenset(
+    {'created_at', 'updated_at', 'fetched_at', 'started_at', 'COALESCE(retrieved_at, published_at)'}
 )
-_ALLOWED_TABLE_NAMES: frozenset[str] = frozenset(t[0] for t in _RETENTION_TABLES)
-_ALLOWED_TS_COLS: frozenset[str] = frozenset({'created_at', 'updated_at'})
 
+RunChunk = Callable[[Callable[[sqlite3.Connection], object]], object]
 
-def prune_data_core(
-    connection,
+
+def retention_policies_core(
     *,
     retention_days: int,
     keep_min_rows_per_table: int = 500,
-) -> dict[str, int]:
-    safe_days = max(1, int(retention_days))
-    keep_rows = max(0, int(keep_min_rows_per_table))
-    results: dict[str, int] = {}
-
-    # Keep most recent source rows, prune old rows by retrieved timestamp.
-    source_cutoff = connection.execute(
-        '''
-        SELECT retrieved_at
-        FROM sources
-        ORDER BY COALESCE(retrieved_at, published_at) DESC
-        LIMIT 1 OFFSET ?
-        ''',
+    table_policies: dict[str, dict[str, int]] | None = None,
+) -> dict[str, dict[str, int]]:
+    """Return ``{table: {'retention_days', 'keep_min_rows'}}`` with per-table overrides applied.
+
+    Raises ValueError for an override naming a table retention does not manage.
+    """
+    overrides = dict(table_policies or {})
+    unknown_tables = sorted(set(overrides) - {t[0] for t in _RETENTION_TABLES})
+    if unknown_tables:
+        raise ValueError(f"no retention policy for table(s): {', '.join(unknown_tables)}")
+    policies: dict[str, dict[str, int]] = {}
+    for table, _ts_expr, _key, _extra in _RETENTION_TABLES:
+        override = overrides.get(table) or {}
+        policies[table] = {
+            'retention_days': max(1, int(override.get('retention_days', retention_days))),
+            'keep_min_rows': max(0, int(override.get('keep_min_rows', keep_min_rows_per_table))),
+        }
+    return policies
+
+
+def parse_table_policies_core(raw: str) -> dict[str, dict[str, int]]:
+    """Parse ``"table=days[:keep_min_rows],..."`` (e.g. ``RETENTION_TABLE_POLICIES``) into overrides."""
+    policies: dict[str, dict[str, int]] = {}
+    for entry in str(raw or '').split(','):
+        table, _, value = entry.strip().partition('=')
+        if not table.strip() or not value.strip():
+            continue
+        days, _, keep_rows = value.strip().partition(':')
+        policy = {'retention_days': int(days)}
+        if keep_rows.strip():
+            policy['keep_min_rows'] = int(keep_rows)
+        policies[table.strip()] = policy
+    return policies
+
+
+def _commit_chunk(connection) -> RunChunk:
+    def _run(fn: Callable[[sqlite3.Connection], object]) -> object:
+        result = fn(connection)
+        connection.commit()
+        return result
+
+    return _run
+
+
+def _age_condition(ts_expr: str, extra: str) -> str:
+    condition = f"{ts_expr} < datetime('now', ?) AND {ts_expr} < ?"
+    return f'{condition} AND {extra}' if extra else condition
+
+
+def _cutoff(connection, table: str, ts_expr: str, keep_rows: int) -> str:
+    # table and ts_expr come from _RETENTION_TABLES — a compile-time allowlist, never user input.
+    row = connection.execute(
+        f'SELECT {ts_expr} FROM {table} ORDER BY {ts_expr} DESC LIMIT 1 OFFSET ?',  # nosec B608
         (keep_rows,),
     ).fetchone()
-    if source_cutoff is not None and str(source_cutoff[0] or '').strip():
-        before = connection.total_changes
-        connection.execute(
-            '''
-            DELETE FROM sources
-            WHERE COALESCE(retrieved_at, published_at) < datetime('now', ?)
-              AND COALESCE(retrieved_at, published_at) < ?
-            ''',
-            (f'-{safe_days} days', str(source_cutoff[0])),
+    return str(row[0] or '').strip() if row is not None else ''
+
+
+def _delete_source_chunk(condition: str, params: tuple[object, ...], chunk_rows: int):
+    def _write(connection) -> dict[str, int]:
+        # condition comes from _age_condition over allowlisted columns; values are bound parameters.
+        source_ids = [
+            str(row[0])
+            for row in connection.execute(
+                f'SELECT id FROM sources WHERE {condition} LIMIT ?',  # nosec B608
+                (*params, chunk_rows),
+            ).fetchall()
+        ]
+        deleted = {f'{child}_deleted': 0 for child in _SOURCE_CHILD_TABLES}
+        deleted['sources_deleted'] = 0
+        if not source_ids:
+            return deleted
+        placeholders = ', '.join('?' for _ in source_ids)
+        for child in _SOURCE_CHILD_TABLES:
+            cursor = connection.execute(
+                f'DELETE FROM {child} WHERE source_id IN ({placeholders})',  # nosec B608
+                source_ids,
+            )
+            deleted[f'{child}_deleted'] = max(0, cursor.rowcount)
+        cursor = connection.execute(f'DELETE FROM sources WHERE id IN ({placeholders})', source_ids)  # nosec B608
+        deleted['sources_deleted'] = max(0, cursor.rowcount)
+        return deleted
+
+    return _write
+
+
+def _delete_table_chunk(table: str, condition: str, params: tuple[object, ...], chunk_rows: int):
+    def _write(connection) -> int:
+        # table and condition come from _RETENTION_TABLES; values are bound parameters.
+        cursor = connection.execute(
+            f'DELETE FROM {table} WHERE rowid IN (SELECT rowid FROM {table} WHERE {condition} LIMIT ?)',  # nosec B608
+            (*params, chunk_rows),
+        )
+        return max(0, cursor.rowcount)
+
+    return _write
+
+
+def _delete_orphan_window(child: str, after_rowid: int):
+    def _write(connection) -> tuple[int, int | None]:
+        # child is one of _SOURCE_CHILD_TABLES — never user input.
+        row = connection.execute(
+            f'SELECT MAX(rowid) FROM (SELECT rowid FROM {child} WHERE rowid > ? ORDER BY rowid LIMIT ?)',  # nosec B608
+            (after_rowid, RETENTION_ORPHAN_SCAN_ROWS),
+        ).fetchone()
+        if row is None or row[0] is None:
+            return 0, None
+        upper_rowid = int(row[0])
+        cursor = connection.execute(
+            f'''
+            DELETE FROM {child}
+            WHERE rowid > ? AND rowid <= ?
+              AND NOT EXISTS (SELECT 1 FROM sources WHERE sources.id = {child}.source_id)
+            ''',  # nosec B608
+            (after_rowid, upper_rowid),
         )
-        results['sources_deleted'] = int(connection.total_changes - before)
-    else:
-        results['sources_deleted'] = 0
+        return max(0, cursor.rowcount), upper_rowid
+
+    return _write
 
-    # Prune old history/events while keeping recent minimum rows.
-    # table and ts_col come from _RETENTION_TABLES — a compile-time allowlist, never user input.
-    for table, ts_col, key in _RETENTION_TABLES:
+
+def prune_data_core(
+    connection,
+    *,
+    retention_days: int,
+    keep_min_rows_per_table: int = 500,
+    table_policies: dict[str, dict[str, int]] | None = None,
+    chunk_rows: int = RETENTION_CHUNK_ROWS,
+    dry_run: bool = False,
+    run_chunk: RunChunk | None = None,
+    between_chunks: Callable[[], bool] | None = None,
+) -> dict[str, int]:
+    """Delete rows past their table's retention policy, ``chunk_rows`` at a time.
+
+    Each chunk is its own short write: by default it runs on ``connection`` and
+    commits, or ``run_chunk(fn)`` runs it elsewhere (the background job hands
+    chunks to the writer thread). ``between_chunks`` is called after every
+    chunk and stops the run by returning False. With ``dry_run`` nothing is
+    deleted and the result counts the rows that would be.
+    """
+    policies = retention_policies_core(
+        retention_days=retention_days,
+        keep_min_rows_per_table=keep_min_rows_per_table,
+        table_policies=table_policies,
+    )
+    safe_chunk_rows = max(1, int(chunk_rows))
+    execute = run_chunk or _commit_chunk(connection)
+    keep_going = between_chunks or (lambda: True)
+    results: dict[str, int] = {f'{child}_deleted': 0 for child in _SOURCE_CHILD_TABLES}
+    # The dry run keeps expired sources in place, so later tables skip rows
+    # the source cascade has already counted.
+    expired_sources: tuple[str, tuple[object, ...]] | None = None
+
+    for table, ts_expr, key, extra in _RETENTION_TABLES:
+        results.setdefault(key, 0)
         # Defensive guard: skip anything not in the explicit allowlist.
-        if table not in _ALLOWED_TABLE_NAMES or ts_col not in _ALLOWED_TS_COLS:
+        if table not in _ALLOWED_TABLE_NAMES or ts_expr not in _ALLOWED_TS_EXPRESSIONS:
             continue
-        cutoff = connection.execute(  # nosec B608
-            f'SELECT {ts_col} FROM {table} ORDER BY {ts_col} DESC LIMIT 1 OFFSET ?',
-            (keep_rows,),
-        ).fetchone()
-        if cutoff is None or not str(cutoff[0] or '').strip():
-            results[key] = 0
+        policy = policies[table]
+        cutoff = _cutoff(connection, table, ts_expr, policy['keep_min_rows'])
+        if not cutoff:
             continue
-        before = connection.total_changes
-        connection.execute(  # nosec B608
-            f"DELETE FROM {table} WHERE {ts_col} < datetime('now', ?) AND {ts_col} < ?",
-            (f'-{safe_days} days', str(cutoff[0])),
-        )
-        results[key] = int(connection.total_changes - before)
+        condition = _age_condition(ts_expr, extra)
+        params = (f"-{policy['retention_days']} days", cutoff)
+        if dry_run:
+            count_condition, count_params = condition, params
+            if table in _SOURCE_CHILD_TABLES and expired_sources is not None:
+                # Both conditions come from _age_condition over allowlisted columns.
+                count_condition = (
+                    f'{condition} AND source_id NOT IN (SELECT id FROM sources WHERE {expired_sources[0]})'  # nosec B608
+                )
+                count_params = (*params, *expired_sources[1])
+            # Table, column and child names come from the allowlists; values are bound parameters.
+            row = connection.execute(
+                f'SELECT COUNT(*) FROM {table} WHERE {count_condition}',  # nosec B608
+                count_params,
+            ).fetchone()
+            results[key] += int(row[0] or 0)
+            if table == 'sources':
+                expired_sources = (condition, params)
+                for child in _SOURCE_CHILD_TABLES:
+                    row = connection.execute(
+                        f'SELECT COUNT(*) FROM {child} WHERE source_id IN (SELECT id FROM sources WHERE {condition})',  # nosec B608
+                        params,
+                    ).fetchone()
+                    results[f'{child}_deleted'] += int(row[0] or 0)
+            continue
+        while True:
+            if table == 'sources':
+                deleted = execute(_delete_source_chunk(condition, params, safe_chunk_rows))
+                for deleted_key, count in deleted.items():
+                    results[deleted_key] += count
+                chunk_count = deleted['sources_deleted']
+            else:
+                chunk_count = int(execute(_delete_table_chunk(table, condition, params, safe_chunk_rows)))
+                results[key] += chunk_count
+            if chunk_count < safe_chunk_rows:
+                break
+            if not keep_going():
+                return results
+
+    for child in _SOURCE_CHILD_TABLES:
+        if dry_run:
+            row = connection.execute(
+                f'SELECT COUNT(*) FROM {child} WHERE NOT EXISTS (SELECT 1 FROM sources WHERE sources.id = {child}.source_id)'  # nosec B608
+            ).fetchone()
+            results[f'{child}_deleted'] += int(row[0] or 0)
+            continue
+        after_rowid = -(2**63)
+        while True:
+            deleted, upper_rowid = execute(_delete_orphan_window(child, after_rowid))
+            results[f'{child}_deleted'] += deleted
+            if upper_rowid is None:
+                break
+            after_rowid = upper_rowid
+            if not keep_going():
+                return results
 
     return results
+
+
+def reclaim_space_core(
+    connection,
+    *,
+    max_pages: int = RETENTION_VACUUM_PAGES,
+    between_chunks: Callable[[], bool] | None = None,
+) -> dict[str, int]:
+    """Return free pages to the filesystem with ``PRAGMA incremental_vacuum``, ``max_pages`` at a time.
+
+    Databases not created with ``auto_vacuum = INCREMENTAL`` are left alone;
+    enable_incremental_vacuum_core converts them. The pragma frees a single page
+    per step under ``execute()``, so each step runs through ``executescript()``
+    as its own short transaction on ``connection``.
+    """
+    auto_vacuum = int(connection.execute('PRAGMA auto_vacuum').fetchone()[0])
+    free_pages = int(connection.execute('PRAGMA freelist_count').fetchone()[0])
+    result = {'auto_vacuum': auto_vacuum, 'free_pages_before': free_pages, 'pages_reclaimed': 0}
+    if auto_vacuum != 2 or free_pages == 0:
+        return result
+    keep_going = between_chunks or (lambda: True)
+    page_step = max(1, int(max_pages))
+    while True:
+        before = int(connection.execute('PRAGMA freelist_count').fetchone()[0])
+        connection.executescript(f'PRAGMA incremental_vacuum({page_step});')
+        reclaimed = before - int(connection.execute('PRAGMA freelist_count').fetchone()[0])
+        result['pages_reclaimed'] += reclaimed
+        if reclaimed < page_step or not keep_going():
+            return result
+
+
+def enable_incremental_vacuum_core(connection) -> str:
+    """Switch an existing database to ``auto_vacuum = INCREMENTAL`` with a one-off full VACUUM.
+
+    VACUUM can renumber rowids, so the full-text indexes are rebuilt afterwards.
+    New databases get the setting from ensure_schema and never need this.
+    """
+    if int(connection.execute('PRAGMA auto_vacuum').fetchone()[0]) != 2:
+        connection.commit()
+        connection.execute('PRAGMA auto_vacuum = INCREMENTAL')
+        connection.execute('VACUUM')
+        db_schema_service.rebuild_search_indexes(connection)
+    return 'incremental' if int(connection.execute('PRAGMA auto_vacuum').fetchone()[0]) == 2 else 'none'
+
+
+def run_retention_job_core(*, stop_event, deps: dict[str, object]) -> dict[str, object]:
+    """Prune and reclaim space on ``db_path`` without holding the write lock for long.
+
+    Every delete chunk is a separate unit on the db writer thread, so request
+    writes are interleaved, and the job pauses between chunks. Setting
+    ``stop_event`` ends the run after the current chunk.
+    """
+    _db_path = deps['db_path']
+    _retention_days = deps['retention_days']
+    _keep_min_rows = deps['keep_min_rows']
+    _table_policies = deps.get('table_policies')
+    _chunk_rows = deps.get('chunk_rows', RETENTION_CHUNK_ROWS)
+    _pause_seconds = float(deps.get('pause_seconds', 0.05))
+    _vacuum_pages = deps.get('vacuum_pages', RETENTION_VACUUM_PAGES)
+
+    def _run_chunk(fn: Callable[[sqlite3.Connection], object]) -> object:
+        return db_writer_service.run_write_core(_db_path, fn)
+
+    def _between_chunks() -> bool:
+        return not stop_event.wait(max(0.0, _pause_seconds))
+
+    with db_connection_service.connect_core(_db_path) as connection:
+        results = prune_data_core(
+            connection,
+            retention_days=_retention_days,
+            keep_min_rows_per_table=_keep_min_rows,
+            table_policies=_table_policies,
+            chunk_rows=_chunk_rows,
+            run_chunk=_run_chunk,
+            between_chunks=_between_chunks,
+        )
+        vacuum = None
+        if not stop_event.is_set():
+            vacuum = reclaim_space_core(connection, max_pages=_vacuum_pages, between_chunks=_between_chunks)
+    return {'results': results, 'vacuum': vacuum, 'stopped': stop_event.is_set()}
+
+
+def retention_loop_core(*, stop_event, loop_seconds: int, run_once) -> None:
+    # The first pass waits one interval so startup is not competing with a prune.
+    while not stop_event.wait(max(1, int(loop_seconds))):
+        try:
+            run_once()
+        except Exception as exc:
+            LOGGER.warning('data retention run failed: %s', exc)
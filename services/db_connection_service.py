@@ -0,0 +1,169 @@
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+LOGGER = logging.getLogger(__name__)
+
+SQLITE_BUSY_TIMEOUT_MS = 30000
+SQLITE_CACHE_SIZE_KIB = 16384
+SQLITE_MMAP_SIZE_BYTES = 256 * 1024 * 1024
+SQLITE_THREAD_CONNECTION_LIMIT = 4
+
+_THREAD_STATE = threading.local()
+
+
+class _PooledConnection:
+    __slots__ = ('connection', 'file_identity', 'in_use')
+
+    def __init__(self, connection: sqlite3.Connection, file_identity: tuple[int, int]) -> None:
+        self.connection = connection
+        self.file_identity = file_identity
+        self.in_use = False
+
+
+def configure(
+    *,
+    busy_timeout_ms: int | None = None,
+    cache_size_kib: int | None = None,
+    mmap_size_bytes: int | None = None,
+) -> None:
+    global SQLITE_BUSY_TIMEOUT_MS, SQLITE_CACHE_SIZE_KIB, SQLITE_MMAP_SIZE_BYTES
+    if busy_timeout_ms is not None:
+        SQLITE_BUSY_TIMEOUT_MS = max(0, int(busy_timeout_ms))
+    if cache_size_kib is not None:
+        SQLITE_CACHE_SIZE_KIB = max(0, int(cache_size_kib))
+    if mmap_size_bytes is not None:
+        SQLITE_MMAP_SIZE_BYTES = max(0, int(mmap_size_bytes))
+
+
+def _busy_timeout_ms(timeout: float | None) -> int:
+    if timeout is None:
+        return SQLITE_BUSY_TIMEOUT_MS
+    return max(0, int(float(timeout) * 1000))
+
+
+def _file_identity(db_path: str) -> tuple[int, int] | None:
+    if not db_path or db_path == ':memory:':
+        return None
+    try:
+        stat = os.stat(db_path)
+    except OSError:
+        return None
+    return (stat.st_dev, stat.st_ino)
+
+
+def open_connection_core(db_path: str, *, timeout: float | None = None) -> sqlite3.Connection:
+    """Open an unpooled connection with the standard pragmas; the caller closes it."""
+    busy_timeout_ms = _busy_timeout_ms(timeout)
+    connection = sqlite3.connect(db_path, timeout=busy_timeout_ms / 1000)
+    connection.execute(f'PRAGMA busy_timeout = {busy_timeout_ms}')
+    connection.execute('PRAGMA synchronous = NORMAL')
+    connection.execute('PRAGMA temp_store = MEMORY')
+    connection.execute(f'PRAGMA cache_size = -{SQLITE_CACHE_SIZE_KIB}')
+    connection.execute(f'PRAGMA mmap_size = {SQLITE_MMAP_SIZE_BYTES}')
+    return connection
+
+
+def _thread_pool() -> dict[str, _PooledConnection]:
+    pool = getattr(_THREAD_STATE, 'connections', None)
+    if pool is None:
+        pool = {}
+        _THREAD_STATE.connections = pool
+    return pool
+
+
+def _checkout_pooled(db_path: str) -> _PooledConnection | None:
+    pool = _thread_pool()
+    pooled = pool.get(db_path)
+    if pooled is not None:
+        if pooled.in_use:
+            return None
+        if pooled.file_identity == _file_identity(db_path):
+            # Re-insert so the dict order tracks recency for eviction.
+            pool[db_path] = pool.pop(db_path)
+            return pooled
+        # The file was replaced on disk (e.g. restored from a backup).
+        pool.pop(db_path)
+        pooled.connection.close()
+    connection = open_connection_core(db_path)
+    file_identity = _file_identity(db_path)
+    if file_identity is None:
+        connection.close()
+        return None
+    pooled = _PooledConnection(connection, file_identity)
+    pool[db_path] = pooled
+    for stale_path in list(pool)[:-SQLITE_THREAD_CONNECTION_LIMIT]:
+        if not pool[stale_path].in_use:
+            pool.pop(stale_path).connection.close()
+    return pooled
+
+
+@contextmanager
+def connect_core(db_path: str, *, timeout: float | None = None) -> Iterator[sqlite3.Connection]:
+    """Yield a tuned connection to ``db_path`` for one transaction.
+
+    As with ``with sqlite3.connect(...)``, the block commits on success and
+    rolls back on error. The connection then stays open for the calling
+    thread's next block. Nested blocks on the same path, in-memory databases
+    and files replaced on disk get a fresh connection that is closed on exit.
+    """
+    path = str(db_path)
+    pooled = _checkout_pooled(path)
+    if pooled is None:
+        connection = open_connection_core(path, timeout=timeout)
+    else:
+        connection = pooled.connection
+        pooled.in_use = True
+        if timeout is not None:
+            connection.execute(f'PRAGMA busy_timeout = {_busy_timeout_ms(timeout)}')
+    try:
+        try:
+            yield connection
+        except BaseException:
+            connection.rollback()
+            raise
+        try:
+            connection.commit()
+        except BaseException:
+            connection.rollback()
+            raise
+    finally:
+        if pooled is None:
+            connection.close()
+        else:
+            connection.row_factory = None
+            if timeout is not None:
+                connection.execute(f'PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}')
+            pooled.in_use = False
+
+
+def close_thread_connections_core() -> None:
+    """Close the calling thread's idle pooled connections."""
+    pool = _thread_pool()
+    for db_path, pooled in list(pool.items()):
+        if not pooled.in_use:
+            pool.pop(db_path).connection.close()
+
+
+def enable_wal_core(db_path: str) -> str:
+    """Switch ``db_path`` to write-ahead logging and return the resulting journal mode.
+
+    The mode is stored in the database file, so this runs once at startup and
+    from scripts/migrate_sqlite.sh. Filesystems without shared-memory support
+    keep the rollback journal; that is logged rather than treated as fatal.
+    """
+    connection = open_connection_core(str(db_path))
+    try:
+        # Only takes effect on a new, empty file; it must precede the WAL switch,
+        # which writes the database header.
+        connection.execute('PRAGMA auto_vacuum = INCREMENTAL')
+        row = connection.execute('PRAGMA journal_mode = WAL').fetchone()
+    finally:
+        connection.close()
+    journal_mode = str(row[0] if row else '').lower()
+    if journal_mode != 'wal':
+        LOGGER.warning('sqlite database %s is using %s journal mode, not wal', db_path, journal_mode or 'an unknown')
+    return journal_mode
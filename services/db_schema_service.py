@@ -1,24 +1,15 @@
-def ensure_schema(connection) -> None:
-    schema_version = '2026-02-27.3'
-    connection.execute(
-        '''
-        CREATE TABLE IF NOT EXISTS schema_meta (
-            key TEXT PRIMARY KEY,
-            value TEXT NOT NULL,
-            updated_at TEXT NOT NULL
-        )
-        '''
-    )
-    connection.execute(
-        '''
-        INSERT INTO schema_meta (key, value, updated_at)
-        VALUES ('schema_version', ?, datetime('now'))
-        ON CONFLICT(key) DO UPDATE SET
-            value = excluded.value,
-            updated_at = excluded.updated_at
-        ''',
-        (schema_version,),
-    )
+import sqlite3
+from collections.abc import Callable, Iterator
+
+SCHEMA_BACKFILL_CHUNK_ROWS = 5000
+
+
+def _apply_base_schema(connection) -> None:
+    """Migration 1: every table, column and index the app had before numbered migrations.
+
+    Each statement is idempotent so databases created by older releases are
+    brought up to date in place. New schema changes go in a new migration.
+    """
     connection.execute(
         '''
         CREATE TABLE IF NOT EXISTS actor_profiles (
@@ -42,13 +33,6 @@ def ensure_schema(connection) -> None:
         connection.execute(
             "ALTER TABLE actor_profiles ADD COLUMN aliases_csv TEXT NOT NULL DEFAULT ''"
         )
-    connection.execute(
-        '''
-        UPDATE actor_profiles
-        SET canonical_name = LOWER(TRIM(display_name))
-        WHERE COALESCE(TRIM(canonical_name), '') = ''
-        '''
-    )
     connection.execute(
         '''
         CREATE INDEX IF NOT EXISTS idx_actor_profiles_canonical_name
@@ -409,7 +393,11 @@ def ensure_schema(connection) -> None:
             source_fingerprint TEXT,
             source_type TEXT,
             source_tier TEXT,
-            confidence_weight INTEGER
+            confidence_weight INTEGER,
+            iocs_extracted_at TEXT,
+            timeline_extractor_version TEXT,
+            sentences_indexed_at TEXT,
+            sentence_terms_key TEXT
         )
         '''
     )
@@ -456,32 +444,46 @@ def ensure_schema(connection) -> None:
         connection.execute("ALTER TABLE sources ADD COLUMN ingested_at TEXT")
     if not any(col[1] == 'source_date_type' for col in source_cols):
         connection.execute("ALTER TABLE sources ADD COLUMN source_date_type TEXT")
+    if not any(col[1] == 'iocs_extracted_at' for col in source_cols):
+        connection.execute("ALTER TABLE sources ADD COLUMN iocs_extracted_at TEXT")
+    if not any(col[1] == 'timeline_extractor_version' for col in source_cols):
+        connection.execute("ALTER TABLE sources ADD COLUMN timeline_extractor_version TEXT")
+    if not any(col[1] == 'sentences_indexed_at' for col in source_cols):
+        connection.execute("ALTER TABLE sources ADD COLUMN sentences_indexed_at TEXT")
+    if not any(col[1] == 'sentence_terms_key' for col in source_cols):
+        connection.execute("ALTER TABLE sources ADD COLUMN sentence_terms_key TEXT")
     connection.execute(
         '''
-        UPDATE sources
-        SET ingested_at = COALESCE(NULLIF(ingested_at, ''), retrieved_at)
+        CREATE TABLE IF NOT EXISTS source_sentences (
+            source_id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            actor_id TEXT NOT NULL,
+            sentence TEXT NOT NULL,
+            mentions_actor INTEGER,
+            is_activity INTEGER NOT NULL DEFAULT 0,
+            category TEXT,
+            is_question_candidate INTEGER NOT NULL DEFAULT 0,
+            ttp_ids_json TEXT NOT NULL DEFAULT '[]',
+            PRIMARY KEY (source_id, position)
+        )
         '''
     )
     connection.execute(
         '''
-        UPDATE sources
-        SET source_date_type = CASE
-            WHEN COALESCE(TRIM(published_at), '') <> '' THEN 'published'
-            ELSE 'ingested'
-        END
-        WHERE COALESCE(TRIM(source_date_type), '') = ''
+        CREATE INDEX IF NOT EXISTS idx_source_sentences_actor_question
+        ON source_sentences(actor_id, is_question_candidate)
         '''
     )
     connection.execute(
         '''
-        UPDATE sources
-        SET source_type = COALESCE(NULLIF(TRIM(source_type), ''), 'manual')
+        CREATE INDEX IF NOT EXISTS idx_sources_actor_fingerprint
+        ON sources(actor_id, source_fingerprint)
         '''
     )
     connection.execute(
         '''
-        CREATE INDEX IF NOT EXISTS idx_sources_actor_fingerprint
-        ON sources(actor_id, source_fingerprint)
+        CREATE INDEX IF NOT EXISTS idx_sources_actor_recency
+        ON sources(actor_id, COALESCE(published_at, ingested_at, retrieved_at) DESC)
         '''
     )
     connection.execute(
@@ -525,6 +527,12 @@ def ensure_schema(connection) -> None:
         ON source_entities(source_id, entity_type)
         '''
     )
+    connection.execute(
+        '''
+        CREATE INDEX IF NOT EXISTS idx_source_entities_type_value
+        ON source_entities(entity_type, normalized_value, source_id)
+        '''
+    )
     connection.execute(
         '''
         CREATE TABLE IF NOT EXISTS actor_resolution (
@@ -661,6 +669,12 @@ def ensure_schema(connection) -> None:
         connection.execute("ALTER TABLE timeline_events ADD COLUMN target_text TEXT NOT NULL DEFAULT ''")
     if not any(col[1] == 'ttp_ids_json' for col in timeline_cols):
         connection.execute("ALTER TABLE timeline_events ADD COLUMN ttp_ids_json TEXT NOT NULL DEFAULT '[]'")
+    connection.execute(
+        '''
+        CREATE INDEX IF NOT EXISTS idx_timeline_events_actor_occurred
+        ON timeline_events(actor_id, occurred_at)
+        '''
+    )
     connection.execute(
         '''
         CREATE TABLE IF NOT EXISTS question_threads (
@@ -685,6 +699,37 @@ def ensure_schema(connection) -> None:
         )
         '''
     )
+    connection.execute(
+        '''
+        CREATE INDEX IF NOT EXISTS idx_question_threads_actor_updated
+        ON question_threads(actor_id, updated_at)
+        '''
+    )
+    connection.execute(
+        '''
+        CREATE INDEX IF NOT EXISTS idx_question_updates_thread_created
+        ON question_updates(thread_id, created_at)
+        '''
+    )
+    if connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_question_updates_thread_source_excerpt'"
+    ).fetchone() is None:
+        connection.execute(
+            '''
+            DELETE FROM question_updates
+            WHERE rowid NOT IN (
+                SELECT MIN(rowid)
+                FROM question_updates
+                GROUP BY thread_id, source_id, trigger_excerpt
+            )
+            '''
+        )
+        connection.execute(
+            '''
+            CREATE UNIQUE INDEX idx_question_updates_thread_source_excerpt
+            ON question_updates(thread_id, source_id, trigger_excerpt)
+            '''
+        )
     connection.execute(
         '''
         CREATE TABLE IF NOT EXISTS environment_guidance (
@@ -776,43 +821,6 @@ def ensure_schema(connection) -> None:
         connection.execute("ALTER TABLE ioc_items ADD COLUMN is_active INTEGER NOT NULL DEFAULT 1")
     if not any(col[1] == 'updated_at' for col in ioc_cols):
         connection.execute("ALTER TABLE ioc_items ADD COLUMN updated_at TEXT")
-    connection.execute(
-        '''
-        UPDATE ioc_items
-        SET
-            ioc_type = LOWER(TRIM(ioc_type)),
-            normalized_value = COALESCE(NULLIF(normalized_value, ''), LOWER(TRIM(ioc_value))),
-            validation_status = CASE
-                WHEN TRIM(COALESCE(validation_status, '')) = '' THEN 'unvalidated'
-                ELSE validation_status
-            END,
-            first_seen_at = COALESCE(first_seen_at, created_at),
-            last_seen_at = COALESCE(last_seen_at, created_at),
-            updated_at = COALESCE(updated_at, created_at),
-            seen_count = CASE WHEN seen_count IS NULL OR seen_count < 1 THEN 1 ELSE seen_count END,
-            lifecycle_status = CASE
-                WHEN LOWER(TRIM(COALESCE(lifecycle_status, ''))) IN ('active', 'monitor', 'superseded', 'revoked', 'false_positive')
-                    THEN LOWER(TRIM(lifecycle_status))
-                ELSE 'active'
-            END,
-            handling_tlp = CASE
-                WHEN UPPER(TRIM(COALESCE(handling_tlp, ''))) IN ('TLP:CLEAR', 'TLP:GREEN', 'TLP:AMBER', 'TLP:AMBER+STRICT', 'TLP:RED')
-                    THEN UPPER(TRIM(handling_tlp))
-                ELSE 'TLP:CLEAR'
-            END,
-            valid_from = COALESCE(valid_from, first_seen_at, created_at),
-            revoked = CASE
-                WHEN LOWER(TRIM(COALESCE(lifecycle_status, ''))) IN ('revoked', 'false_positive') THEN 1
-                WHEN revoked IS NULL THEN 0
-                ELSE revoked
-            END,
-            revoked_at = CASE
-                WHEN LOWER(TRIM(COALESCE(lifecycle_status, ''))) IN ('revoked', 'false_positive') AND COALESCE(revoked_at, '') = ''
-                    THEN COALESCE(updated_at, created_at)
-                ELSE revoked_at
-            END
-        '''
-    )
     connection.execute(
         '''
         CREATE UNIQUE INDEX IF NOT EXISTS idx_ioc_items_actor_type_normalized
@@ -903,6 +911,12 @@ def ensure_schema(connection) -> None:
         connection.execute("ALTER TABLE requirement_items ADD COLUMN validation_score INTEGER NOT NULL DEFAULT 0")
     if not any(col[1] == 'validation_notes' for col in requirement_cols):
         connection.execute("ALTER TABLE requirement_items ADD COLUMN validation_notes TEXT NOT NULL DEFAULT ''")
+    connection.execute(
+        '''
+        CREATE INDEX IF NOT EXISTS idx_requirement_items_actor_created
+        ON requirement_items(actor_id, created_at)
+        '''
+    )
     connection.execute(
         '''
         CREATE TABLE IF NOT EXISTS analyst_observations (
@@ -930,16 +944,6 @@ def ensure_schema(connection) -> None:
         connection.execute("ALTER TABLE analyst_observations ADD COLUMN citation_url TEXT NOT NULL DEFAULT ''")
     if not any(col[1] == 'observed_on' for col in obs_cols):
         connection.execute("ALTER TABLE analyst_observations ADD COLUMN observed_on TEXT NOT NULL DEFAULT ''")
-    connection.execute(
-        '''
-        UPDATE analyst_observations
-        SET claim_type = CASE
-            WHEN LOWER(TRIM(COALESCE(claim_type, ''))) IN ('evidence', 'assessment')
-                THEN LOWER(TRIM(claim_type))
-            ELSE 'assessment'
-        END
-        '''
-    )
     connection.execute(
         '''
         CREATE UNIQUE INDEX IF NOT EXISTS idx_observations_actor_item
@@ -973,16 +977,6 @@ def ensure_schema(connection) -> None:
         connection.execute("ALTER TABLE analyst_observation_history ADD COLUMN citation_url TEXT NOT NULL DEFAULT ''")
     if not any(col[1] == 'observed_on' for col in obs_hist_cols):
         connection.execute("ALTER TABLE analyst_observation_history ADD COLUMN observed_on TEXT NOT NULL DEFAULT ''")
-    connection.execute(
-        '''
-        UPDATE analyst_observation_history
-        SET claim_type = CASE
-            WHEN LOWER(TRIM(COALESCE(claim_type, ''))) IN ('evidence', 'assessment')
-                THEN LOWER(TRIM(claim_type))
-            ELSE 'assessment'
-        END
-        '''
-    )
     connection.execute(
         '''
         CREATE INDEX IF NOT EXISTS idx_observation_history_actor_item_updated
@@ -1135,6 +1129,290 @@ def ensure_schema(connection) -> None:
         ON llm_synthesis_cache(actor_key, updated_at DESC)
         '''
     )
+
+
+def _rowid_chunks(connection, table: str) -> Iterator[tuple[int, int]]:
+    """Yield ``(after_rowid, last_rowid)`` ranges covering ``table`` in SCHEMA_BACKFILL_CHUNK_ROWS steps."""
+    last_rowid = -(2**63)
+    # {table} is a table name from this module's migrations — never user input — safe from SQL injection.
+    while True:
+        row = connection.execute(
+            f'SELECT MAX(rowid) FROM (SELECT rowid FROM {table} WHERE rowid > ? ORDER BY rowid LIMIT ?)',  # nosec B608
+            (last_rowid, SCHEMA_BACKFILL_CHUNK_ROWS),
+        ).fetchone()
+        if row is None or row[0] is None:
+            return
+        upper_rowid = int(row[0])
+        yield last_rowid, upper_rowid
+        last_rowid = upper_rowid
+
+
+def _backfill_in_chunks(connection, table: str, assignments: list[tuple[str, str]]) -> int:
+    """Apply ``assignments`` to ``table`` in rowid ranges, committing each chunk.
+
+    Only rows where some column would change are rewritten, so re-running an
+    interrupted backfill touches just the rows it had not reached yet.
+    """
+    set_sql = ', '.join(f'{column} = {expression}' for column, expression in assignments)
+    changed_sql = ' OR '.join(f'{column} IS NOT ({expression})' for column, expression in assignments)
+    updated = 0
+    # table and assignments are literals from this module's migrations — never user input — safe from SQL injection.
+    for after_rowid, upper_rowid in _rowid_chunks(connection, table):
+        cursor = connection.execute(
+            f'UPDATE {table} SET {set_sql} WHERE rowid > ? AND rowid <= ? AND ({changed_sql})',  # nosec B608
+            (after_rowid, upper_rowid),
+        )
+        updated += max(0, cursor.rowcount)
+        connection.commit()
+    return updated
+
+
+def _backfill_actor_canonical_names(connection) -> None:
+    _backfill_in_chunks(
+        connection,
+        'actor_profiles',
+        [
+            (
+                'canonical_name',
+                "CASE WHEN COALESCE(TRIM(canonical_name), '') = '' THEN LOWER(TRIM(display_name)) ELSE canonical_name END",
+            ),
+        ],
+    )
+
+
+def _backfill_source_dates_and_types(connection) -> None:
+    _backfill_in_chunks(
+        connection,
+        'sources',
+        [
+            ('ingested_at', "COALESCE(NULLIF(ingested_at, ''), retrieved_at)"),
+            (
+                'source_date_type',
+                '''CASE
+                    WHEN COALESCE(TRIM(source_date_type), '') <> '' THEN source_date_type
+                    WHEN COALESCE(TRIM(published_at), '') <> '' THEN 'published'
+                    ELSE 'ingested'
+                END''',
+            ),
+            ('source_type', "COALESCE(NULLIF(TRIM(source_type), ''), 'manual')"),
+        ],
+    )
+
+
+def _normalize_ioc_items(connection) -> None:
+    _backfill_in_chunks(
+        connection,
+        'ioc_items',
+        [
+            ('ioc_type', 'LOWER(TRIM(ioc_type))'),
+            ('normalized_value', "COALESCE(NULLIF(normalized_value, ''), LOWER(TRIM(ioc_value)))"),
+            (
+                'validation_status',
+                '''CASE
+                    WHEN TRIM(COALESCE(validation_status, '')) = '' THEN 'unvalidated'
+                    ELSE validation_status
+                END''',
+            ),
+            ('first_seen_at', 'COALESCE(first_seen_at, created_at)'),
+            ('last_seen_at', 'COALESCE(last_seen_at, created_at)'),
+            ('updated_at', 'COALESCE(updated_at, created_at)'),
+            ('seen_count', 'CASE WHEN seen_count IS NULL OR seen_count < 1 THEN 1 ELSE seen_count END'),
+            (
+                'lifecycle_status',
+                '''CASE
+                    WHEN LOWER(TRIM(COALESCE(lifecycle_status, ''))) IN ('active', 'monitor', 'superseded', 'revoked', 'false_positive')
+                        THEN LOWER(TRIM(lifecycle_status))
+                    ELSE 'active'
+                END''',
+            ),
+            (
+                'handling_tlp',
+                '''CASE
+                    WHEN UPPER(TRIM(COALESCE(handling_tlp, ''))) IN ('TLP:CLEAR', 'TLP:GREEN', 'TLP:AMBER', 'TLP:AMBER+STRICT', 'TLP:RED')
+                        THEN UPPER(TRIM(handling_tlp))
+                    ELSE 'TLP:CLEAR'
+                END''',
+            ),
+            ('valid_from', 'COALESCE(valid_from, first_seen_at, created_at)'),
+            (
+                'revoked',
+                '''CASE
+                    WHEN LOWER(TRIM(COALESCE(lifecycle_status, ''))) IN ('revoked', 'false_positive') THEN 1
+                    WHEN revoked IS NULL THEN 0
+                    ELSE revoked
+                END''',
+            ),
+            (
+                'revoked_at',
+                '''CASE
+                    WHEN LOWER(TRIM(COALESCE(lifecycle_status, ''))) IN ('revoked', 'false_positive') AND COALESCE(revoked_at, '') = ''
+                        THEN COALESCE(updated_at, created_at)
+                    ELSE revoked_at
+                END''',
+            ),
+        ],
+    )
+
+
+def _normalize_observation_claim_types(connection) -> None:
+    claim_type = '''CASE
+        WHEN LOWER(TRIM(COALESCE(claim_type, ''))) IN ('evidence', 'assessment')
+            THEN LOWER(TRIM(claim_type))
+        ELSE 'assessment'
+    END'''
+    _backfill_in_chunks(connection, 'analyst_observations', [('claim_type', claim_type)])
+    _backfill_in_chunks(connection, 'analyst_observation_history', [('claim_type', claim_type)])
+
+
+# Analyst-searchable text, indexed by external-content FTS5 tables keyed by the
+# base table's rowid: fts table -> (base table, indexed columns, bm25 weights).
+SEARCH_INDEXES: dict[str, tuple[str, tuple[str, ...], str]] = {
+    'sources_fts': ('sources', ('title', 'source_name', 'pasted_text'), 'bm25(4.0, 2.0, 1.0)'),
+    'timeline_events_fts': ('timeline_events', ('title', 'summary'), 'bm25(3.0, 1.0)'),
+    'analyst_observations_fts': ('analyst_observations', ('item_key', 'note'), 'bm25(2.0, 1.0)'),
+}
+
+
+def _create_search_indexes(connection) -> None:
+    # Table and column names come from the SEARCH_INDEXES constant — never user input — safe from SQL injection.
+    for fts_table, (table, columns, rank) in SEARCH_INDEXES.items():
+        column_sql = ', '.join(columns)
+        new_sql = ', '.join(f'new.{column}' for column in columns)
+        old_sql = ', '.join(f'old.{column}' for column in columns)
+        connection.execute(
+            f'''
+            CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table}
+            USING fts5({column_sql}, content='{table}', tokenize='unicode61 remove_diacritics 2')
+            '''  # nosec B608
+        )
+        connection.execute(f"INSERT INTO {fts_table} ({fts_table}, rank) VALUES ('rank', ?)", (rank,))  # nosec B608
+        # Start from empty so a re-run after an interrupted backfill cannot double-index rows.
+        connection.execute(f"INSERT INTO {fts_table} ({fts_table}) VALUES ('delete-all')")  # nosec B608
+        for after_rowid, upper_rowid in _rowid_chunks(connection, table):
+            connection.execute(
+                f'''
+                INSERT INTO {fts_table} (rowid, {column_sql})
+                SELECT rowid, {column_sql} FROM {table}
+                WHERE rowid > ? AND rowid <= ?
+                ''',  # nosec B608
+                (after_rowid, upper_rowid),
+            )
+            connection.commit()
+        connection.execute(
+            f'''
+            CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {table} BEGIN
+                INSERT INTO {fts_table} (rowid, {column_sql}) VALUES (new.rowid, {new_sql});
+            END
+            '''  # nosec B608
+        )
+        connection.execute(
+            f'''
+            CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {table} BEGIN
+                INSERT INTO {fts_table} ({fts_table}, rowid, {column_sql}) VALUES ('delete', old.rowid, {old_sql});
+            END
+            '''  # nosec B608
+        )
+        connection.execute(
+            f'''
+            CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE OF {column_sql} ON {table} BEGIN
+                INSERT INTO {fts_table} ({fts_table}, rowid, {column_sql}) VALUES ('delete', old.rowid, {old_sql});
+                INSERT INTO {fts_table} (rowid, {column_sql}) VALUES (new.rowid, {new_sql});
+            END
+            '''  # nosec B608
+        )
+
+
+def rebuild_search_indexes(connection) -> None:
+    """Re-read every search index from its base table, e.g. after a full VACUUM renumbers rowids."""
+    # {fts_table} is a SEARCH_INDEXES key — never user input — safe from SQL injection.
+    for fts_table in SEARCH_INDEXES:
+        connection.execute(f"INSERT INTO {fts_table} ({fts_table}) VALUES ('rebuild')")  # nosec B608
+    connection.commit()
+
+
+def _realign_source_sentence_actors(connection) -> None:
+    # Actor merges used to move sources without their indexed sentences.
+    _backfill_in_chunks(
+        connection,
+        'source_sentences',
+        [
+            (
+                'actor_id',
+                'COALESCE((SELECT s.actor_id FROM sources s WHERE s.id = source_sentences.source_id), actor_id)',
+            ),
+        ],
+    )
+
+
+# Numbered migrations, applied in order and recorded in schema_meta as
+# ``migration.NNNN``. Append new ones; never renumber or edit an applied one.
+SCHEMA_MIGRATIONS: tuple[tuple[int, str, Callable[[sqlite3.Connection], None]], ...] = (
+    (1, 'base_schema', _apply_base_schema),
+    (2, 'backfill_actor_canonical_names', _backfill_actor_canonical_names),
+    (3, 'backfill_source_dates_and_types', _backfill_source_dates_and_types),
+    (4, 'normalize_ioc_items', _normalize_ioc_items),
+    (5, 'normalize_observation_claim_types', _normalize_observation_claim_types),
+    (6, 'create_search_indexes', _create_search_indexes),
+    (7, 'realign_source_sentence_actors', _realign_source_sentence_actors),
+)
+SCHEMA_VERSION = SCHEMA_MIGRATIONS[-1][0]
+
+
+def _recorded_schema_version(connection) -> str:
+    try:
+        row = connection.execute("SELECT value FROM schema_meta WHERE key = 'schema_version'").fetchone()
+    except sqlite3.OperationalError:
+        return ''
+    return str(row[0] if row else '')
+
+
+def _record_schema_meta(connection, key: str, value: str) -> None:
+    connection.execute(
+        '''
+        INSERT INTO schema_meta (key, value, updated_at)
+        VALUES (?, ?, datetime('now'))
+        ON CONFLICT(key) DO UPDATE SET
+            value = excluded.value,
+            updated_at = excluded.updated_at
+        ''',
+        (key, value),
+    )
+
+
+def ensure_schema(connection) -> None:
+    """Apply pending schema migrations; a database already at SCHEMA_VERSION costs one lookup.
+
+    Databases from before numbered migrations (``schema_version`` recorded as a
+    date string) replay every migration once, which is safe because migration 1
+    is idempotent and the backfills only rewrite rows that still need them.
+    """
+    if _recorded_schema_version(connection) == str(SCHEMA_VERSION):
+        return
+    if connection.execute('SELECT COUNT(*) FROM sqlite_master').fetchone()[0] == 0:
+        # auto_vacuum can only be chosen before the first table is created; data
+        # retention reclaims free pages with PRAGMA incremental_vacuum.
+        connection.execute('PRAGMA auto_vacuum = INCREMENTAL')
+    connection.execute(
+        '''
+        CREATE TABLE IF NOT EXISTS schema_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+        '''
+    )
+    applied = {
+        str(row[0])
+        for row in connection.execute("SELECT key FROM schema_meta WHERE key LIKE 'migration.%'").fetchall()
+    }
+    for number, name, migrate in SCHEMA_MIGRATIONS:
+        key = f'migration.{number:04d}'
+        if key in applied:
+            continue
+        migrate(connection)
+        _record_schema_meta(connection, key, name)
+        connection.commit()
+    _record_schema_meta(connection, 'schema_version', str(SCHEMA_VERSION))
     connection.commit()
 
 
@@ -1144,9 +1422,13 @@ def initialize_sqlite_core(*, deps: dict[str, object]) -> str:
     _clear_mitre_store_cache = deps['clear_mitre_store_cache']
     _reset_app_mitre_caches = deps['reset_app_mitre_caches']
     _ensure_mitre_attack_dataset = deps['ensure_mitre_attack_dataset']
+    _configure_db_connections = deps['configure_db_connections']
+    _enable_sqlite_wal = deps['enable_sqlite_wal']
     _sqlite_connect = deps['sqlite_connect']
 
     db_path = _resolve_startup_db_path()
+    _configure_db_connections()
+    _enable_sqlite_wal(db_path)
     _configure_mitre_store(db_path)
     _clear_mitre_store_cache()
     _reset_app_mitre_caches()
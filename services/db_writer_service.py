@@ -0,0 +1,215 @@
+import asyncio
+import itertools
+import logging
+import queue
+import sqlite3
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+
+import services.db_connection_service as db_connection_service
+
+LOGGER = logging.getLogger(__name__)
+
+DB_WRITE_QUEUE_MAX_UNITS = 1024
+DB_WRITE_BATCH_MAX_UNITS = 64
+
+_PRIORITY_HIGH = 0
+_PRIORITY_NORMAL = 1
+_PRIORITY_STOP = 2
+_UNIT_SAVEPOINT = 'db_write_unit'
+
+_WRITER_LOCK = threading.Lock()
+_WRITER_QUEUE: queue.PriorityQueue | None = None
+_WRITER_THREAD: threading.Thread | None = None
+_WRITER_SEQUENCE = itertools.count()
+_WRITER_STATE = threading.local()
+_WRITER_STATS = {'batches': 0, 'units': 0, 'failed_units': 0}
+
+
+class _WriteUnit:
+    __slots__ = ('db_path', 'fn', 'future')
+
+    def __init__(self, db_path: str, fn: Callable[[sqlite3.Connection], object]) -> None:
+        self.db_path = db_path
+        self.fn = fn
+        self.future: Future = Future()
+
+
+class _UnitConnection:
+    """Connection handed to a write unit; commit() is deferred to the batch."""
+
+    __slots__ = ('_connection',)
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        object.__setattr__(self, '_connection', connection)
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self._connection, name)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        setattr(self._connection, name, value)
+
+    def commit(self) -> None:
+        return None
+
+    def rollback(self) -> None:
+        self._connection.execute(f'ROLLBACK TO {_UNIT_SAVEPOINT}')
+
+
+def _run_batch(db_path: str, batch: list[_WriteUnit]) -> None:
+    live_units = [unit for unit in batch if unit.future.set_running_or_notify_cancel()]
+    if not live_units:
+        return
+    outcomes: list[tuple[bool, object]] = []
+    try:
+        with db_connection_service.connect_core(db_path) as connection:
+            connection.execute('BEGIN IMMEDIATE')
+            _WRITER_STATE.db_path = db_path
+            _WRITER_STATE.connection = connection
+            for unit in live_units:
+                # Each unit gets a savepoint so a failing unit only undoes its own writes.
+                connection.execute(f'SAVEPOINT {_UNIT_SAVEPOINT}')
+                try:
+                    outcomes.append((True, unit.fn(_UnitConnection(connection))))
+                except Exception as exc:
+                    connection.execute(f'ROLLBACK TO {_UNIT_SAVEPOINT}')
+                    outcomes.append((False, exc))
+                finally:
+                    connection.row_factory = None
+                connection.execute(f'RELEASE {_UNIT_SAVEPOINT}')
+    except Exception as exc:
+        LOGGER.warning('db write batch of %d units failed: %s', len(live_units), exc)
+        for unit in live_units:
+            unit.future.set_exception(exc)
+        with _WRITER_LOCK:
+            _WRITER_STATS['batches'] += 1
+            _WRITER_STATS['units'] += len(live_units)
+            _WRITER_STATS['failed_units'] += len(live_units)
+        return
+    finally:
+        _WRITER_STATE.db_path = None
+        _WRITER_STATE.connection = None
+    for unit, (ok, value) in zip(live_units, outcomes):
+        if ok:
+            unit.future.set_result(value)
+        else:
+            unit.future.set_exception(value)
+    with _WRITER_LOCK:
+        _WRITER_STATS['batches'] += 1
+        _WRITER_STATS['units'] += len(live_units)
+        _WRITER_STATS['failed_units'] += sum(1 for ok, _ in outcomes if not ok)
+
+
+def _writer_loop(write_queue: queue.PriorityQueue) -> None:
+    carried: _WriteUnit | None = None
+    stopping = False
+    while True:
+        if carried is not None:
+            first, carried = carried, None
+        elif stopping:
+            break
+        else:
+            first = write_queue.get()[2]
+            if first is None:
+                break
+        batch = [first]
+        while len(batch) < DB_WRITE_BATCH_MAX_UNITS:
+            try:
+                unit = write_queue.get_nowait()[2]
+            except queue.Empty:
+                break
+            if unit is None:
+                stopping = True
+                break
+            if unit.db_path != first.db_path:
+                carried = unit
+                break
+            batch.append(unit)
+        _run_batch(first.db_path, batch)
+    db_connection_service.close_thread_connections_core()
+
+
+def _writer_queue() -> queue.PriorityQueue:
+    global _WRITER_QUEUE, _WRITER_THREAD
+    with _WRITER_LOCK:
+        if _WRITER_QUEUE is None or _WRITER_THREAD is None or not _WRITER_THREAD.is_alive():
+            _WRITER_QUEUE = queue.PriorityQueue(maxsize=DB_WRITE_QUEUE_MAX_UNITS)
+            _WRITER_THREAD = threading.Thread(
+                target=_writer_loop,
+                args=(_WRITER_QUEUE,),
+                daemon=True,
+                name='db-writer',
+            )
+            _WRITER_THREAD.start()
+        return _WRITER_QUEUE
+
+
+def submit_write_core(
+    db_path: str,
+    fn: Callable[[sqlite3.Connection], object],
+    *,
+    priority: bool = False,
+) -> Future:
+    """Queue ``fn(connection)`` for the writer thread and return its completion future.
+
+    Queued units for the same database are group-committed in one short
+    transaction; ``priority`` units jump ahead of background writes. Submitting
+    blocks while the queue is full.
+    """
+    unit = _WriteUnit(str(db_path), fn)
+    rank = _PRIORITY_HIGH if priority else _PRIORITY_NORMAL
+    _writer_queue().put((rank, next(_WRITER_SEQUENCE), unit))
+    return unit.future
+
+
+def run_write_core(
+    db_path: str,
+    fn: Callable[[sqlite3.Connection], object],
+    *,
+    priority: bool = False,
+    timeout: float | None = None,
+) -> object:
+    """Run ``fn(connection)`` on the writer thread and return its result once committed.
+
+    Exceptions raised by ``fn`` are re-raised here after its writes are rolled
+    back. Calls made from inside a write unit run inline in that unit.
+    """
+    connection = getattr(_WRITER_STATE, 'connection', None)
+    if connection is not None:
+        if _WRITER_STATE.db_path == str(db_path):
+            return fn(_UnitConnection(connection))
+        with db_connection_service.connect_core(db_path) as other_connection:
+            return fn(other_connection)
+    return submit_write_core(db_path, fn, priority=priority).result(timeout=timeout)
+
+
+async def run_write_async_core(
+    db_path: str,
+    fn: Callable[[sqlite3.Connection], object],
+    *,
+    priority: bool = False,
+) -> object:
+    """Await ``fn(connection)`` on the writer thread without blocking the event loop."""
+    return await asyncio.wrap_future(submit_write_core(db_path, fn, priority=priority))
+
+
+def db_writer_stats_core() -> dict[str, int]:
+    with _WRITER_LOCK:
+        stats = dict(_WRITER_STATS)
+        stats['queued'] = _WRITER_QUEUE.qsize() if _WRITER_QUEUE is not None else 0
+    return stats
+
+
+def shutdown_db_writer_core(*, wait: bool = True, timeout: float | None = 5.0) -> None:
+    """Stop the writer thread after the units already queued have been committed."""
+    global _WRITER_QUEUE, _WRITER_THREAD
+    with _WRITER_LOCK:
+        write_queue, thread = _WRITER_QUEUE, _WRITER_THREAD
+        _WRITER_QUEUE = None
+        _WRITER_THREAD = None
+    if write_queue is None or thread is None:
+        return
+    write_queue.put((_PRIORITY_STOP, next(_WRITER_SEQUENCE), None))
+    if wait:
+        thread.join(timeout=timeout)
@@ -0,0 +1,76 @@
+import logging
+import multiprocessing
+# Only used to check that a callable can be sent to a worker; nothing is unpickled here.
+import pickle  # nosec B403
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from threading import Lock
+
+LOGGER = logging.getLogger(__name__)
+
+EXTRACTION_CHUNK_SIZE = 32
+
+_EXTRACTION_POOL_LOCK = Lock()
+_EXTRACTION_POOL: ProcessPoolExecutor | None = None
+_EXTRACTION_POOL_WORKERS = 0
+
+
+def _run_chunk(fn: Callable[..., object], chunk: list[tuple[object, ...]]) -> list[object]:
+    return [fn(*args) for args in chunk]
+
+
+def _extraction_pool(workers: int) -> ProcessPoolExecutor:
+    global _EXTRACTION_POOL, _EXTRACTION_POOL_WORKERS
+    with _EXTRACTION_POOL_LOCK:
+        if _EXTRACTION_POOL is None or _EXTRACTION_POOL_WORKERS != workers:
+            if _EXTRACTION_POOL is not None:
+                _EXTRACTION_POOL.shutdown(wait=False)
+            # Forking a threaded web process can copy held locks; forkserver/spawn start clean.
+            start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            _EXTRACTION_POOL = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(start_method),
+            )
+            _EXTRACTION_POOL_WORKERS = workers
+        return _EXTRACTION_POOL
+
+
+def shutdown_extraction_pool_core() -> None:
+    global _EXTRACTION_POOL, _EXTRACTION_POOL_WORKERS
+    with _EXTRACTION_POOL_LOCK:
+        if _EXTRACTION_POOL is not None:
+            _EXTRACTION_POOL.shutdown(wait=False, cancel_futures=True)
+        _EXTRACTION_POOL = None
+        _EXTRACTION_POOL_WORKERS = 0
+
+
+def map_extraction_core(
+    fn: Callable[..., object],
+    items: list[tuple[object, ...]],
+    *,
+    workers: int,
+    chunk_size: int = EXTRACTION_CHUNK_SIZE,
+) -> list[object]:
+    """Apply ``fn(*args)`` to every item, in input order.
+
+    With ``workers > 1`` the items are split into chunks that run in a shared
+    process pool. Small inputs and callables that cannot be pickled by
+    reference run inline, and so does everything after the pool breaks.
+    """
+    safe_chunk_size = max(1, int(chunk_size))
+    safe_workers = max(0, int(workers))
+    if safe_workers <= 1 or len(items) <= safe_chunk_size:
+        return _run_chunk(fn, items)
+    try:
+        pickle.dumps(fn)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return _run_chunk(fn, items)
+    chunks = [items[start:start + safe_chunk_size] for start in range(0, len(items), safe_chunk_size)]
+    try:
+        chunk_results = list(_extraction_pool(safe_workers).map(_run_chunk, [fn] * len(chunks), chunks))
+    except BrokenProcessPool:
+        LOGGER.warning('extraction process pool failed; running %d items inline', len(items))
+        shutdown_extraction_pool_core()
+        return _run_chunk(fn, items)
+    return [result for chunk_result in chunk_results for result in chunk_result]
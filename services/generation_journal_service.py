@@ -1,6 +1,9 @@
 import sqlite3
 from datetime import datetime, timedelta, timezone
 
+import services.db_connection_service as db_connection_service
+import services.db_writer_service as db_writer_service
+
 
 def create_generation_job_core(
     *,
@@ -19,7 +22,8 @@ def create_generation_job_core(
     if normalized_status not in {'queued', 'running', 'completed', 'error', 'skipped'}:
         normalized_status = 'running'
     started_at = now_iso if normalized_status == 'running' else None
-    with sqlite3.connect(_db_path()) as connection:
+
+    def _write(connection) -> None:
         connection.execute(
             '''
             INSERT INTO notebook_generation_jobs (
@@ -36,7 +40,8 @@ def create_generation_job_core(
                 started_at,
             ),
         )
-        connection.commit()
+
+    db_writer_service.run_write_core(_db_path(), _write)
     return str(job_id)
 
 
@@ -44,7 +49,8 @@ def mark_generation_job_started_core(*, job_id: str, deps: dict[str, object]) ->
     _db_path = deps['db_path']
     _utc_now_iso = deps['utc_now_iso']
     now_iso = _utc_now_iso()
-    with sqlite3.connect(_db_path()) as connection:
+
+    def _write(connection) -> None:
         connection.execute(
             '''
             UPDATE notebook_generation_jobs
@@ -54,7 +60,8 @@ def mark_generation_job_started_core(*, job_id: str, deps: dict[str, object]) ->
             ''',
             (now_iso, str(job_id)),
         )
-        connection.commit()
+
+    db_writer_service.run_write_core(_db_path(), _write)
 
 
 def finalize_generation_job_core(
@@ -69,7 +76,8 @@ def finalize_generation_job_core(
 ) -> None:
     _db_path = deps['db_path']
     _utc_now_iso = deps['utc_now_iso']
-    with sqlite3.connect(_db_path()) as connection:
+
+    def _write(connection) -> None:
         connection.execute(
             '''
             UPDATE notebook_generation_jobs
@@ -91,7 +99,8 @@ def finalize_generation_job_core(
                 str(job_id),
             ),
         )
-        connection.commit()
+
+    db_writer_service.run_write_core(_db_path(), _write)
 
 
 def start_generation_phase_core(
@@ -108,7 +117,8 @@ def start_generation_phase_core(
     _new_id = deps['new_id']
     _utc_now_iso = deps['utc_now_iso']
     phase_id = _new_id()
-    with sqlite3.connect(_db_path()) as connection:
+
+    def _write(connection) -> None:
         connection.execute(
             '''
             INSERT INTO notebook_generation_phases (
@@ -128,7 +138,8 @@ def start_generation_phase_core(
                 _utc_now_iso(),
             ),
         )
-        connection.commit()
+
+    db_writer_service.run_write_core(_db_path(), _write)
     return str(phase_id)
 
 
@@ -143,7 +154,8 @@ def finish_generation_phase_core(
 ) -> None:
     _db_path = deps['db_path']
     _utc_now_iso = deps['utc_now_iso']
-    with sqlite3.connect(_db_path()) as connection:
+
+    def _write(connection) -> None:
         connection.execute(
             '''
             UPDATE notebook_generation_phases
@@ -163,7 +175,8 @@ def finish_generation_phase_core(
                 str(phase_id),
             ),
         )
-        connection.commit()
+
+    db_writer_service.run_write_core(_db_path(), _write)
 
 
 def recent_generation_timeline_for_actor_core(
@@ -175,7 +188,7 @@ def recent_generation_timeline_for_actor_core(
 ) -> list[dict[str, object]]:
     _db_path = deps['db_path']
     rows: list[sqlite3.Row]
-    with sqlite3.connect(_db_path()) as connection:
+    with db_connection_service.connect_core(_db_path()) as connection:
         connection.row_factory = sqlite3.Row
         rows = connection.execute(
             '''
@@ -232,7 +245,7 @@ def recent_generation_timeline_for_actor_core(
 
 def active_generation_job_for_actor_core(*, actor_id: str, deps: dict[str, object]) -> dict[str, object] | None:
     _db_path = deps['db_path']
-    with sqlite3.connect(_db_path()) as connection:
+    with db_connection_service.connect_core(_db_path()) as connection:
         connection.row_factory = sqlite3.Row
         row = connection.execute(
             '''
@@ -298,7 +311,7 @@ def expire_stale_generation_jobs_for_actor_core(
         except Exception:
             return None
 
-    with sqlite3.connect(_db_path()) as connection:
+    def _write(connection) -> None:
         connection.row_factory = sqlite3.Row
         rows = connection.execute(
             '''
@@ -334,14 +347,14 @@ def expire_stale_generation_jobs_for_actor_core(
                 ''',
                 (now_iso, job_id),
             )
-        if expired_job_ids:
-            connection.commit()
+
+    db_writer_service.run_write_core(_db_path(), _write)
     return len(expired_job_ids)
 
 
 def generation_job_detail_core(*, actor_id: str, job_id: str, deps: dict[str, object]) -> dict[str, object] | None:
     _db_path = deps['db_path']
-    with sqlite3.connect(_db_path()) as connection:
+    with db_connection_service.connect_core(_db_path()) as connection:
         connection.row_factory = sqlite3.Row
         job_row = connection.execute(
             '''
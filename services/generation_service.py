@@ -70,6 +70,8 @@ def run_actor_llm_enrichment_core(*, actor_id: str, deps: dict[str, object]) ->
     _mark_finished = deps['mark_finished']
     _set_actor_notebook_status = deps['set_actor_notebook_status']
     _refresh_actor_notebook_uncached = deps['refresh_actor_notebook_uncached']
+    # Patching only the LLM sections of the cached snapshot keeps retries to the LLM calls.
+    _enrich_actor_notebook_llm = deps.get('enrich_actor_notebook_llm') or _refresh_actor_notebook_uncached
     _max_attempts = max(1, int(deps.get('max_attempts', 2)))
     _retry_sleep_seconds = max(1.0, float(deps.get('retry_sleep_seconds', 2.0)))
     _job_id = str(deps.get('job_id') or '')
@@ -99,7 +101,7 @@ def run_actor_llm_enrichment_core(*, actor_id: str, deps: dict[str, object]) ->
                         message='Adding AI summary in the background...',
                     )
                 )
-            notebook = _refresh_actor_notebook_uncached(actor_id)
+            notebook = _enrich_actor_notebook_llm(actor_id)
             if not isinstance(notebook, dict):
                 notebook = None
                 if callable(_finish_phase) and phase_id:
@@ -159,6 +161,9 @@ def run_actor_llm_enrichment_core(*, actor_id: str, deps: dict[str, object]) ->
                 duration_ms=int((time.perf_counter() - locals().get('phase_started_at', time.perf_counter())) * 1000),
             )
     finally:
+        _close_build_context = deps.get('close_build_context')
+        if callable(_close_build_context):
+            _close_build_context(actor_id)
         _mark_finished(actor_id)
 
 
@@ -199,6 +204,8 @@ def run_actor_generation_core(*, actor_id: str, deps: dict[str, object]) -> None
                 'trigger_type': _trigger_type,
                 'start_phase': _start_generation_phase,
                 'finish_phase': _finish_generation_phase,
+                'open_build_context': deps.get('open_build_context'),
+                'close_build_context': deps.get('close_build_context'),
             },
         )
         if callable(_finalize_generation_job) and job_id:
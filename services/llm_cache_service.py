@@ -1,5 +1,7 @@
 import json
-import sqlite3
+
+import services.db_connection_service as db_connection_service
+import services.db_writer_service as db_writer_service
 
 
 def actor_key_core(actor_name: str) -> str:
@@ -22,7 +24,7 @@ def load_cached_payload_core(
     _db_path = deps['db_path']
     _utc_now_iso = deps['utc_now_iso']
     row = None
-    with sqlite3.connect(_db_path()) as connection:
+    with db_connection_service.connect_core(_db_path()) as connection:
         row = connection.execute(
             '''
             SELECT payload_json, estimated_cost_ms
@@ -73,7 +75,8 @@ def save_cached_payload_core(
     max_rows_per_actor_kind = max(1, int(deps.get('max_rows_per_actor_kind', 300)))
     now_iso = _utc_now_iso()
     payload_json = json.dumps(payload, ensure_ascii=True, sort_keys=True, separators=(',', ':'))
-    with sqlite3.connect(_db_path()) as connection:
+
+    def _write(connection) -> None:
         connection.execute(
             '''
             INSERT INTO llm_synthesis_cache (
@@ -125,12 +128,13 @@ def save_cached_payload_core(
                 max_rows_per_actor_kind,
             ),
         )
-        connection.commit()
+
+    db_writer_service.run_write_core(_db_path(), _write)
 
 
 def cache_stats_for_actor_core(*, actor_key: str, deps: dict[str, object]) -> dict[str, int]:
     _db_path = deps['db_path']
-    with sqlite3.connect(_db_path()) as connection:
+    with db_connection_service.connect_core(_db_path()) as connection:
         row = connection.execute(
             '''
             SELECT
@@ -1,12 +1,20 @@
+from collections import deque
 from datetime import datetime, timezone
 from threading import Lock
+import math
 import re
 
+from services import notebook_service
+from services import text_utils_service
+
+
+STAGE_TIMING_RING_SIZE = 256
 
 _METRICS_LOCK = Lock()
 _COUNTERS: dict[str, int] = {}
 _REQUESTS_BY_ROUTE: dict[str, int] = {}
 _REQUESTS_BY_STATUS: dict[str, int] = {}
+_STAGE_TIMINGS: dict[str, deque[tuple[float, int | None, str]]] = {}
 
 
 def _inc_counter(name: str, amount: int = 1) -> None:
@@ -53,14 +61,64 @@ def record_feed_import_core(*, imported_count: int, success: bool) -> None:
         _inc_counter('feed_import_success_total' if success else 'feed_import_failed_total')
 
 
+def record_stage_timing_core(
+    *,
+    stage: str,
+    duration_ms: float,
+    rows: int | None = None,
+    actor_id: str = '',
+) -> None:
+    stage_key = str(stage or '').strip() or 'unknown'
+    sample = (max(0.0, float(duration_ms)), None if rows is None else int(rows), str(actor_id or ''))
+    with _METRICS_LOCK:
+        samples = _STAGE_TIMINGS.get(stage_key)
+        if samples is None:
+            samples = deque(maxlen=STAGE_TIMING_RING_SIZE)
+            _STAGE_TIMINGS[stage_key] = samples
+        samples.append(sample)
+
+
+def _percentile(sorted_values: list[float], percentile: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(percentile / 100.0 * len(sorted_values)))
+    return sorted_values[min(len(sorted_values), rank) - 1]
+
+
+def stage_timings_snapshot_core(*, actor_id: str | None = None) -> dict[str, dict[str, object]]:
+    with _METRICS_LOCK:
+        samples_by_stage = {stage: list(samples) for stage, samples in _STAGE_TIMINGS.items()}
+    snapshot: dict[str, dict[str, object]] = {}
+    for stage, samples in sorted(samples_by_stage.items()):
+        if actor_id is not None:
+            samples = [sample for sample in samples if sample[2] == actor_id]
+        if not samples:
+            continue
+        durations = sorted(sample[0] for sample in samples)
+        row_counts = [sample[1] for sample in samples if sample[1] is not None]
+        snapshot[stage] = {
+            'count': len(durations),
+            'p50_ms': round(_percentile(durations, 50), 2),
+            'p90_ms': round(_percentile(durations, 90), 2),
+            'p99_ms': round(_percentile(durations, 99), 2),
+            'max_ms': round(durations[-1], 2),
+            'avg_rows': round(sum(row_counts) / len(row_counts), 2) if row_counts else None,
+        }
+    return snapshot
+
+
 def snapshot_metrics_core() -> dict[str, object]:
     with _METRICS_LOCK:
-        return {
+        snapshot = {
             'generated_at': datetime.now(timezone.utc).isoformat(),
             'counters': dict(_COUNTERS),
             'requests_by_route': dict(_REQUESTS_BY_ROUTE),
             'requests_by_status': dict(_REQUESTS_BY_STATUS),
         }
+    snapshot['stage_timings'] = stage_timings_snapshot_core()
+    snapshot['text_cache'] = text_utils_service.text_cache_stats_core()
+    snapshot['notebook_revalidation'] = notebook_service.revalidation_snapshot_core()
+    return snapshot
 
 
 def reset_metrics_core() -> None:
@@ -68,3 +126,4 @@ def reset_metrics_core() -> None:
         _COUNTERS.clear()
         _REQUESTS_BY_ROUTE.clear()
         _REQUESTS_BY_STATUS.clear()
+        _STAGE_TIMINGS.clear()
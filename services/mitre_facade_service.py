@@ -1,5 +1,8 @@
+import logging
 from pathlib import Path
 
+LOGGER = logging.getLogger(__name__)
+
 
 def mitre_dataset_path_core(
     *,
@@ -18,6 +21,24 @@ def ensure_mitre_attack_dataset_core(*, with_mitre_store_sync, mitre_store) -> b
     return with_mitre_store_sync(lambda: mitre_store.ensure_mitre_attack_dataset())
 
 
+def refresh_mitre_attack_dataset_if_stale_core(*, max_age_seconds: float, configure_mitre_store, mitre_store) -> bool:
+    """Download a newer ATT&CK bundle when the local one is missing or older than ``max_age_seconds``."""
+    configure_mitre_store()
+    age_seconds = mitre_store.mitre_dataset_age_seconds()
+    if age_seconds is not None and age_seconds < max_age_seconds:
+        return False
+    return bool(mitre_store.refresh_mitre_attack_dataset())
+
+
+def mitre_refresh_loop_core(*, stop_event, loop_seconds: int, refresh_once) -> None:
+    while not stop_event.is_set():
+        try:
+            refresh_once()
+        except Exception as exc:
+            LOGGER.warning('MITRE ATT&CK refresh failed: %s', exc)
+        stop_event.wait(max(1, int(loop_seconds)))
+
+
 def load_mitre_groups_core(*, with_mitre_store_sync, mitre_store):
     return with_mitre_store_sync(lambda: mitre_store.load_mitre_groups())
 
@@ -139,9 +139,23 @@ def load_latest_cached_notebook_for_key_core(
     actor_id: str,
     cache_key: str,
 ) -> dict[str, object] | None:
+    payload, _updated_at = load_latest_cached_notebook_entry_core(
+        connection,
+        actor_id=actor_id,
+        cache_key=cache_key,
+    )
+    return payload
+
+
+def load_latest_cached_notebook_entry_core(
+    connection: sqlite3.Connection,
+    *,
+    actor_id: str,
+    cache_key: str,
+) -> tuple[dict[str, object] | None, str]:
     row = connection.execute(
         '''
-        SELECT payload_json
+        SELECT payload_json, updated_at
         FROM notebook_cache
         WHERE actor_id = ? AND cache_key = ?
         ORDER BY updated_at DESC
@@ -150,15 +164,30 @@ def load_latest_cached_notebook_for_key_core(
         (actor_id, cache_key),
     ).fetchone()
     if row is None:
-        return None
+        return None, ''
+    updated_at = str(row[1] or '')
     raw = str(row[0] or '').strip()
     if not raw:
-        return None
+        return None, updated_at
     try:
         payload = json.loads(raw)
-        return payload if isinstance(payload, dict) else None
+        return (payload if isinstance(payload, dict) else None), updated_at
     except Exception:
+        return None, updated_at
+
+
+def cache_entry_age_seconds_core(updated_at: str, *, now: datetime | None = None) -> float | None:
+    raw = str(updated_at or '').strip()
+    if not raw:
         return None
+    try:
+        parsed = datetime.fromisoformat(raw.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    reference = now or datetime.now(timezone.utc)
+    return max(0.0, (reference - parsed).total_seconds())
 
 
 def save_cached_notebook_core(
@@ -184,3 +213,24 @@ def save_cached_notebook_core(
         ''',
         (actor_id, cache_key, data_fingerprint, payload_json, now, now),
     )
+
+
+def update_cached_notebook_payload_core(
+    connection: sqlite3.Connection,
+    *,
+    actor_id: str,
+    cache_key: str,
+    data_fingerprint: str,
+    payload: dict[str, object],
+) -> bool:
+    """Replace the payload of an existing cache row only if it is still at ``data_fingerprint``."""
+    payload_json = json.dumps(payload, ensure_ascii=True, separators=(',', ':'), sort_keys=True)
+    cursor = connection.execute(
+        '''
+        UPDATE notebook_cache
+        SET payload_json = ?, updated_at = ?
+        WHERE actor_id = ? AND cache_key = ? AND data_fingerprint = ?
+        ''',
+        (payload_json, _utc_now_iso(), actor_id, cache_key, data_fingerprint),
+    )
+    return int(cursor.rowcount or 0) > 0
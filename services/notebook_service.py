@@ -1,9 +1,22 @@
-import sqlite3
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from threading import Lock
 
+import services.db_connection_service as db_connection_service
+import services.db_writer_service as db_writer_service
 from services import notebook_cache_service
 from services.notebook_contract_service import finalize_notebook_contract_core
 
+LOGGER = logging.getLogger(__name__)
+
+_REVALIDATE_LOCK = Lock()
+_REVALIDATE_INFLIGHT: set[tuple[str, str]] = set()
+_REVALIDATE_LAST_STARTED: dict[str, float] = {}
+_REVALIDATE_EXECUTOR: ThreadPoolExecutor | None = None
+_REVALIDATE_EXECUTOR_WORKERS = 0
+_REVALIDATE_TRACKED_MAX = 512
 
 def build_notebook_wrapper_core(
     *,
@@ -26,9 +39,7 @@ def build_notebook_wrapper_core(
         actor_terms_fn=deps['actor_terms_fn'],
         extract_major_move_events=deps['extract_major_move_events'],
         normalize_text=deps['normalize_text'],
-        token_overlap=deps['token_overlap'],
-        extract_question_sentences=deps['extract_question_sentences'],
-        sentence_mentions_actor_terms=deps['sentence_mentions_actor_terms'],
+        token_set=deps['token_set'],
         sanitize_question_text=deps['sanitize_question_text'],
         question_from_sentence=deps['question_from_sentence'],
         ollama_generate_questions=deps['ollama_generate_questions'],
@@ -36,6 +47,7 @@ def build_notebook_wrapper_core(
         guidance_for_platform=deps['guidance_for_platform'],
         ollama_enrich_quick_checks=deps.get('ollama_enrich_quick_checks'),
         store_quick_check_overrides=deps.get('store_quick_check_overrides'),
+        extraction_workers=int(deps.get('extraction_workers') or 0),
     )
 
 
@@ -67,6 +79,7 @@ def fetch_actor_notebook_wrapper_core(*, actor_id: str, deps: dict[str, object])
         'org_alignment_label': deps['org_alignment_label'],
         'fallback_priority_questions': deps['fallback_priority_questions'],
         'token_overlap': deps['token_overlap'],
+        'token_set': deps.get('token_set'),
         'build_actor_profile_from_mitre': deps['build_actor_profile_from_mitre'],
         'group_top_techniques': deps['group_top_techniques'],
         'favorite_attack_vectors': deps['favorite_attack_vectors'],
@@ -92,6 +105,8 @@ def fetch_actor_notebook_wrapper_core(*, actor_id: str, deps: dict[str, object])
         'run_cold_actor_backfill': deps.get('run_cold_actor_backfill'),
         'rebuild_notebook': deps.get('rebuild_notebook'),
         'backfill_debug_ui_enabled': deps.get('backfill_debug_ui_enabled'),
+        'base_cache_ttl_seconds': deps.get('base_cache_ttl_seconds', 0),
+        'record_stage_timing': deps.get('record_stage_timing'),
     }
     source_tier = deps.get('source_tier')
     min_confidence_weight = deps.get('min_confidence_weight')
@@ -99,6 +114,8 @@ def fetch_actor_notebook_wrapper_core(*, actor_id: str, deps: dict[str, object])
     prefer_cached = bool(deps.get('prefer_cached', True))
     build_on_cache_miss = bool(deps.get('build_on_cache_miss', True))
     allow_stale_cache = bool(deps.get('allow_stale_cache', False))
+    stale_while_revalidate = bool(deps.get('stale_while_revalidate', False))
+    swr_max_stale_seconds = max(0, int(deps.get('swr_max_stale_seconds', 86400) or 0))
     cache_key = notebook_cache_service.cache_key_core(
         source_tier=source_tier,
         min_confidence_weight=min_confidence_weight,
@@ -107,9 +124,9 @@ def fetch_actor_notebook_wrapper_core(*, actor_id: str, deps: dict[str, object])
         backfill_debug_ui_enabled=pipeline_deps.get('backfill_debug_ui_enabled'),
     )
 
+    data_fingerprint = ''
     if prefer_cached:
-        with sqlite3.connect(_db_path(), timeout=30.0) as connection:
-            connection.execute('PRAGMA busy_timeout = 30000')
+        with db_connection_service.connect_core(_db_path()) as connection:
             data_fingerprint = notebook_cache_service.actor_data_fingerprint_core(connection, actor_id)
             cached = notebook_cache_service.load_cached_notebook_core(
                 connection,
@@ -120,27 +137,50 @@ def fetch_actor_notebook_wrapper_core(*, actor_id: str, deps: dict[str, object])
             if isinstance(cached, dict):
                 cached['snapshot_stale'] = False
                 return finalize_notebook_contract_core(cached)
-            stale_cached = notebook_cache_service.load_latest_cached_notebook_for_key_core(
+            stale_cached, stale_updated_at = notebook_cache_service.load_latest_cached_notebook_entry_core(
                 connection,
                 actor_id=actor_id,
                 cache_key=cache_key,
             )
-            if allow_stale_cache and isinstance(stale_cached, dict):
+        if stale_while_revalidate:
+            stale_age = notebook_cache_service.cache_entry_age_seconds_core(stale_updated_at)
+            within_max_stale = stale_age is not None and stale_age <= swr_max_stale_seconds
+            # Past the max-staleness bound a snapshot is still shown when the caller
+            # accepts stale data, flagged so the UI can say it is out of date.
+            if isinstance(stale_cached, dict) and (within_max_stale or allow_stale_cache):
                 stale_cached['snapshot_stale'] = True
+                stale_cached['snapshot_over_max_age'] = not within_max_stale
+                stale_cached['snapshot_revalidating'] = schedule_notebook_revalidation_core(
+                    actor_id=actor_id,
+                    cache_key=cache_key,
+                    deps=deps,
+                )
                 return finalize_notebook_contract_core(stale_cached)
             if not build_on_cache_miss:
-                return finalize_notebook_contract_core(
-                    {
-                    'cache_miss': True,
-                    'actor': {
-                        'id': actor_id,
-                        'notebook_status': 'idle',
-                        'notebook_message': 'Notebook cache is not ready yet.',
-                    },
-                    'counts': {'sources': 0},
-                    }
-                )
+                schedule_notebook_revalidation_core(actor_id=actor_id, cache_key=cache_key, deps=deps)
+        elif allow_stale_cache and isinstance(stale_cached, dict):
+            stale_cached['snapshot_stale'] = True
+            return finalize_notebook_contract_core(stale_cached)
+        if not build_on_cache_miss:
+            return finalize_notebook_contract_core(
+                {
+                'cache_miss': True,
+                'actor': {
+                    'id': actor_id,
+                    'notebook_status': 'idle',
+                    'notebook_message': 'Notebook cache is not ready yet.',
+                },
+                'counts': {'sources': 0},
+                }
+            )
 
+    if float(pipeline_deps.get('base_cache_ttl_seconds') or 0) > 0:
+        # Filter-independent notebook artifacts are reused across filter
+        # combinations for as long as the actor data is unchanged.
+        if not data_fingerprint:
+            with db_connection_service.connect_core(_db_path()) as connection:
+                data_fingerprint = notebook_cache_service.actor_data_fingerprint_core(connection, actor_id)
+        pipeline_deps['base_cache_fingerprint'] = data_fingerprint
     notebook = _pipeline_fetch_actor_notebook_core(
         actor_id,
         db_path=_db_path(),
@@ -152,8 +192,8 @@ def fetch_actor_notebook_wrapper_core(*, actor_id: str, deps: dict[str, object])
 
     if isinstance(notebook, dict):
         notebook = finalize_notebook_contract_core(notebook)
-        with sqlite3.connect(_db_path(), timeout=30.0) as connection:
-            connection.execute('PRAGMA busy_timeout = 30000')
+
+        def _write(connection) -> None:
             latest_fingerprint = notebook_cache_service.actor_data_fingerprint_core(connection, actor_id)
             notebook_cache_service.save_cached_notebook_core(
                 connection,
@@ -162,10 +202,163 @@ def fetch_actor_notebook_wrapper_core(*, actor_id: str, deps: dict[str, object])
                 data_fingerprint=latest_fingerprint,
                 payload=notebook,
             )
-            connection.commit()
+
+        db_writer_service.run_write_core(_db_path(), _write)
     return finalize_notebook_contract_core(notebook if isinstance(notebook, dict) else {})
 
 
+def enrich_actor_notebook_llm_wrapper_core(*, actor_id: str, deps: dict[str, object]) -> dict[str, object]:
+    """Patch the LLM sections of the cached notebook instead of rebuilding it.
+
+    The enriched payload is written back under the same data fingerprint.
+    Without a snapshot for the current actor data this falls back to a full
+    uncached build.
+    """
+    _pipeline_enrich_notebook_llm_sections_core = deps.get('pipeline_enrich_notebook_llm_sections_core')
+    _db_path = deps['db_path']
+    cache_key = notebook_cache_service.cache_key_core(
+        source_tier=deps.get('source_tier'),
+        min_confidence_weight=deps.get('min_confidence_weight'),
+        source_days=deps.get('source_days'),
+        enforce_ollama_synthesis=deps.get('enforce_ollama_synthesis'),
+        backfill_debug_ui_enabled=deps.get('backfill_debug_ui_enabled'),
+    )
+    cached: dict[str, object] | None = None
+    data_fingerprint = ''
+    if callable(_pipeline_enrich_notebook_llm_sections_core):
+        with db_connection_service.connect_core(_db_path()) as connection:
+            data_fingerprint = notebook_cache_service.actor_data_fingerprint_core(connection, actor_id)
+            cached = notebook_cache_service.load_cached_notebook_core(
+                connection,
+                actor_id=actor_id,
+                cache_key=cache_key,
+                data_fingerprint=data_fingerprint,
+            )
+    if not isinstance(cached, dict):
+        rebuild_deps = dict(deps)
+        rebuild_deps['prefer_cached'] = False
+        rebuild_deps['stale_while_revalidate'] = False
+        return fetch_actor_notebook_wrapper_core(actor_id=actor_id, deps=rebuild_deps)
+    if not bool(cached.get('llm_change_signals_degraded')) and not bool(cached.get('llm_recent_synthesis_degraded')):
+        return finalize_notebook_contract_core(cached)
+
+    notebook = _pipeline_enrich_notebook_llm_sections_core(
+        cached,
+        db_path=_db_path(),
+        deps={
+            'parse_published_datetime': deps['parse_published_datetime'],
+            'ollama_review_change_signals': deps.get('ollama_review_change_signals'),
+            'ollama_synthesize_recent_activity': deps.get('ollama_synthesize_recent_activity'),
+            'record_stage_timing': deps.get('record_stage_timing'),
+        },
+    )
+    notebook = finalize_notebook_contract_core(notebook if isinstance(notebook, dict) else cached)
+
+    def _write(connection) -> None:
+        # Actor data that changed meanwhile gets a fresh build on the next read.
+        notebook_cache_service.update_cached_notebook_payload_core(
+            connection,
+            actor_id=actor_id,
+            cache_key=cache_key,
+            data_fingerprint=data_fingerprint,
+            payload=notebook,
+        )
+
+    db_writer_service.run_write_core(_db_path(), _write)
+    return notebook
+
+
+def _revalidation_executor(max_workers: int) -> ThreadPoolExecutor:
+    global _REVALIDATE_EXECUTOR, _REVALIDATE_EXECUTOR_WORKERS
+    if _REVALIDATE_EXECUTOR is None or _REVALIDATE_EXECUTOR_WORKERS != max_workers:
+        if _REVALIDATE_EXECUTOR is not None:
+            _REVALIDATE_EXECUTOR.shutdown(wait=False)
+        _REVALIDATE_EXECUTOR = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='notebook-revalidate',
+        )
+        _REVALIDATE_EXECUTOR_WORKERS = max_workers
+    return _REVALIDATE_EXECUTOR
+
+
+def _prune_revalidation_starts(now: float, cooldown_seconds: float) -> None:
+    # Caller holds _REVALIDATE_LOCK. Entries are kept oldest first, so expired
+    # cooldowns and any overflow beyond _REVALIDATE_TRACKED_MAX sit at the front.
+    while _REVALIDATE_LAST_STARTED:
+        oldest_actor_id, started_at = next(iter(_REVALIDATE_LAST_STARTED.items()))
+        if (now - started_at) < cooldown_seconds and len(_REVALIDATE_LAST_STARTED) <= _REVALIDATE_TRACKED_MAX:
+            break
+        del _REVALIDATE_LAST_STARTED[oldest_actor_id]
+
+
+def schedule_notebook_revalidation_core(
+    *,
+    actor_id: str,
+    cache_key: str,
+    deps: dict[str, object],
+) -> bool:
+    """Queue a background rebuild for one actor/cache key; False when deduplicated or throttled."""
+    max_workers = max(1, int(deps.get('swr_max_workers', 2) or 1))
+    max_pending = max(max_workers, int(deps.get('swr_max_pending', 8) or max_workers))
+    cooldown_seconds = max(0.0, float(deps.get('swr_actor_cooldown_seconds', 60) or 0))
+    inflight_key = (actor_id, cache_key)
+    now = time.monotonic()
+    with _REVALIDATE_LOCK:
+        if inflight_key in _REVALIDATE_INFLIGHT:
+            return True
+        if len(_REVALIDATE_INFLIGHT) >= max_pending:
+            return False
+        last_started = _REVALIDATE_LAST_STARTED.get(actor_id)
+        if last_started is not None and (now - last_started) < cooldown_seconds:
+            return False
+        _REVALIDATE_INFLIGHT.add(inflight_key)
+        _REVALIDATE_LAST_STARTED.pop(actor_id, None)
+        _REVALIDATE_LAST_STARTED[actor_id] = now
+        _prune_revalidation_starts(now, cooldown_seconds)
+        executor = _revalidation_executor(max_workers)
+
+    rebuild_deps = dict(deps)
+    rebuild_deps['prefer_cached'] = False
+    rebuild_deps['stale_while_revalidate'] = False
+
+    def _revalidate() -> None:
+        try:
+            fetch_actor_notebook_wrapper_core(actor_id=actor_id, deps=rebuild_deps)
+        except Exception as exc:
+            LOGGER.warning('notebook revalidation for actor %s failed: %s', actor_id, exc)
+        finally:
+            with _REVALIDATE_LOCK:
+                _REVALIDATE_INFLIGHT.discard(inflight_key)
+
+    try:
+        executor.submit(_revalidate)
+    except RuntimeError:
+        with _REVALIDATE_LOCK:
+            _REVALIDATE_INFLIGHT.discard(inflight_key)
+        return False
+    return True
+
+
+def revalidation_snapshot_core() -> dict[str, int]:
+    with _REVALIDATE_LOCK:
+        return {
+            'notebook_revalidations_inflight': len(_REVALIDATE_INFLIGHT),
+            'notebook_revalidation_actors_tracked': len(_REVALIDATE_LAST_STARTED),
+        }
+
+
+def stop_notebook_revalidation_core(*, wait: bool = False) -> None:
+    global _REVALIDATE_EXECUTOR, _REVALIDATE_EXECUTOR_WORKERS
+    with _REVALIDATE_LOCK:
+        executor = _REVALIDATE_EXECUTOR
+        _REVALIDATE_EXECUTOR = None
+        _REVALIDATE_EXECUTOR_WORKERS = 0
+        _REVALIDATE_INFLIGHT.clear()
+        _REVALIDATE_LAST_STARTED.clear()
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
 def compute_bastion_nudges_core(notebook: dict | None) -> list[str]:
     """Data-driven analyst nudges for the Bastion HUD — no AI, no drama, just record gaps."""
     if not isinstance(notebook, dict):
@@ -1,7 +1,9 @@
-import sqlite3
 from datetime import datetime, timedelta, timezone
 from threading import Event
 
+import services.db_connection_service as db_connection_service
+import services.db_writer_service as db_writer_service
+
 
 def submit_actor_refresh_job_core(
     actor_id: str,
@@ -100,7 +102,8 @@ def run_tracked_actor_auto_refresh_once_core(
     now_utc = datetime.now(timezone.utc)
     cutoff = now_utc - timedelta(hours=max(1, int(min_interval_hours)))
     queued_actor_ids: list[str] = []
-    with sqlite3.connect(db_path) as connection:
+
+    def _write(connection) -> None:
         rows = connection.execute(
             '''
             SELECT id, notebook_status, auto_refresh_last_run_at
@@ -130,7 +133,8 @@ def run_tracked_actor_auto_refresh_once_core(
                 ''',
                 (now_utc.isoformat(), 'queued', actor_id),
             )
-        connection.commit()
+
+    db_writer_service.run_write_core(db_path, _write)
     for actor_id in queued_actor_ids:
         if callable(_submit_actor_refresh_job):
             _submit_actor_refresh_job(actor_id, trigger_type='auto_refresh')
@@ -181,7 +185,7 @@ def actor_refresh_stats_core(
     freshness_cutoff = reference_now - timedelta(hours=24)
     eta_seconds: int | None = None
     avg_duration_ms: int | None = None
-    with sqlite3.connect(db_path) as connection:
+    with db_connection_service.connect_core(db_path) as connection:
         actor_row = connection.execute(
             '''
             SELECT display_name, is_tracked, notebook_status, auto_refresh_last_run_at, auto_refresh_last_status
@@ -1,8 +1,9 @@
 import json
-import sqlite3
 from datetime import datetime, timedelta, timezone
 from threading import Event
 
+import services.db_writer_service as db_writer_service
+
 
 def log_event_core(*, event: str, fields: dict[str, object], utc_now_iso, logger) -> None:
     payload = {'event': event, **fields, 'ts': utc_now_iso()}
@@ -63,7 +64,8 @@ def recover_stale_running_states_core(*, deps: dict[str, object]) -> int:
     running_ids = _generation_service.running_actor_ids_snapshot_core()
     cutoff = datetime.now(timezone.utc) - timedelta(minutes=max(5, _running_stale_recovery_minutes))
     recovered_ids: list[str] = []
-    with sqlite3.connect(_db_path) as connection:
+
+    def _write(connection) -> None:
         rows = connection.execute(
             '''
             SELECT id, notebook_updated_at
@@ -90,7 +92,8 @@ def recover_stale_running_states_core(*, deps: dict[str, object]) -> int:
                 (actor_id,),
             )
             recovered_ids.append(actor_id)
-        connection.commit()
+
+    db_writer_service.run_write_core(_db_path, _write)
     # Also expire the corresponding generation journal jobs so that the next
     # submit_actor_refresh_job call is not blocked by a stuck 'running' record.
     if _generation_journal_service is not None and _utc_now_iso is not None and recovered_ids:
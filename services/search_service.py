@@ -0,0 +1,159 @@
+import html
+import re
+import sqlite3
+
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 100
+SEARCH_MAX_OFFSET = 1000
+SEARCH_MAX_TERMS = 12
+SEARCH_SNIPPET_TOKENS = 16
+
+_MARK_START = '\x02'
+_MARK_END = '\x03'
+_QUERY_PART_RE = re.compile(r'"([^"]*)"|(\S+)')
+_TERM_CHARS_RE = re.compile(r'[^\w.\-@:/]+', re.UNICODE)
+
+# kind -> SELECT returning (id, actor_id, title, url, occurred_at, snippet, rank).
+# Each statement takes the MATCH expression first and an optional actor filter.
+# The f-strings only interpolate the module's marker and snippet-length
+# constants — no user data — safe from SQL injection.
+_SEARCH_QUERIES: dict[str, str] = {
+    'sources': f'''
+        SELECT
+            s.id,
+            s.actor_id,
+            COALESCE(NULLIF(TRIM(s.title), ''), NULLIF(TRIM(s.source_name), ''), s.url),
+            s.url,
+            COALESCE(s.published_at, s.ingested_at, s.retrieved_at),
+            snippet(sources_fts, -1, '{_MARK_START}', '{_MARK_END}', '…', {SEARCH_SNIPPET_TOKENS}),
+            sources_fts.rank
+        FROM sources_fts
+        JOIN sources s ON s.rowid = sources_fts.rowid
+        WHERE sources_fts MATCH ?
+    ''',  # nosec B608
+    'timeline': f'''
+        SELECT
+            t.id,
+            t.actor_id,
+            t.title,
+            '',
+            t.occurred_at,
+            snippet(timeline_events_fts, -1, '{_MARK_START}', '{_MARK_END}', '…', {SEARCH_SNIPPET_TOKENS}),
+            timeline_events_fts.rank
+        FROM timeline_events_fts
+        JOIN timeline_events t ON t.rowid = timeline_events_fts.rowid
+        WHERE timeline_events_fts MATCH ?
+    ''',  # nosec B608
+    'observations': f'''
+        SELECT
+            o.id,
+            o.actor_id,
+            o.item_type || ': ' || o.item_key,
+            o.citation_url,
+            o.updated_at,
+            snippet(analyst_observations_fts, -1, '{_MARK_START}', '{_MARK_END}', '…', {SEARCH_SNIPPET_TOKENS}),
+            analyst_observations_fts.rank
+        FROM analyst_observations_fts
+        JOIN analyst_observations o ON o.rowid = analyst_observations_fts.rowid
+        WHERE analyst_observations_fts MATCH ?
+    ''',  # nosec B608
+}
+_ACTOR_FILTER = {'sources': 's.actor_id', 'timeline': 't.actor_id', 'observations': 'o.actor_id'}
+SEARCH_KINDS = tuple(_SEARCH_QUERIES)
+
+
+def build_match_query_core(text: str) -> str:
+    """Turn free text into an FTS5 MATCH expression that ANDs its terms.
+
+    Every term is quoted so user input can never be parsed as FTS5 syntax;
+    ``"quoted phrases"`` stay phrases and a trailing ``*`` keeps prefix search.
+    """
+    terms: list[str] = []
+    for match in _QUERY_PART_RE.finditer(str(text or '')):
+        phrase, word = match.group(1), match.group(2)
+        prefix = False
+        if word is not None:
+            prefix = word.endswith('*')
+            phrase = word
+        cleaned = ' '.join(_TERM_CHARS_RE.sub(' ', phrase or '').split())
+        if not cleaned:
+            continue
+        terms.append(f'"{cleaned}"' + ('*' if prefix else ''))
+        if len(terms) >= SEARCH_MAX_TERMS:
+            break
+    return ' '.join(terms)
+
+
+def _snippet_html(raw_snippet: str) -> str:
+    escaped = html.escape(str(raw_snippet or ''))
+    return escaped.replace(_MARK_START, '<mark>').replace(_MARK_END, '</mark>')
+
+
+def search_corpus_core(
+    connection: sqlite3.Connection,
+    *,
+    query: str,
+    actor_id: str | None = None,
+    kinds: list[str] | None = None,
+    limit: int = SEARCH_DEFAULT_LIMIT,
+    offset: int = 0,
+) -> dict[str, object]:
+    """Rank sources, timeline events and observations matching ``query`` with bm25.
+
+    Each kind is read in rank order up to the requested page end and the lists
+    are merged, so a page costs O(offset + limit) rows per kind. Raises
+    ValueError for an empty query or an unknown kind.
+    """
+    match_query = build_match_query_core(query)
+    if not match_query:
+        raise ValueError('query must contain at least one search term')
+    selected_kinds = [str(kind).strip().lower() for kind in (kinds or []) if str(kind).strip()] or list(SEARCH_KINDS)
+    unknown_kinds = sorted(set(selected_kinds) - set(SEARCH_KINDS))
+    if unknown_kinds:
+        raise ValueError(f"unknown search kind(s): {', '.join(unknown_kinds)}")
+    safe_limit = max(1, min(SEARCH_MAX_LIMIT, int(limit)))
+    safe_offset = max(0, min(SEARCH_MAX_OFFSET, int(offset)))
+    page_end = safe_offset + safe_limit
+
+    ranked: list[tuple[float, dict[str, object]]] = []
+    for kind in SEARCH_KINDS:
+        if kind not in selected_kinds:
+            continue
+        sql = _SEARCH_QUERIES[kind]
+        params: list[object] = [match_query]
+        if actor_id is not None:
+            # _ACTOR_FILTER holds fixed column names and actor_id is bound — safe from SQL injection.
+            sql += f' AND {_ACTOR_FILTER[kind]} = ?'  # nosec B608
+            params.append(actor_id)
+        sql += ' ORDER BY rank LIMIT ?'
+        params.append(page_end + 1)
+        for row in connection.execute(sql, params).fetchall():
+            rank = float(row[6] or 0.0)
+            ranked.append(
+                (
+                    rank,
+                    {
+                        'kind': kind,
+                        'id': str(row[0]),
+                        'actor_id': str(row[1]),
+                        'title': str(row[2] or ''),
+                        'url': str(row[3] or ''),
+                        'occurred_at': str(row[4] or ''),
+                        'snippet_html': _snippet_html(str(row[5] or '')),
+                        # bm25 ranks are negative; flip them so higher means more relevant.
+                        'score': round(-rank, 6),
+                    },
+                )
+            )
+    ranked.sort(key=lambda item: item[0])
+    items = [item for _rank, item in ranked[safe_offset:page_end]]
+    return {
+        'query': str(query or ''),
+        'actor_id': actor_id,
+        'kinds': [kind for kind in SEARCH_KINDS if kind in selected_kinds],
+        'limit': safe_limit,
+        'offset': safe_offset,
+        'count': len(items),
+        'has_more': len(ranked) > page_end,
+        'items': items,
+    }
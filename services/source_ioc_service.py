@@ -0,0 +1,130 @@
+import re
+import sqlite3
+from datetime import datetime, timezone
+
+import services.ioc_store_service as ioc_store_service
+import services.ioc_validation_service as ioc_validation_service
+from pipelines.notebook_ioc_helpers import _derived_ioc_items_from_sources
+
+SOURCE_IOC_BATCH_LIMIT = 200
+
+
+def _actor_source_hosts(connection: sqlite3.Connection, actor_id: str) -> set[str]:
+    rows = connection.execute(
+        '''
+        SELECT DISTINCT lower(
+            CASE WHEN instr(rest, '/') > 0 THEN substr(rest, 1, instr(rest, '/') - 1) ELSE rest END
+        )
+        FROM (
+            SELECT substr(url, instr(url, '://') + 3) AS rest
+            FROM sources
+            WHERE actor_id = ? AND (url LIKE 'http://%' OR url LIKE 'https://%')
+        )
+        ''',
+        (actor_id,),
+    ).fetchall()
+    hosts: set[str] = set()
+    for row in rows:
+        host = re.split(r'[:?#]', str(row[0] or ''), maxsplit=1)[0].strip()
+        if not host:
+            continue
+        hosts.add(host)
+        if host.startswith('www.') and len(host) > 4:
+            hosts.add(host[4:])
+    return hosts
+
+
+def extract_pending_source_iocs_core(
+    connection: sqlite3.Connection,
+    *,
+    actor_id: str,
+    source_ids: list[str] | None = None,
+    limit: int = SOURCE_IOC_BATCH_LIMIT,
+    now_iso: str | None = None,
+) -> int:
+    """Derive IOCs for sources that have not been scanned yet.
+
+    Sources are marked with ``iocs_extracted_at`` once scanned; content
+    refreshes clear the marker so the next pass re-derives them. Returns the
+    number of IOC candidates upserted.
+    """
+    params: list[object] = [actor_id]
+    id_clause = ''
+    if source_ids is not None:
+        scoped_ids = [str(value).strip() for value in source_ids if str(value).strip()]
+        if not scoped_ids:
+            return 0
+        id_clause = f" AND id IN ({','.join('?' for _ in scoped_ids)})"
+        params.extend(scoped_ids)
+    params.append(max(1, int(limit)))
+    # {id_clause} only adds '?,?,...' placeholders — no user data — safe from SQL injection.
+    pending_rows = connection.execute(
+        f'''
+        SELECT
+            id, source_name, url, published_at, retrieved_at, pasted_text,
+            title, headline, og_title, html_title, source_tier
+        FROM sources
+        WHERE actor_id = ? AND iocs_extracted_at IS NULL{id_clause}
+        ORDER BY COALESCE(published_at, ingested_at, retrieved_at) DESC
+        LIMIT ?
+        ''',  # nosec B608
+        params,
+    ).fetchall()
+    if not pending_rows:
+        return 0
+    pending_sources = [
+        {
+            'id': row[0],
+            'source_name': row[1],
+            'url': row[2],
+            'published_at': row[3],
+            'retrieved_at': row[4],
+            'pasted_text': row[5],
+            'title': row[6],
+            'headline': row[7],
+            'og_title': row[8],
+            'html_title': row[9],
+            'source_tier': row[10],
+        }
+        for row in pending_rows
+    ]
+    pending_ids = {str(item['id']) for item in pending_sources}
+    # Report hosts across the whole actor corpus are excluded from extracted
+    # domains. SQLite reduces the corpus to its distinct hosts so a
+    # single-source ingest does not pull every URL into Python.
+    ignored_domains = _actor_source_hosts(connection, actor_id)
+    # Each source is derived uncapped: every pending source is stamped below,
+    # so anything cut off here would never be scanned again.
+    candidates = [
+        candidate
+        for source in pending_sources
+        for candidate in _derived_ioc_items_from_sources(
+            [source],
+            max_items=None,
+            ignored_domains=ignored_domains,
+        )
+    ]
+    stamp = now_iso or datetime.now(timezone.utc).isoformat()
+    for candidate in candidates:
+        ioc_store_service.upsert_ioc_item_core(
+            connection,
+            actor_id=actor_id,
+            raw_ioc_type=str(candidate.get('ioc_type') or 'indicator'),
+            raw_ioc_value=str(candidate.get('ioc_value') or ''),
+            source_ref=str(candidate.get('source_ref') or '') or None,
+            source_id=str(candidate.get('source_id') or '') or None,
+            source_tier=str(candidate.get('source_tier') or '') or None,
+            extraction_method='auto_source_regex',
+            now_iso=stamp,
+            observed_at=str(candidate.get('observed_at') or '') or None,
+            deps={
+                'validate_ioc_candidate': ioc_validation_service.validate_ioc_candidate_core,
+            },
+        )
+    marked_ids = sorted(pending_ids)
+    # The IN list is only '?,?,...' placeholders — no user data — safe from SQL injection.
+    connection.execute(
+        f"UPDATE sources SET iocs_extracted_at = ? WHERE id IN ({','.join('?' for _ in marked_ids)})",  # nosec B608
+        [stamp, *marked_ids],
+    )
+    return len(candidates)
@@ -0,0 +1,219 @@
+import hashlib
+import json
+import re
+import sqlite3
+from datetime import datetime, timezone
+
+import services.extraction_pool_service as extraction_pool_service
+import services.text_utils_service as text_utils_service
+from pipelines.timeline_extraction import looks_like_activity_sentence
+from pipelines.timeline_extraction import sentence_mentions_actor_terms
+from pipelines.timeline_extraction import timeline_category_from_sentence
+from services.domain_config import QUESTION_SEED_KEYWORDS
+
+SOURCE_SENTENCE_BATCH_LIMIT = 200
+
+
+def actor_terms_digest_core(actor_terms: list[str]) -> str:
+    return hashlib.sha256(
+        '\n'.join(sorted(str(term).strip().lower() for term in actor_terms)).encode('utf-8')
+    ).hexdigest()[:12]
+
+
+def sentence_rows_for_text_core(text: str) -> list[dict[str, object]]:
+    """Split one source body into sentence records with the actor-independent facts.
+
+    TTP IDs are stored unvalidated; readers re-check them against the current
+    ATT&CK technique set.
+    """
+    rows: list[dict[str, object]] = []
+    for sentence in text_utils_service.split_sentences_core(str(text or '')):
+        lowered = sentence.lower()
+        ttp_ids: list[str] = []
+        for value in re.findall(r'\bT\d{4}(?:\.\d{3})?\b', sentence, flags=re.IGNORECASE):
+            if value.upper() not in ttp_ids:
+                ttp_ids.append(value.upper())
+        rows.append(
+            {
+                'sentence': sentence,
+                'is_activity': looks_like_activity_sentence(sentence),
+                'category': timeline_category_from_sentence(sentence),
+                'is_question_candidate': any(keyword in lowered for keyword in QUESTION_SEED_KEYWORDS),
+                'ttp_ids': ttp_ids,
+            }
+        )
+    return rows
+
+
+def index_source_sentences_core(
+    connection: sqlite3.Connection,
+    *,
+    actor_id: str,
+    source_ids: list[str] | None = None,
+    limit: int | None = SOURCE_SENTENCE_BATCH_LIMIT,
+    now_iso: str | None = None,
+    workers: int = 0,
+) -> int:
+    """Split sources that have not been indexed yet into ``source_sentences`` rows.
+
+    Sources are marked with ``sentences_indexed_at``; content refreshes clear
+    the marker. Actor-mention flags are left for refresh_sentence_actor_mentions_core().
+    Returns the number of sources indexed.
+    """
+    params: list[object] = [actor_id]
+    id_clause = ''
+    if source_ids is not None:
+        scoped_ids = [str(value).strip() for value in source_ids if str(value).strip()]
+        if not scoped_ids:
+            return 0
+        id_clause = f" AND id IN ({','.join('?' for _ in scoped_ids)})"
+        params.extend(scoped_ids)
+    limit_clause = ''
+    if limit is not None:
+        limit_clause = ' LIMIT ?'
+        params.append(max(1, int(limit)))
+    # {id_clause} and {limit_clause} only add '?' placeholders — no user data — safe from SQL injection.
+    pending_rows = connection.execute(
+        f'''
+        SELECT id, pasted_text
+        FROM sources
+        WHERE actor_id = ? AND sentences_indexed_at IS NULL{id_clause}
+        ORDER BY COALESCE(published_at, ingested_at, retrieved_at) DESC{limit_clause}
+        ''',  # nosec B608
+        params,
+    ).fetchall()
+    if not pending_rows:
+        return 0
+    sentence_rows_by_source = extraction_pool_service.map_extraction_core(
+        sentence_rows_for_text_core,
+        [(row[1] or '',) for row in pending_rows],
+        workers=workers,
+    )
+    pending_ids = [str(row[0]) for row in pending_rows]
+    # {placeholders} is only '?,?,...' — no user data — safe from SQL injection.
+    placeholders = ','.join('?' for _ in pending_ids)
+    connection.execute(f'DELETE FROM source_sentences WHERE source_id IN ({placeholders})', pending_ids)  # nosec B608
+    connection.executemany(
+        '''
+        INSERT INTO source_sentences (
+            source_id, position, actor_id, sentence, mentions_actor, is_activity,
+            category, is_question_candidate, ttp_ids_json
+        )
+        VALUES (?, ?, ?, ?, NULL, ?, ?, ?, ?)
+        ''',
+        [
+            (
+                source_id,
+                position,
+                actor_id,
+                str(row['sentence']),
+                1 if row['is_activity'] else 0,
+                row['category'],
+                1 if row['is_question_candidate'] else 0,
+                json.dumps(row['ttp_ids']),
+            )
+            for source_id, sentence_rows in zip(pending_ids, sentence_rows_by_source)
+            for position, row in enumerate(sentence_rows)
+        ],
+    )
+    stamp = now_iso or datetime.now(timezone.utc).isoformat()
+    connection.execute(
+        f'UPDATE sources SET sentences_indexed_at = ?, sentence_terms_key = NULL WHERE id IN ({placeholders})',  # nosec B608
+        [stamp, *pending_ids],
+    )
+    return len(pending_ids)
+
+
+def refresh_sentence_actor_mentions_core(
+    connection: sqlite3.Connection,
+    *,
+    actor_id: str,
+    actor_terms: list[str],
+) -> int:
+    """Recompute ``mentions_actor`` for sources indexed under different actor terms."""
+    terms_key = actor_terms_digest_core(actor_terms)
+    stale_ids = [
+        str(row[0])
+        for row in connection.execute(
+            '''
+            SELECT id
+            FROM sources
+            WHERE actor_id = ?
+              AND sentences_indexed_at IS NOT NULL
+              AND (sentence_terms_key IS NULL OR sentence_terms_key <> ?)
+            ''',
+            (actor_id, terms_key),
+        ).fetchall()
+    ]
+    if not stale_ids:
+        return 0
+    updates: list[tuple[int, str, int]] = []
+    for start in range(0, len(stale_ids), SOURCE_SENTENCE_BATCH_LIMIT):
+        batch = stale_ids[start:start + SOURCE_SENTENCE_BATCH_LIMIT]
+        # {placeholders} is only '?,?,...' — no user data — safe from SQL injection.
+        placeholders = ','.join('?' for _ in batch)
+        for source_id, position, sentence in connection.execute(
+            f'SELECT source_id, position, sentence FROM source_sentences WHERE source_id IN ({placeholders})',  # nosec B608
+            batch,
+        ).fetchall():
+            mentions = sentence_mentions_actor_terms(str(sentence), actor_terms)
+            updates.append((1 if mentions else 0, str(source_id), int(position)))
+    connection.executemany(
+        'UPDATE source_sentences SET mentions_actor = ? WHERE source_id = ? AND position = ?',
+        updates,
+    )
+    connection.executemany(
+        'UPDATE sources SET sentence_terms_key = ? WHERE id = ?',
+        [(terms_key, source_id) for source_id in stale_ids],
+    )
+    return len(stale_ids)
+
+
+def load_source_sentences_core(
+    connection: sqlite3.Connection,
+    *,
+    actor_id: str,
+    source_ids: list[str] | None = None,
+    question_candidates_only: bool = False,
+) -> dict[str, list[dict[str, object]]]:
+    """Return indexed sentences grouped by source id, oldest retrieved source first."""
+    params: list[object] = [actor_id]
+    clauses = ['ss.actor_id = ?']
+    if source_ids is not None:
+        scoped_ids = [str(value).strip() for value in source_ids if str(value).strip()]
+        if not scoped_ids:
+            return {}
+        clauses.append(f"ss.source_id IN ({','.join('?' for _ in scoped_ids)})")
+        params.extend(scoped_ids)
+    if question_candidates_only:
+        clauses.append('ss.is_question_candidate = 1')
+    # {clauses} are fixed conditions with '?' placeholders — no user data — safe from SQL injection.
+    rows = connection.execute(
+        f'''
+        SELECT ss.source_id, ss.position, ss.sentence, ss.mentions_actor, ss.is_activity,
+               ss.category, ss.is_question_candidate, ss.ttp_ids_json
+        FROM source_sentences ss
+        JOIN sources s ON s.id = ss.source_id
+        WHERE {' AND '.join(clauses)}
+        ORDER BY s.retrieved_at ASC, ss.source_id ASC, ss.position ASC
+        ''',  # nosec B608
+        params,
+    ).fetchall()
+    grouped: dict[str, list[dict[str, object]]] = {}
+    for row in rows:
+        try:
+            ttp_ids = json.loads(row[7] or '[]')
+        except json.JSONDecodeError:
+            ttp_ids = []
+        grouped.setdefault(str(row[0]), []).append(
+            {
+                'position': int(row[1]),
+                'sentence': str(row[2]),
+                'mentions_actor': bool(row[3]),
+                'is_activity': bool(row[4]),
+                'category': row[5],
+                'is_question_candidate': bool(row[6]),
+                'ttp_ids': ttp_ids if isinstance(ttp_ids, list) else [],
+            }
+        )
+    return grouped
@@ -2,6 +2,8 @@ import sqlite3
 
 from pipelines.actor_ingest import source_fingerprint as build_source_fingerprint
 from pipelines.actor_ingest import upsert_source_for_actor
+import services.source_ioc_service as source_ioc_service
+import services.source_sentence_service as source_sentence_service
 
 
 def source_fingerprint_core(
@@ -53,7 +55,7 @@ def upsert_source_for_actor_core(
     _new_id = deps['new_id']
     _now_iso = deps['now_iso']
 
-    return upsert_source_for_actor(
+    source_id = upsert_source_for_actor(
         connection=connection,
         actor_id=actor_id,
         source_name=source_name,
@@ -76,3 +78,15 @@ def upsert_source_for_actor_core(
         new_id=_new_id,
         now_iso=_now_iso,
     )
+    # IOCs are derived once per stored source revision so notebook reads stay read-only.
+    source_ioc_service.extract_pending_source_iocs_core(
+        connection,
+        actor_id=actor_id,
+        source_ids=[source_id],
+    )
+    source_sentence_service.index_source_sentences_core(
+        connection,
+        actor_id=actor_id,
+        source_ids=[source_id],
+    )
+    return source_id
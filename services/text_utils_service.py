@@ -1,5 +1,12 @@
+import hashlib
 import re
 import string
+from array import array
+from collections import OrderedDict
+from threading import Lock
+
+TEXT_CACHE_MAX_ENTRIES = 8192
+TEXT_CACHE_MAX_TEXT_CHARS = 8192
 
 
 def normalize_text_core(value: str) -> str:
@@ -20,6 +27,211 @@ def token_overlap_core(a: str, b: str, *, token_set) -> float:
     return len(a_tokens.intersection(b_tokens)) / len(a_tokens.union(b_tokens))
 
 
+class TokenizedText:
+    """Normalized form and token set of one string, computed once.
+
+    Callers comparing the same text repeatedly should keep the instance and
+    use overlap() instead of re-tokenizing through token_overlap_core().
+    """
+
+    __slots__ = ('text', 'normalized', 'tokens')
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.normalized = normalize_text_core(text)
+        self.tokens = frozenset(token for token in self.normalized.split() if len(token) > 2)
+
+    def overlap(self, other: 'TokenizedText') -> float:
+        if not self.tokens or not other.tokens:
+            return 0.0
+        intersection = len(self.tokens & other.tokens)
+        return intersection / (len(self.tokens) + len(other.tokens) - intersection)
+
+
+_TEXT_CACHE_LOCK = Lock()
+_TEXT_CACHE: OrderedDict[str, TokenizedText] = OrderedDict()
+_TEXT_CACHE_STATS = {'hits': 0, 'misses': 0, 'uncached': 0}
+
+
+def tokenize_text_core(value: str) -> TokenizedText:
+    """Return the memoized TokenizedText for ``value`` (LRU, bounded).
+
+    Texts longer than TEXT_CACHE_MAX_TEXT_CHARS are tokenized without being
+    cached so full source bodies do not pin memory.
+    """
+    text = str(value or '')
+    if len(text) > TEXT_CACHE_MAX_TEXT_CHARS:
+        with _TEXT_CACHE_LOCK:
+            _TEXT_CACHE_STATS['uncached'] += 1
+        return TokenizedText(text)
+    with _TEXT_CACHE_LOCK:
+        cached = _TEXT_CACHE.get(text)
+        if cached is not None:
+            _TEXT_CACHE.move_to_end(text)
+            _TEXT_CACHE_STATS['hits'] += 1
+            return cached
+        _TEXT_CACHE_STATS['misses'] += 1
+    tokenized = TokenizedText(text)
+    with _TEXT_CACHE_LOCK:
+        _TEXT_CACHE[text] = tokenized
+        while len(_TEXT_CACHE) > TEXT_CACHE_MAX_ENTRIES:
+            _TEXT_CACHE.popitem(last=False)
+    return tokenized
+
+
+def text_cache_stats_core() -> dict[str, object]:
+    with _TEXT_CACHE_LOCK:
+        hits = int(_TEXT_CACHE_STATS['hits'])
+        misses = int(_TEXT_CACHE_STATS['misses'])
+        return {
+            'entries': len(_TEXT_CACHE),
+            'max_entries': TEXT_CACHE_MAX_ENTRIES,
+            'hits': hits,
+            'misses': misses,
+            'uncached': int(_TEXT_CACHE_STATS['uncached']),
+            'hit_rate': round(hits / (hits + misses), 4) if hits + misses else None,
+        }
+
+
+def clear_text_cache_core() -> None:
+    with _TEXT_CACHE_LOCK:
+        _TEXT_CACHE.clear()
+        for key in _TEXT_CACHE_STATS:
+            _TEXT_CACHE_STATS[key] = 0
+
+
+class TokenOverlapIndex:
+    """Inverted token index answering token_overlap_core() queries in bulk.
+
+    Texts are tokenized once on add(); a query only visits entries that share
+    at least one token with it, since every other entry scores 0.0.
+    """
+
+    def __init__(self, *, token_set) -> None:
+        self._token_set = token_set
+        self._sizes: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def add(self, text: str) -> int:
+        position = len(self._sizes)
+        tokens = self._token_set(text)
+        self._sizes.append(len(tokens))
+        for token in tokens:
+            self._postings.setdefault(token, []).append(position)
+        return position
+
+    def best_match(self, text: str) -> tuple[int | None, float]:
+        """Return ``(position, score)`` of the earliest entry with the highest overlap."""
+        query_tokens = self._token_set(text)
+        if not query_tokens:
+            return None, 0.0
+        shared: dict[int, int] = {}
+        for token in query_tokens:
+            for position in self._postings.get(token, ()):
+                shared[position] = shared.get(position, 0) + 1
+        best_position: int | None = None
+        best_score = 0.0
+        query_size = len(query_tokens)
+        for position in sorted(shared):
+            intersection = shared[position]
+            score = intersection / (query_size + self._sizes[position] - intersection)
+            if score > best_score:
+                best_score = score
+                best_position = position
+        return best_position, best_score
+
+    def max_overlap(self, text: str) -> float:
+        return self.best_match(text)[1]
+
+
+class MinHashLSHIndex:
+    """Near-duplicate index using MinHash signatures and banded LSH buckets.
+
+    Only entries sharing a band with the query are verified, and they are
+    verified with the exact token overlap, so scores never overstate the true
+    overlap. With the default 24 bands of 4 rows a pair at overlap 0.75 is
+    missed with probability ~1e-4, falling quickly as overlap rises. Scores
+    below the tuned threshold are not reliable, since low-overlap pairs rarely
+    share a band.
+    """
+
+    def __init__(self, *, token_set, bands: int = 24, rows: int = 4, seed: str = 'actorwatch') -> None:
+        self._token_set = token_set
+        self._bands = max(1, int(bands))
+        self._rows = max(1, int(rows))
+        self._seed = str(seed).encode('utf-8')
+        self._buckets: list[dict[tuple[int, ...], list[int]]] = [{} for _ in range(self._bands)]
+        self._token_sets: list[frozenset[str]] = []
+        self._token_hashes: dict[str, array] = {}
+        self._last_query: tuple[str, frozenset[str], list[tuple[int, ...]]] | None = None
+
+    def __len__(self) -> int:
+        return len(self._token_sets)
+
+    def _token_hash_row(self, token: str) -> array:
+        # One extendable-output digest yields a 32-bit hash per signature slot.
+        row = self._token_hashes.get(token)
+        if row is None:
+            width = self._bands * self._rows
+            row = array('I', hashlib.shake_128(self._seed + token.encode('utf-8')).digest(4 * width))
+            self._token_hashes[token] = row
+        return row
+
+    def _signature_bands(self, text: str) -> tuple[frozenset[str], list[tuple[int, ...]]]:
+        # add() right after a best_match() on the same text reuses its signature.
+        if self._last_query is not None and self._last_query[0] == text:
+            return self._last_query[1], self._last_query[2]
+        tokens = frozenset(self._token_set(text))
+        keys: list[tuple[int, ...]] = []
+        if tokens:
+            signature = list(map(min, zip(*(self._token_hash_row(token) for token in tokens))))
+            keys = [tuple(signature[band * self._rows:(band + 1) * self._rows]) for band in range(self._bands)]
+        self._last_query = (text, tokens, keys)
+        return tokens, keys
+
+    def add(self, text: str) -> int:
+        position = len(self._token_sets)
+        tokens, keys = self._signature_bands(text)
+        self._token_sets.append(tokens)
+        for band, key in enumerate(keys):
+            self._buckets[band].setdefault(key, []).append(position)
+        return position
+
+    def best_match(self, text: str) -> tuple[int | None, float]:
+        query_tokens, keys = self._signature_bands(text)
+        if not query_tokens:
+            return None, 0.0
+        candidates: set[int] = set()
+        for band, key in enumerate(keys):
+            candidates.update(self._buckets[band].get(key, ()))
+        best_position: int | None = None
+        best_score = 0.0
+        for position in sorted(candidates):
+            tokens = self._token_sets[position]
+            intersection = len(query_tokens & tokens)
+            score = intersection / (len(query_tokens) + len(tokens) - intersection)
+            if score > best_score:
+                best_score = score
+                best_position = position
+        return best_position, best_score
+
+    def max_overlap(self, text: str) -> float:
+        return self.best_match(text)[1]
+
+
+NEAR_DUPLICATE_LSH_MIN_ITEMS = 1500
+
+
+def near_duplicate_index_core(*, expected_items: int, token_set, lsh_min_items: int = NEAR_DUPLICATE_LSH_MIN_ITEMS):
+    """Pick the exact inverted index for small inputs and MinHash/LSH above the crossover."""
+    if int(expected_items) >= max(1, int(lsh_min_items)):
+        return MinHashLSHIndex(token_set=token_set)
+    return TokenOverlapIndex(token_set=token_set)
+
+
 def split_sentences_core(text: str) -> list[str]:
     sentences = [segment.strip() for segment in re.split(r'(?<=[.!?])\s+', text) if segment.strip()]
     return [sentence for sentence in sentences if len(sentence) >= 25]
@@ -7,6 +7,7 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from urllib.parse import parse_qs, quote_plus, unquote, urlparse, urlunparse
 
+import services.db_connection_service as db_connection_service
 import services.source_evidence_service as source_evidence_service
 
 
@@ -1024,7 +1025,7 @@ def run_cold_actor_backfill_core(
     deps: dict[str, object],
 ) -> dict[str, object]:
     _db_path = deps['db_path']
-    _sqlite_connect = deps.get('sqlite_connect', sqlite3.connect)
+    _sqlite_connect = deps.get('sqlite_connect', db_connection_service.connect_core)
     _utc_now_iso = deps['utc_now_iso']
     _http_get = deps['http_get']
     _derive_source_from_url = deps['derive_source_from_url']
@@ -3,6 +3,7 @@ from pathlib import Path
 
 from services import actor_profile_service
 from services import db_schema_service
+from services import source_sentence_service
 
 
 def _init_db(path: Path) -> None:
@@ -128,6 +129,46 @@ def test_merge_actor_profiles_moves_records_and_removes_source(tmp_path):
         assert feed_state == (5, 3)
 
 
+def test_merge_actor_profiles_moves_indexed_source_sentences(tmp_path):
+    db_path = tmp_path / 'actors.db'
+    _init_db(db_path)
+    with sqlite3.connect(str(db_path)) as connection:
+        connection.execute(
+            '''
+            INSERT INTO actor_profiles (id, display_name, canonical_name, scope_statement, created_at, is_tracked)
+            VALUES
+            ('target', 'Akira', 'akira', NULL, '2026-02-20T00:00:00+00:00', 1),
+            ('source', 'AKIRA Team', 'akira team', NULL, '2026-02-21T00:00:00+00:00', 0)
+            '''
+        )
+        connection.execute(
+            '''
+            INSERT INTO sources (id, actor_id, source_name, url, published_at, retrieved_at, pasted_text)
+            VALUES (
+                'src-1', 'source', 'Example', 'https://example.com/a', '2026-02-22T00:00:00Z',
+                '2026-02-22T00:00:00Z', 'Akira exploited VPN appliances. Akira deployed ransomware afterwards.'
+            )
+            '''
+        )
+        assert source_sentence_service.index_source_sentences_core(connection, actor_id='source') == 1
+        connection.commit()
+
+    actor_profile_service.merge_actor_profiles_core(
+        target_actor_id='target',
+        source_actor_id='source',
+        deps={
+            'db_path': lambda: str(db_path),
+            'utc_now_iso': lambda: '2026-02-23T00:00:00+00:00',
+            'new_id': lambda: 'obs-1',
+        },
+    )
+
+    with sqlite3.connect(str(db_path)) as connection:
+        sentences = source_sentence_service.load_source_sentences_core(connection, actor_id='target')
+        assert [row['position'] for row in sentences.get('src-1', [])] == [0, 1]
+        assert source_sentence_service.load_source_sentences_core(connection, actor_id='source') == {}
+
+
 def test_auto_merge_duplicate_actors_collapses_duplicate_sets(tmp_path):
     db_path = tmp_path / 'actors.db'
     _init_db(db_path)
@@ -358,3 +358,32 @@ def test_feedback_contract(tmp_path):
     body = summary.json()
     assert body.get('actor_id') == actor['id']
     assert isinstance(body.get('items'), dict)
+
+
+def test_search_contracts(tmp_path):
+    _setup_db(tmp_path)
+    actor = app_module.create_actor_profile('Search Contract Actor', None)
+    with sqlite3.connect(app_module.DB_PATH) as connection:
+        connection.execute(
+            '''
+            INSERT INTO sources (id, actor_id, source_name, url, retrieved_at, pasted_text, title)
+            VALUES ('src-search-1', ?, 'Feed', 'https://example.com/search', '2026-02-27T00:00:00+00:00', ?, 'Edge report')
+            ''',
+            (actor['id'], 'Operators exploited Ivanti Connect Secure appliances.'),
+        )
+        connection.commit()
+    with TestClient(app_module.app) as client:
+        actor_response = client.get(f"/actors/{actor['id']}/search", params={'q': 'ivanti', 'limit': 5})
+        global_response = client.get('/search', params={'q': 'ivanti', 'kinds': 'sources'})
+        empty_response = client.get('/search', params={'q': ' '})
+        missing_response = client.get('/actors/missing-actor/search', params={'q': 'ivanti'})
+    assert actor_response.status_code == 200
+    body = actor_response.json()
+    assert body.get('actor_id') == actor['id']
+    assert body.get('count') == 1 and body.get('has_more') is False
+    assert body['items'][0]['id'] == 'src-search-1'
+    assert '<mark>Ivanti</mark>' in body['items'][0]['snippet_html']
+    assert global_response.status_code == 200
+    assert global_response.json().get('kinds') == ['sources']
+    assert empty_response.status_code == 400
+    assert missing_response.status_code == 404
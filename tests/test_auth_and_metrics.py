@@ -39,3 +39,29 @@ def test_metrics_endpoint_reports_counters(tmp_path):
             or key.startswith('POST /actors/:id/feedback')
             for key in by_route
         )
+
+
+def test_stage_timings_report_percentiles_in_metrics_and_refresh_stats(tmp_path):
+    _setup_db(tmp_path)
+    for duration in range(1, 101):
+        metrics_service.record_stage_timing_core(
+            stage='notebook.load_rows',
+            duration_ms=float(duration),
+            rows=10,
+            actor_id='actor-other',
+        )
+    stages = metrics_service.stage_timings_snapshot_core()
+    assert stages['notebook.load_rows']['count'] == 100
+    assert stages['notebook.load_rows']['p50_ms'] == 50.0
+    assert stages['notebook.load_rows']['p99_ms'] == 99.0
+    assert stages['notebook.load_rows']['avg_rows'] == 10.0
+
+    with TestClient(app_module.app) as client:
+        actor_id = client.post('/actors', json={'display_name': 'Stage Timing Actor'}).json()['id']
+        app_module._fetch_actor_notebook(actor_id)  # noqa: SLF001
+        payload = client.get('/metrics').json()
+        assert 'notebook.load_rows' in payload.get('stage_timings', {})
+        assert 'notebook.summaries' in payload.get('stage_timings', {})
+        stats = client.get(f'/actors/{actor_id}/refresh/stats').json()
+        actor_stages = stats.get('stage_timings', {})
+        assert actor_stages.get('notebook.load_rows', {}).get('count') == 1
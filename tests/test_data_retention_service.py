@@ -1,7 +1,12 @@
 import sqlite3
+import threading
+
+import pytest
 
 from services import data_retention_service
+from services import db_connection_service
 from services import db_schema_service
+from services import db_writer_service
 
 
 def test_prune_data_core_deletes_old_rows_and_preserves_minimum():
@@ -46,3 +51,155 @@ def test_prune_data_core_deletes_old_rows_and_preserves_minimum():
     assert remaining is not None
     assert int(remaining[0]) >= 2
     assert int(result.get('feedback_events_deleted') or 0) > 0
+
+
+def _insert_aged_sources(connection, *, count: int, days_old: int, prefix: str) -> None:
+    for i in range(count):
+        connection.execute(
+            '''
+            INSERT INTO sources (id, actor_id, source_name, url, retrieved_at, pasted_text, title)
+            VALUES (?, 'actor-1', 'Feed', ?, datetime('now', ?), ?, 'Report')
+            ''',
+            (f'{prefix}-{i}', f'https://example.com/{prefix}/{i}', f'-{days_old + i} days', 'ivanti appliance text ' * 50),
+        )
+        connection.execute(
+            '''
+            INSERT INTO source_entities (id, source_id, entity_type, entity_value, normalized_value, created_at)
+            VALUES (?, ?, 'domain', 'bad.example', 'bad.example', datetime('now'))
+            ''',
+            (f'ent-{prefix}-{i}', f'{prefix}-{i}'),
+        )
+
+
+def test_prune_data_core_chunks_cascades_and_matches_dry_run():
+    connection = sqlite3.connect(':memory:')
+    db_schema_service.ensure_schema(connection)
+    _insert_aged_sources(connection, count=7, days_old=400, prefix='old')
+    _insert_aged_sources(connection, count=3, days_old=1, prefix='new')
+    connection.execute(
+        '''
+        INSERT INTO source_entities (id, source_id, entity_type, entity_value, normalized_value, created_at)
+        VALUES ('ent-orphan', 'pruned-long-ago', 'domain', 'x.example', 'x.example', datetime('now'))
+        '''
+    )
+    for i in range(5):
+        connection.execute(
+            '''
+            INSERT INTO llm_synthesis_cache (
+                actor_key, cache_kind, input_fingerprint, payload_json, created_at, updated_at
+            ) VALUES ('actor-1', 'summary', ?, '{}', datetime('now', ?), datetime('now', ?))
+            ''',
+            (f'fp-{i}', f'-{40 + i} days', f'-{40 + i} days'),
+        )
+    connection.commit()
+
+    policies = {'llm_synthesis_cache': {'retention_days': 30, 'keep_min_rows': 1}}
+    report = data_retention_service.prune_data_core(
+        connection,
+        retention_days=180,
+        keep_min_rows_per_table=2,
+        table_policies=policies,
+        dry_run=True,
+    )
+    assert connection.execute('SELECT COUNT(*) FROM sources').fetchone()[0] == 10
+
+    statements: list[str] = []
+    connection.set_trace_callback(statements.append)
+    result = data_retention_service.prune_data_core(
+        connection,
+        retention_days=180,
+        keep_min_rows_per_table=2,
+        table_policies=policies,
+        chunk_rows=3,
+    )
+    connection.set_trace_callback(None)
+
+    assert result == report
+    assert result['sources_deleted'] == 7
+    assert result['source_entities_deleted'] == 8
+    assert result['llm_cache_deleted'] == 3
+    # Trigger bodies are traced under their parent statement, so count distinct chunk deletes.
+    assert len({statement for statement in statements if statement.startswith('DELETE FROM sources')}) == 3
+    assert sorted(row[0] for row in connection.execute('SELECT id FROM sources')) == ['new-0', 'new-1', 'new-2']
+    assert connection.execute('SELECT COUNT(*) FROM source_entities').fetchone()[0] == 3
+    assert connection.execute("SELECT COUNT(*) FROM sources_fts WHERE sources_fts MATCH 'ivanti'").fetchone()[0] == 3
+    with pytest.raises(ValueError):
+        data_retention_service.retention_policies_core(retention_days=30, table_policies={'actor_profiles': {}})
+    assert data_retention_service.parse_table_policies_core('llm_synthesis_cache=30, ingest_decisions=90:1000') == {
+        'llm_synthesis_cache': {'retention_days': 30},
+        'ingest_decisions': {'retention_days': 90, 'keep_min_rows': 1000},
+    }
+
+
+def test_prune_data_core_dry_run_counts_documents_of_expired_sources_once():
+    connection = sqlite3.connect(':memory:')
+    db_schema_service.ensure_schema(connection)
+    _insert_aged_sources(connection, count=1, days_old=400, prefix='old')
+    _insert_aged_sources(connection, count=1, days_old=1, prefix='new')
+    for doc_id, source_id, days_old in (
+        ('doc-old-a', 'old-0', 401),
+        ('doc-old-b', 'old-0', 400),
+        ('doc-new-superseded', 'new-0', 300),
+        ('doc-new-latest', 'new-0', 0),
+    ):
+        connection.execute(
+            "INSERT INTO source_documents (id, source_id, fetched_at) VALUES (?, ?, datetime('now', ?))",
+            (doc_id, source_id, f'-{days_old} days'),
+        )
+    connection.commit()
+
+    report = data_retention_service.prune_data_core(
+        connection,
+        retention_days=180,
+        keep_min_rows_per_table=0,
+        dry_run=True,
+    )
+    result = data_retention_service.prune_data_core(
+        connection,
+        retention_days=180,
+        keep_min_rows_per_table=0,
+    )
+
+    assert report == result
+    assert result['sources_deleted'] == 1
+    assert result['source_documents_deleted'] == 3
+    assert [row[0] for row in connection.execute('SELECT id FROM source_documents')] == ['doc-new-latest']
+
+
+def test_retention_job_deletes_through_writer_and_reclaims_space(tmp_path):
+    db_path = str(tmp_path / 'retention.db')
+    db_connection_service.enable_wal_core(db_path)
+    with db_connection_service.connect_core(db_path) as connection:
+        db_schema_service.ensure_schema(connection)
+        _insert_aged_sources(connection, count=40, days_old=400, prefix='old')
+    try:
+        outcome = data_retention_service.run_retention_job_core(
+            stop_event=threading.Event(),
+            deps={
+                'db_path': db_path,
+                'retention_days': 180,
+                'keep_min_rows': 0,
+                'chunk_rows': 10,
+                'pause_seconds': 0,
+            },
+        )
+        stopped_event = threading.Event()
+        stopped_event.set()
+        stopped = data_retention_service.run_retention_job_core(
+            stop_event=stopped_event,
+            deps={'db_path': db_path, 'retention_days': 180, 'keep_min_rows': 0},
+        )
+    finally:
+        db_writer_service.shutdown_db_writer_core()
+    with db_connection_service.connect_core(db_path) as connection:
+        remaining = connection.execute('SELECT COUNT(*) FROM sources').fetchone()[0]
+        free_pages = connection.execute('PRAGMA freelist_count').fetchone()[0]
+    db_connection_service.close_thread_connections_core()
+
+    # The newest row at the keep_min_rows offset is the cutoff and always survives.
+    assert outcome['results']['sources_deleted'] == 39
+    assert remaining == 1
+    assert outcome['vacuum']['auto_vacuum'] == 2
+    assert outcome['vacuum']['pages_reclaimed'] > 0
+    assert free_pages == 0
+    assert stopped['stopped'] is True and stopped['vacuum'] is None
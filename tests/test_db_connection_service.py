@@ -0,0 +1,89 @@
+import sqlite3
+import threading
+
+import pytest
+
+import services.db_connection_service as db_connection_service
+
+
+def test_enable_wal_and_connections_apply_tuned_pragmas(tmp_path):
+    db_path = str(tmp_path / 'tuned.db')
+
+    assert db_connection_service.enable_wal_core(db_path) == 'wal'
+    with db_connection_service.connect_core(db_path) as connection:
+        assert connection.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+        assert connection.execute('PRAGMA synchronous').fetchone()[0] == 1
+        assert connection.execute('PRAGMA temp_store').fetchone()[0] == 2
+        assert connection.execute('PRAGMA busy_timeout').fetchone()[0] == db_connection_service.SQLITE_BUSY_TIMEOUT_MS
+        assert connection.execute('PRAGMA cache_size').fetchone()[0] == -db_connection_service.SQLITE_CACHE_SIZE_KIB
+    with db_connection_service.connect_core(db_path, timeout=0.5) as connection:
+        assert connection.execute('PRAGMA busy_timeout').fetchone()[0] == 500
+    with db_connection_service.connect_core(db_path) as connection:
+        assert connection.execute('PRAGMA busy_timeout').fetchone()[0] == db_connection_service.SQLITE_BUSY_TIMEOUT_MS
+    db_connection_service.close_thread_connections_core()
+
+
+def test_connect_reuses_thread_connection_with_transaction_semantics(tmp_path):
+    db_path = tmp_path / 'pooled.db'
+    with db_connection_service.connect_core(str(db_path)) as first:
+        first.execute('CREATE TABLE items (name TEXT)')
+        first.row_factory = sqlite3.Row
+        with db_connection_service.connect_core(str(db_path)) as nested:
+            assert nested is not first
+    with db_connection_service.connect_core(str(db_path)) as second:
+        assert second is first
+        assert second.row_factory is None
+
+    with pytest.raises(RuntimeError):
+        with db_connection_service.connect_core(str(db_path)) as connection:
+            connection.execute("INSERT INTO items (name) VALUES ('rolled back')")
+            raise RuntimeError('boom')
+    with db_connection_service.connect_core(str(db_path)) as connection:
+        connection.execute("INSERT INTO items (name) VALUES ('kept')")
+    with sqlite3.connect(db_path) as raw:
+        assert raw.execute('SELECT name FROM items').fetchall() == [('kept',)]
+
+    # A database restored over the old file gets a new connection.
+    db_connection_service.close_thread_connections_core()
+    with db_connection_service.connect_core(str(db_path)) as before_restore:
+        pass
+    restored = tmp_path / 'restored.db'
+    with sqlite3.connect(restored) as raw:
+        raw.execute('CREATE TABLE items (name TEXT)')
+    raw.close()
+    restored.replace(db_path)
+    with db_connection_service.connect_core(str(db_path)) as after_restore:
+        assert after_restore is not before_restore
+        assert after_restore.execute('SELECT COUNT(*) FROM items').fetchone()[0] == 0
+    db_connection_service.close_thread_connections_core()
+
+
+def test_wal_readers_are_not_blocked_by_an_open_write(tmp_path):
+    db_path = str(tmp_path / 'contention.db')
+    db_connection_service.enable_wal_core(db_path)
+    with db_connection_service.connect_core(db_path) as connection:
+        connection.execute('CREATE TABLE items (name TEXT)')
+        connection.execute("INSERT INTO items (name) VALUES ('committed')")
+
+    write_open = threading.Event()
+    release_write = threading.Event()
+
+    def _writer():
+        with db_connection_service.connect_core(db_path) as writer:
+            writer.execute("INSERT INTO items (name) VALUES ('pending')")
+            write_open.set()
+            release_write.wait(5)
+        db_connection_service.close_thread_connections_core()
+
+    thread = threading.Thread(target=_writer)
+    thread.start()
+    try:
+        assert write_open.wait(5)
+        with db_connection_service.connect_core(db_path, timeout=0.1) as reader:
+            assert reader.execute('SELECT name FROM items').fetchall() == [('committed',)]
+    finally:
+        release_write.set()
+        thread.join(5)
+    with db_connection_service.connect_core(db_path) as reader:
+        assert reader.execute('SELECT COUNT(*) FROM items').fetchone()[0] == 2
+    db_connection_service.close_thread_connections_core()
@@ -18,3 +18,73 @@ def test_schema_creates_evidence_pipeline_tables():
     assert 'actor_resolution' in tables
     assert 'source_scoring' in tables
     assert 'ingest_decisions' in tables
+
+
+def test_schema_migrations_are_recorded_and_skipped_once_current(tmp_path):
+    db_path = tmp_path / 'migrations.db'
+    with sqlite3.connect(db_path) as connection:
+        db_schema_service.ensure_schema(connection)
+        recorded = dict(connection.execute('SELECT key, value FROM schema_meta').fetchall())
+    connection.close()
+    assert recorded['schema_version'] == str(db_schema_service.SCHEMA_VERSION)
+    for number, name, _migrate in db_schema_service.SCHEMA_MIGRATIONS:
+        assert recorded[f'migration.{number:04d}'] == name
+
+    with sqlite3.connect(db_path) as connection:
+        connection.executemany(
+            '''
+            INSERT INTO sources (
+                id, actor_id, source_name, url, published_at, ingested_at, source_date_type,
+                retrieved_at, pasted_text, source_type
+            )
+            VALUES (?, 'actor-1', 'Feed', ?, NULL, '', '', '2026-01-01T00:00:00+00:00', 'text', '')
+            ''',
+            [(f'source-{index}', f'https://example.com/{index}') for index in range(5)],
+        )
+        statements: list[str] = []
+        connection.set_trace_callback(statements.append)
+        db_schema_service.ensure_schema(connection)
+        connection.set_trace_callback(None)
+    connection.close()
+    # A current database costs one lookup, whatever its size.
+    assert len(statements) == 1
+
+
+def test_legacy_schema_replays_migrations_with_chunked_backfills(tmp_path, monkeypatch):
+    db_path = tmp_path / 'legacy.db'
+    with sqlite3.connect(db_path) as connection:
+        db_schema_service.ensure_schema(connection)
+        connection.executemany(
+            '''
+            INSERT INTO sources (
+                id, actor_id, source_name, url, published_at, ingested_at, source_date_type,
+                retrieved_at, pasted_text, source_type
+            )
+            VALUES (?, 'actor-1', 'Feed', ?, ?, '', '', '2026-01-01T00:00:00+00:00', 'text', ' ')
+            ''',
+            [
+                (f'source-{index}', f'https://example.com/{index}', '2025-12-01' if index % 2 else None)
+                for index in range(5)
+            ],
+        )
+        connection.execute("DELETE FROM schema_meta WHERE key LIKE 'migration.%'")
+        connection.execute("UPDATE schema_meta SET value = '2026-02-27.3' WHERE key = 'schema_version'")
+    connection.close()
+
+    monkeypatch.setattr(db_schema_service, 'SCHEMA_BACKFILL_CHUNK_ROWS', 2)
+    with sqlite3.connect(db_path) as connection:
+        statements: list[str] = []
+        connection.set_trace_callback(statements.append)
+        db_schema_service.ensure_schema(connection)
+        connection.set_trace_callback(None)
+        rows = connection.execute(
+            'SELECT ingested_at, source_date_type, source_type FROM sources ORDER BY id'
+        ).fetchall()
+        version = connection.execute("SELECT value FROM schema_meta WHERE key = 'schema_version'").fetchone()[0]
+    connection.close()
+
+    assert version == str(db_schema_service.SCHEMA_VERSION)
+    assert [row[1] for row in rows] == ['ingested', 'published', 'ingested', 'published', 'ingested']
+    assert all(row[0] == '2026-01-01T00:00:00+00:00' and row[2] == 'manual' for row in rows)
+    source_updates = [statement for statement in statements if statement.startswith('UPDATE sources')]
+    assert len(source_updates) == 3
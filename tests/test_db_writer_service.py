@@ -0,0 +1,95 @@
+import sqlite3
+import threading
+
+import pytest
+
+import services.db_writer_service as db_writer_service
+
+
+def _create_items_table(db_path: str) -> None:
+    with sqlite3.connect(db_path) as connection:
+        connection.execute('CREATE TABLE items (name TEXT)')
+    connection.close()
+
+
+def test_writer_group_commits_queued_units_with_priority_and_isolation(tmp_path):
+    db_path = str(tmp_path / 'writer.db')
+    _create_items_table(db_path)
+    gate_entered = threading.Event()
+    release_gate = threading.Event()
+    order: list[str] = []
+
+    def _gate(connection):
+        gate_entered.set()
+        release_gate.wait(5)
+        connection.execute("INSERT INTO items (name) VALUES ('gate')")
+
+    def _insert(name: str):
+        def _write(connection):
+            order.append(name)
+            connection.execute('INSERT INTO items (name) VALUES (?)', (name,))
+            connection.commit()
+            return name
+
+        return _write
+
+    def _fail(connection):
+        order.append('failing')
+        connection.execute("INSERT INTO items (name) VALUES ('failing')")
+        raise ValueError('bad unit')
+
+    try:
+        gate_future = db_writer_service.submit_write_core(db_path, _gate)
+        assert gate_entered.wait(5)
+        before = db_writer_service.db_writer_stats_core()
+        futures = [
+            db_writer_service.submit_write_core(db_path, _insert('background-1')),
+            db_writer_service.submit_write_core(db_path, _fail),
+            db_writer_service.submit_write_core(db_path, _insert('background-2')),
+            db_writer_service.submit_write_core(db_path, _insert('request'), priority=True),
+        ]
+        release_gate.set()
+        gate_future.result(timeout=5)
+        assert futures[0].result(timeout=5) == 'background-1'
+        with pytest.raises(ValueError):
+            futures[1].result(timeout=5)
+        assert futures[2].result(timeout=5) == 'background-2'
+        assert futures[3].result(timeout=5) == 'request'
+
+        after = db_writer_service.db_writer_stats_core()
+        # The four units queued behind the gate share one transaction.
+        assert after['batches'] - before['batches'] == 2
+        assert after['failed_units'] - before['failed_units'] == 1
+        assert order == ['request', 'background-1', 'failing', 'background-2']
+        with sqlite3.connect(db_path) as connection:
+            names = sorted(row[0] for row in connection.execute('SELECT name FROM items'))
+        connection.close()
+        assert names == ['background-1', 'background-2', 'gate', 'request']
+    finally:
+        release_gate.set()
+        db_writer_service.shutdown_db_writer_core()
+
+
+def test_run_write_returns_results_and_nests_inline(tmp_path):
+    db_path = str(tmp_path / 'writer.db')
+    _create_items_table(db_path)
+
+    def _outer(connection):
+        connection.execute("INSERT INTO items (name) VALUES ('outer')")
+        return db_writer_service.run_write_core(
+            db_path,
+            lambda inner: inner.execute('SELECT COUNT(*) FROM items').fetchone()[0],
+        )
+
+    def _missing(_connection):
+        raise LookupError('missing')
+
+    try:
+        assert db_writer_service.run_write_core(db_path, _outer) == 1
+        with pytest.raises(LookupError):
+            db_writer_service.run_write_core(db_path, _missing)
+    finally:
+        db_writer_service.shutdown_db_writer_core()
+    with sqlite3.connect(db_path) as connection:
+        assert connection.execute('SELECT name FROM items').fetchall() == [('outer',)]
+    connection.close()
@@ -0,0 +1,30 @@
+import services.extraction_pool_service as extraction_pool_service
+import services.text_utils_service as text_utils_service
+
+
+def test_map_extraction_preserves_input_order_across_pool_chunks():
+    items = [(f'Report {index}: Actor used PowerShell!',) for index in range(40)]
+    expected = [text_utils_service.normalize_text_core(*item) for item in items]
+    try:
+        results = extraction_pool_service.map_extraction_core(
+            text_utils_service.normalize_text_core,
+            items,
+            workers=2,
+            chunk_size=7,
+        )
+    finally:
+        extraction_pool_service.shutdown_extraction_pool_core()
+    assert results == expected
+
+
+def test_map_extraction_runs_inline_for_unpicklable_callables():
+    seen: list[str] = []
+
+    def _extract(text: str) -> str:
+        seen.append(text)
+        return text.upper()
+
+    items = [(f'source {index}',) for index in range(10)]
+    results = extraction_pool_service.map_extraction_core(_extract, items, workers=4, chunk_size=2)
+    assert results == [f'SOURCE {index}' for index in range(10)]
+    assert seen == [item[0] for item in items]
@@ -8,6 +8,7 @@ import pytest
 
 import app as app_module
 import route_paths
+import services.db_connection_service as db_connection_service
 from tests.notebook_test_helpers import JsonRequest as _JsonRequest
 from tests.notebook_test_helpers import app_endpoint as _app_endpoint
 from tests.notebook_test_helpers import http_request as _http_request
@@ -157,3 +158,69 @@ def test_actor_live_data_enforces_actor_scoping(tmp_path):
     assert 'actor-b-live.example' not in serialized_a
 
 
+
+
+def _count_notebook_queries(monkeypatch, actor_id: str) -> list[str]:
+    statements: list[str] = []
+    real_connect = sqlite3.connect
+
+    def _tracing_connect(*args, **kwargs):
+        connection = real_connect(*args, **kwargs)
+        connection.set_trace_callback(statements.append)
+        return connection
+
+    # Pooled connections were opened before the patch; start from fresh ones so every query is traced.
+    db_connection_service.close_thread_connections_core()
+    with monkeypatch.context() as patch:
+        patch.setattr(sqlite3, 'connect', _tracing_connect)
+        app_module._fetch_actor_notebook(actor_id, prefer_cached=False)  # noqa: SLF001
+        db_connection_service.close_thread_connections_core()
+    return statements
+
+
+def _seed_threads(actor_id: str, count: int) -> None:
+    with sqlite3.connect(app_module.DB_PATH) as connection:
+        source_id = app_module._upsert_source_for_actor(  # noqa: SLF001
+            connection,
+            actor_id,
+            'CISA',
+            f'https://www.cisa.gov/news-events/cybersecurity-advisories/{actor_id}',
+            '2026-02-20T00:00:00+00:00',
+            'Actor used PowerShell execution and beaconing against finance entities.',
+            'Actor used PowerShell execution and beaconing against finance entities.',
+        )
+        for index in range(count):
+            thread_id = f'{actor_id}-thread-{index}'
+            connection.execute(
+                '''
+                INSERT INTO question_threads (id, actor_id, question_text, status, created_at, updated_at)
+                VALUES (?, ?, ?, 'open', '2026-02-20T00:00:00+00:00', '2026-02-20T00:00:00+00:00')
+                ''',
+                (thread_id, actor_id, f'Is the actor beaconing from host group {index}?'),
+            )
+            connection.execute(
+                '''
+                INSERT INTO question_updates (id, thread_id, source_id, trigger_excerpt, update_note, created_at)
+                VALUES (?, ?, ?, 'Beaconing observed.', '', '2026-02-20T01:00:00+00:00')
+                ''',
+                (f'{thread_id}-update', thread_id, source_id),
+            )
+        connection.commit()
+
+
+def test_notebook_question_update_queries_stay_constant_as_threads_grow(tmp_path, monkeypatch):
+    _setup_db(tmp_path)
+    small_actor = app_module.create_actor_profile('APT-Few-Threads', 'Query count scope')
+    large_actor = app_module.create_actor_profile('APT-Many-Threads', 'Query count scope')
+    _seed_threads(small_actor['id'], 3)
+    _seed_threads(large_actor['id'], 60)
+
+    small_statements = _count_notebook_queries(monkeypatch, small_actor['id'])
+    large_statements = _count_notebook_queries(monkeypatch, large_actor['id'])
+
+    def _update_loads(statements: list[str]) -> int:
+        return sum(1 for sql in statements if 'FROM question_updates qu' in sql and 'JOIN sources s' in sql)
+
+    assert _update_loads(small_statements) == 1
+    assert _update_loads(large_statements) == 1
+    assert len(large_statements) == len(small_statements)
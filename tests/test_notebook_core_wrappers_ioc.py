@@ -8,6 +8,7 @@ import pytest
 
 import app as app_module
 import route_paths
+import services.db_connection_service as db_connection_service
 from tests.notebook_test_helpers import JsonRequest as _JsonRequest
 from tests.notebook_test_helpers import app_endpoint as _app_endpoint
 from tests.notebook_test_helpers import http_request as _http_request
@@ -63,6 +64,69 @@ def test_build_notebook_creates_thread_and_update_with_excerpt(tmp_path):
         assert update[3] == '2026-02-15'
 
 
+def test_build_notebook_question_writes_are_batched_and_idempotent(tmp_path, monkeypatch):
+    _setup_db(tmp_path)
+    actor = app_module.create_actor_profile('APT-Batch', 'Batch scope')
+    with sqlite3.connect(app_module.DB_PATH) as connection:
+        for index in range(12):
+            connection.execute(
+                '''
+                INSERT INTO sources (id, actor_id, source_name, url, published_at, retrieved_at, pasted_text)
+                VALUES (?, ?, 'CISA', ?, '2026-02-15', '2026-02-15T00:00:00+00:00', ?)
+                ''',
+                (
+                    f'src-{index}',
+                    actor['id'],
+                    f'https://example.com/report-{index}',
+                    f'APT-Batch operators should review suspicious PowerShell activity on host {index} and hunt for indicators.',
+                ),
+            )
+        connection.commit()
+
+    def _update_counts() -> tuple[int, int]:
+        with sqlite3.connect(app_module.DB_PATH) as connection:
+            update_count = connection.execute(
+                '''
+                SELECT COUNT(*)
+                FROM question_updates qu
+                JOIN question_threads qt ON qt.id = qu.thread_id
+                WHERE qt.actor_id = ?
+                ''',
+                (actor['id'],),
+            ).fetchone()[0]
+            duplicate_count = connection.execute(
+                '''
+                SELECT COUNT(*) FROM (
+                    SELECT 1 FROM question_updates
+                    GROUP BY thread_id, source_id, trigger_excerpt
+                    HAVING COUNT(*) > 1
+                )
+                '''
+            ).fetchone()[0]
+        return update_count, duplicate_count
+
+    statements: list[str] = []
+    original_connect = sqlite3.connect
+
+    def _tracing_connect(*args, **kwargs):
+        connection = original_connect(*args, **kwargs)
+        connection.set_trace_callback(statements.append)
+        return connection
+
+    db_connection_service.close_thread_connections_core()
+    monkeypatch.setattr(sqlite3, 'connect', _tracing_connect)
+    app_module.build_notebook(actor['id'], rebuild_timeline=False)
+    db_connection_service.close_thread_connections_core()
+    monkeypatch.setattr(sqlite3, 'connect', original_connect)
+    first_update_count, _ = _update_counts()
+    assert first_update_count >= 12
+    # One batched insert per table instead of a SELECT/INSERT pair per sentence.
+    assert not any('FROM question_updates' in statement and 'trigger_excerpt = ' in statement for statement in statements)
+
+    app_module.build_notebook(actor['id'], rebuild_timeline=False)
+    assert _update_counts() == (first_update_count, 0)
+
+
 def test_build_notebook_wrapper_delegates_to_builder_core(monkeypatch):
     captured: dict[str, object] = {}
 
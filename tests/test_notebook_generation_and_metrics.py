@@ -8,6 +8,7 @@ from fastapi import BackgroundTasks
 import pytest
 
 import app as app_module
+import mitre_store
 import route_paths
 from tests.notebook_test_helpers import JsonRequest as _JsonRequest
 from tests.notebook_test_helpers import app_endpoint as _app_endpoint
@@ -383,6 +384,49 @@ def test_known_technique_ids_for_entity_collects_all_uses(monkeypatch):
     assert known == {'T1001', 'T1002', 'T1003.001'}
 
 
+def test_mitre_relationship_index_is_built_once_and_reset_by_clear_cache(monkeypatch):
+    dataset = {
+        'objects': [
+            {
+                'type': 'attack-pattern',
+                'id': 'attack-pattern--1',
+                'name': 'Phishing',
+                'kill_chain_phases': [{'phase_name': 'initial-access'}],
+                'external_references': [{'source_name': 'mitre-attack', 'external_id': 'T1566'}],
+            },
+            {
+                'type': 'attack-pattern',
+                'id': 'attack-pattern--2',
+                'name': 'PowerShell',
+                'kill_chain_phases': [{'phase_name': 'execution'}],
+                'external_references': [{'source_name': 'mitre-attack', 'external_id': 'T1059.001'}],
+            },
+            {'type': 'relationship', 'relationship_type': 'uses', 'source_ref': 'intrusion-set--1', 'target_ref': 'attack-pattern--2'},
+            {'type': 'relationship', 'relationship_type': 'uses', 'source_ref': 'intrusion-set--1', 'target_ref': 'attack-pattern--1'},
+            {'type': 'relationship', 'relationship_type': 'uses', 'source_ref': 'intrusion-set--1', 'target_ref': 'attack-pattern--1'},
+        ]
+    }
+    mitre_store.clear_cache()
+    monkeypatch.setattr(mitre_store, 'MITRE_DATASET_CACHE', dataset)
+
+    top = mitre_store.group_top_techniques('intrusion-set--1')
+    index = mitre_store.mitre_relationship_index()
+    assert [(item['technique_id'], item['use_count']) for item in top] == [('T1566', 2), ('T1059.001', 1)]
+    assert top[0]['phase'] == 'initial access'
+    assert mitre_store.known_technique_ids_for_entity('intrusion-set--1') == {'T1566', 'T1059.001'}
+    assert mitre_store.mitre_relationship_index() is index
+
+    # Callers get copies, so mutating a result cannot corrupt the index.
+    top[0]['name'] = 'changed'
+    assert mitre_store.group_top_techniques('intrusion-set--1', limit=1)[0]['name'] == 'Phishing'
+
+    mitre_store.clear_cache()
+    assert mitre_store.MITRE_RELATIONSHIP_INDEX_CACHE is None
+    monkeypatch.setattr(mitre_store, 'MITRE_DATASET_CACHE', {'objects': []})
+    assert mitre_store.group_top_techniques('intrusion-set--1') == []
+    mitre_store.clear_cache()
+
+
 def test_emerging_technique_ids_require_repeated_evidence_and_sort_by_recent():
     timeline_items = [
         {
@@ -657,3 +701,42 @@ def test_run_actor_generation_builds_timeline_then_full_notebook(monkeypatch):
     assert build_calls == [(False, True), (True, False)]
     assert any('Sources collected (3). Building timeline preview...' in message for message in status_messages)
     assert any('Timeline ready. Generating question threads and guidance...' in message for message in status_messages)
+
+
+def test_generation_job_shares_one_build_context_across_stages(tmp_path, monkeypatch):
+    _setup_db(tmp_path)
+    actor = app_module.create_actor_profile('APT-Context', 'Shared build context scope')
+    published_at = datetime.now(timezone.utc).isoformat()
+    with sqlite3.connect(app_module.DB_PATH) as connection:
+        connection.execute(
+            '''
+            INSERT INTO sources (id, actor_id, source_name, url, published_at, retrieved_at, pasted_text)
+            VALUES ('src-ctx', ?, 'CISA', 'https://example.com/ctx', ?, ?, ?)
+            ''',
+            (
+                actor['id'],
+                published_at,
+                published_at,
+                'APT-Context operators exploited VPN appliances and should be hunted with PowerShell logging.',
+            ),
+        )
+        connection.commit()
+
+    profile_lookups: list[str] = []
+    original_profile = app_module._build_actor_profile_from_mitre  # noqa: SLF001
+
+    def _counting_profile(actor_name):
+        profile_lookups.append(actor_name)
+        return original_profile(actor_name)
+
+    monkeypatch.setattr(app_module, '_build_actor_profile_from_mitre', _counting_profile)
+    monkeypatch.setattr(app_module, 'import_default_feeds_for_actor', lambda _actor_id, **_kwargs: 1)
+    monkeypatch.setattr(app_module, 'enqueue_actor_llm_enrichment', lambda _actor_id, **_kwargs: None)
+
+    app_module.run_actor_generation(actor['id'])
+    # The LLM stage picks up the context handed off by the generation job.
+    app_module._refresh_actor_notebook_uncached(actor['id'])  # noqa: SLF001
+    app_module._close_notebook_build_context(actor['id'])  # noqa: SLF001
+
+    assert profile_lookups == ['APT-Context']
+    assert app_module.notebook_build_context.active_build_context_core(actor['id'], db_path=app_module.DB_PATH) is None
@@ -7,6 +7,7 @@ from fastapi import BackgroundTasks
 import pytest
 
 import app as app_module
+import pipelines.notebook_builder as notebook_builder
 import route_paths
 from tests.notebook_test_helpers import JsonRequest as _JsonRequest
 from tests.notebook_test_helpers import app_endpoint as _app_endpoint
@@ -362,3 +363,101 @@ def test_timeline_dedupe_prefers_latest_duplicate_event(tmp_path):
     assert row[0] == '2026-02-22T00:00:00+00:00'
     assert row[1] == 'src-newer'
 
+
+def test_incremental_timeline_dedupe_prefers_latest_duplicate_event(tmp_path):
+    _setup_db(tmp_path)
+    actor = app_module.create_actor_profile('APT-Timeline-Replace', 'Incremental newest dedupe scope')
+
+    def _insert_source(source_id: str, published_at: str) -> None:
+        with sqlite3.connect(app_module.DB_PATH) as connection:
+            connection.execute(
+                '''
+                INSERT INTO sources (
+                    id, actor_id, source_name, url, published_at, retrieved_at, pasted_text, title
+                )
+                VALUES (?, ?, 'Example', ?, ?, ?, ?, ?)
+                ''',
+                (
+                    source_id,
+                    actor['id'],
+                    f'https://example.com/{source_id}',
+                    published_at,
+                    published_at,
+                    'APT-Timeline-Replace targeted Acme Hospital and used PowerShell execution for access.',
+                    f'Report {source_id}',
+                ),
+            )
+            connection.commit()
+
+    _insert_source('src-older', '2026-02-20T00:00:00+00:00')
+    app_module.build_notebook(actor['id'], generate_questions=False, rebuild_timeline=True)
+    _insert_source('src-newer', '2026-02-22T00:00:00+00:00')
+    app_module.build_notebook(actor['id'], generate_questions=False, rebuild_timeline=True)
+
+    with sqlite3.connect(app_module.DB_PATH) as connection:
+        rows = connection.execute(
+            'SELECT occurred_at, source_id FROM timeline_events WHERE actor_id = ?',
+            (actor['id'],),
+        ).fetchall()
+
+    assert rows == [('2026-02-22T00:00:00+00:00', 'src-newer')]
+
+
+def test_timeline_rebuild_only_extracts_new_sources_until_extractor_version_changes(tmp_path, monkeypatch):
+    _setup_db(tmp_path)
+    actor = app_module.create_actor_profile('APT-Timeline-Incremental', 'Incremental timeline scope')
+
+    def _insert_source(source_id: str, published_at: str, text: str) -> None:
+        with sqlite3.connect(app_module.DB_PATH) as connection:
+            connection.execute(
+                '''
+                INSERT INTO sources (id, actor_id, source_name, url, published_at, retrieved_at, pasted_text)
+                VALUES (?, ?, 'Example', ?, ?, ?, ?)
+                ''',
+                (source_id, actor['id'], f'https://example.com/{source_id}', published_at, published_at, text),
+            )
+            connection.commit()
+
+    extracted_source_ids: list[str] = []
+    original_extract = app_module._extract_major_move_events
+
+    def _tracking_extract(source_name, source_id, *args):
+        extracted_source_ids.append(source_id)
+        return original_extract(source_name, source_id, *args)
+
+    monkeypatch.setattr(app_module, '_extract_major_move_events', _tracking_extract)
+
+    _insert_source(
+        'src-a',
+        '2026-02-20T00:00:00+00:00',
+        'APT-Timeline-Incremental targeted Acme Hospital and used PowerShell execution for access.',
+    )
+    app_module.build_notebook(actor['id'], generate_questions=False, rebuild_timeline=True)
+    assert extracted_source_ids == ['src-a']
+
+    _insert_source(
+        'src-b',
+        '2026-02-22T00:00:00+00:00',
+        'APT-Timeline-Incremental exploited VPN appliances at Globex Manufacturing for initial access.',
+    )
+    extracted_source_ids.clear()
+    app_module.build_notebook(actor['id'], generate_questions=False, rebuild_timeline=True)
+    assert extracted_source_ids == ['src-b']
+
+    with sqlite3.connect(app_module.DB_PATH) as connection:
+        event_sources = {
+            row[0]
+            for row in connection.execute(
+                'SELECT source_id FROM timeline_events WHERE actor_id = ?',
+                (actor['id'],),
+            ).fetchall()
+        }
+    assert event_sources == {'src-a', 'src-b'}
+
+    extracted_source_ids.clear()
+    app_module.build_notebook(actor['id'], generate_questions=False, rebuild_timeline=True)
+    assert extracted_source_ids == []
+
+    monkeypatch.setattr(notebook_builder, 'TIMELINE_EXTRACTOR_VERSION', 'test-next')
+    app_module.build_notebook(actor['id'], generate_questions=False, rebuild_timeline=True)
+    assert sorted(extracted_source_ids) == ['src-a', 'src-b']
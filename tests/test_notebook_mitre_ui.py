@@ -1,3 +1,5 @@
+import json
+import os
 import sqlite3
 import time
 import asyncio
@@ -8,6 +10,7 @@ from fastapi import BackgroundTasks
 import pytest
 
 import app as app_module
+import mitre_store
 import route_paths
 from tests.notebook_test_helpers import JsonRequest as _JsonRequest
 from tests.notebook_test_helpers import app_endpoint as _app_endpoint
@@ -282,6 +285,193 @@ def test_match_mitre_software_uses_campaign_alias_enrichment(monkeypatch):
     assert match['name'] == 'Canonical Tool'
 
 
+def test_mitre_dataset_loads_from_compact_index_keyed_by_bundle(tmp_path, monkeypatch):
+    bundle_path = tmp_path / 'mitre_enterprise_attack.json'
+    bundle = {
+        'type': 'bundle',
+        'objects': [
+            {
+                'type': 'intrusion-set',
+                'id': 'intrusion-set--unit-1',
+                'name': 'Alpha Group',
+                'description': 'Alpha Group targets hospitals.',
+                'aliases': ['Alpha Legacy'],
+                'external_references': [
+                    {'source_name': 'mitre-attack', 'external_id': 'G1234', 'url': 'https://attack.mitre.org/groups/G1234/'},
+                    {'source_name': 'Vendor report', 'description': 'Long citation text'},
+                ],
+            },
+            {
+                'type': 'attack-pattern',
+                'id': 'attack-pattern--1',
+                'name': 'Phishing',
+                'description': 'Long technique description.',
+                'kill_chain_phases': [{'kill_chain_name': 'mitre-attack', 'phase_name': 'initial-access'}],
+                'external_references': [{'source_name': 'mitre-attack', 'external_id': 'T1566'}],
+            },
+            {
+                'type': 'relationship',
+                'id': 'relationship--1',
+                'relationship_type': 'uses',
+                'description': 'Long procedure example.',
+                'source_ref': 'intrusion-set--unit-1',
+                'target_ref': 'attack-pattern--1',
+            },
+            {'type': 'course-of-action', 'id': 'course-of-action--1', 'name': 'Mitigation'},
+        ],
+    }
+    bundle_path.write_text(json.dumps(bundle), encoding='utf-8')
+    monkeypatch.setenv('MITRE_ATTACK_PATH', str(bundle_path))
+    mitre_store.clear_cache()
+
+    assert mitre_store.ensure_mitre_attack_dataset() is True
+    index_path = mitre_store._mitre_compact_index_path()  # noqa: SLF001
+    assert index_path.exists()
+
+    mitre_store.clear_cache()
+    parse_sizes: list[int] = []
+    original_loads = json.loads
+    monkeypatch.setattr(mitre_store.json, 'loads', lambda raw, *a, **k: parse_sizes.append(len(raw)) or original_loads(raw, *a, **k))
+    objects = mitre_store.load_mitre_dataset()['objects']
+    assert parse_sizes == [index_path.stat().st_size]
+    assert [obj['type'] for obj in objects] == ['intrusion-set', 'attack-pattern', 'relationship']
+    assert 'description' not in objects[1] and 'description' not in objects[2]
+    assert mitre_store.match_mitre_group('G1234')['name'] == 'Alpha Group'
+    assert mitre_store.known_technique_ids_for_entity('intrusion-set--unit-1') == {'T1566'}
+
+    # A changed bundle is parsed once more and the index is rewritten for it.
+    bundle['objects'] = bundle['objects'][:1]
+    bundle_path.write_text(json.dumps(bundle), encoding='utf-8')
+    mitre_store.clear_cache()
+    assert [obj['type'] for obj in mitre_store.load_mitre_dataset()['objects']] == ['intrusion-set']
+    mitre_store.clear_cache()
+    assert len(mitre_store.load_mitre_dataset()['objects']) == 1
+    mitre_store.clear_cache()
+
+
+def _attack_bundle(group_name: str) -> dict[str, object]:
+    return {
+        'type': 'bundle',
+        'objects': [
+            {
+                'type': 'intrusion-set',
+                'id': 'intrusion-set--unit-1',
+                'name': group_name,
+                'external_references': [{'source_name': 'mitre-attack', 'external_id': 'G1234'}],
+            },
+            {
+                'type': 'attack-pattern',
+                'id': 'attack-pattern--1',
+                'name': 'Phishing',
+                'external_references': [{'source_name': 'mitre-attack', 'external_id': 'T1566'}],
+            },
+            {
+                'type': 'relationship',
+                'relationship_type': 'uses',
+                'source_ref': 'intrusion-set--unit-1',
+                'target_ref': 'attack-pattern--1',
+            },
+        ],
+    }
+
+
+class _FakeBundleResponse:
+    def __init__(self, payload: object):
+        self.content = json.dumps(payload).encode('utf-8')
+
+    def raise_for_status(self):
+        return None
+
+
+def test_mitre_refresh_boots_from_mirror_and_swaps_valid_downloads(tmp_path, monkeypatch):
+    bundle_path = tmp_path / 'data' / 'mitre_enterprise_attack.json'
+    mirror_path = tmp_path / 'mirror.json'
+    mirror_path.write_text(json.dumps(_attack_bundle('Alpha Group')), encoding='utf-8')
+    monkeypatch.setenv('MITRE_ATTACK_PATH', str(bundle_path))
+    monkeypatch.setenv('MITRE_ATTACK_MIRROR_PATH', str(mirror_path))
+    mitre_store.clear_cache()
+    for name in ('MITRE_GROUP_CACHE', 'MITRE_DATASET_CACHE', 'MITRE_SOFTWARE_CACHE', 'MITRE_CAMPAIGN_LINK_CACHE'):
+        monkeypatch.setattr(app_module, name, None)
+    monkeypatch.setattr(app_module, 'MITRE_DATASET_VERSION', '')
+
+    assert mitre_store.ensure_mitre_attack_dataset() is True
+    assert app_module._match_mitre_group('G1234')['name'] == 'Alpha Group'  # noqa: SLF001
+    boot_version = app_module.MITRE_DATASET_VERSION
+    assert boot_version
+
+    invalid = mitre_store.refresh_mitre_attack_dataset(http_get=lambda *_a, **_k: _FakeBundleResponse({'objects': []}))
+    two_days_ago = time.time() - 2 * 86400
+    os.utime(bundle_path, (two_days_ago, two_days_ago))
+    assert mitre_store.build_mitre_compact_index(force=True) is True
+    unchanged = mitre_store.refresh_mitre_attack_dataset(
+        http_get=lambda *_a, **_k: _FakeBundleResponse(_attack_bundle('Alpha Group'))
+    )
+    assert (invalid, unchanged) == (False, False)
+    # An unchanged download resets the staleness clock without touching the
+    # bundle, so the compact index still loads from its stat alone.
+    assert mitre_store.mitre_dataset_age_seconds() < 60
+    assert bundle_path.stat().st_mtime == pytest.approx(two_days_ago)
+
+    def _unexpected_hash(_path):
+        raise AssertionError('compact index fell back to hashing the bundle')
+
+    with monkeypatch.context() as patch:
+        patch.setattr(mitre_store, '_file_sha256', _unexpected_hash)
+        assert mitre_store._load_mitre_compact_index(bundle_path) is not None  # noqa: SLF001
+    assert mitre_store.MITRE_DATASET_VERSION == boot_version
+
+    assert mitre_store.refresh_mitre_attack_dataset(
+        http_get=lambda *_a, **_k: _FakeBundleResponse(_attack_bundle('Beta Group'))
+    ) is True
+    assert mitre_store.MITRE_DATASET_VERSION != boot_version
+    assert not list(bundle_path.parent.glob('*.download'))
+    # The app's stale cache copies are dropped instead of being pushed back into the store.
+    assert app_module._match_mitre_group('G1234')['name'] == 'Beta Group'  # noqa: SLF001
+    assert app_module.MITRE_DATASET_VERSION == mitre_store.MITRE_DATASET_VERSION
+    mitre_store.clear_cache()
+
+
+def test_mitre_matching_uses_indexes_and_memoizes_profiles(monkeypatch):
+    groups = [
+        {
+            'type': 'intrusion-set',
+            'id': f'intrusion-set--unit-{index}',
+            'name': name,
+            'aliases': aliases,
+            'description': f'{name} is tracked by the unit tests.',
+            'external_references': [{'source_name': 'mitre-attack', 'external_id': f'G90{index:02d}'}],
+        }
+        for index, (name, aliases) in enumerate(
+            [('Cozy Bear', ['Dark Halo']), ('Fancy Bear', ['Sofacy']), ('Bear Cub', ['Cozy Cub'])]
+        )
+    ]
+    mitre_store.clear_cache()
+    monkeypatch.setattr(mitre_store, 'MITRE_DATASET_CACHE', {'objects': groups})
+    calls: list[str] = []
+
+    def first_sentences(text: str, count: int) -> str:
+        calls.append(text)
+        return text
+
+    assert mitre_store.match_mitre_group('sofacy')['name'] == 'Fancy Bear'
+    assert mitre_store.match_mitre_group('cozy bear team')['name'] == 'Cozy Bear'
+    assert mitre_store.match_mitre_group('grizzly') is None
+
+    first = mitre_store.build_actor_profile_from_mitre('Dark Halo', first_sentences=first_sentences)
+    first['summary'] = 'edited by caller'
+    second = mitre_store.build_actor_profile_from_mitre('  dark   HALO ', first_sentences=first_sentences)
+    assert second['group_name'] == 'Cozy Bear'
+    assert second['summary'] == 'Cozy Bear is tracked by the unit tests.'
+    assert len(calls) == 1
+
+    renamed = [dict(groups[0], description='Renamed after a bundle refresh.'), *groups[1:]]
+    mitre_store.swap_mitre_dataset({'objects': renamed}, version='unit-v2')
+    third = mitre_store.build_actor_profile_from_mitre('Dark Halo', first_sentences=first_sentences)
+    assert third['summary'] == 'Renamed after a bundle refresh.'
+    assert len(calls) == 2
+    mitre_store.clear_cache()
+
+
 def test_actors_ui_escapes_actor_display_name(tmp_path):
     _setup_db(tmp_path)
     app_module.create_actor_profile('APT-<script>alert(1)</script>', 'Test scope')
@@ -1,7 +1,11 @@
 import sqlite3
+import threading
+import time
 import uuid
+from datetime import datetime, timezone
 from pathlib import Path
 
+from pipelines.notebook_pipeline_core import enrich_notebook_llm_sections_core
 from services import db_schema_service, notebook_service
 
 
@@ -172,3 +176,203 @@ def test_notebook_cache_can_return_stale_snapshot_without_rebuild(tmp_path):
     assert stale.get('generated') == 1
     assert stale.get('snapshot_stale') is True
     assert not stale.get('cache_miss')
+
+
+def _insert_source(db_path, *, name: str, url: str, text: str) -> None:
+    with sqlite3.connect(db_path) as connection:
+        connection.execute(
+            '''
+            INSERT INTO sources (
+                id, actor_id, source_name, url, published_at, ingested_at, source_date_type, retrieved_at, pasted_text
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''',
+            (
+                str(uuid.uuid4()),
+                'actor-1',
+                name,
+                url,
+                '',
+                '2026-02-26T03:00:00+00:00',
+                'ingested',
+                '2026-02-26T03:00:00+00:00',
+                text,
+            ),
+        )
+        connection.commit()
+
+
+def test_stale_while_revalidate_serves_stale_and_rebuilds_in_background(tmp_path):
+    db_path = tmp_path / 'app.db'
+    _init_db(db_path)
+    notebook_service.stop_notebook_revalidation_core()
+    calls = {'count': 0}
+    rebuild_started = threading.Event()
+    release_rebuild = threading.Event()
+
+    def fake_pipeline_fetch(actor_id, **_kwargs):
+        calls['count'] += 1
+        if calls['count'] > 1:
+            rebuild_started.set()
+            release_rebuild.wait(timeout=5)
+        return {'actor': {'id': actor_id}, 'generated': calls['count']}
+
+    deps = _deps_for_cache_test(str(db_path), fake_pipeline_fetch)
+    notebook_service.fetch_actor_notebook_wrapper_core(actor_id='actor-1', deps=deps)
+    _insert_source(db_path, name='SWR Source', url='https://example.com/swr', text='swr text')
+
+    swr_deps = dict(deps)
+    swr_deps['stale_while_revalidate'] = True
+    swr_deps['swr_actor_cooldown_seconds'] = 0
+    stale = notebook_service.fetch_actor_notebook_wrapper_core(actor_id='actor-1', deps=swr_deps)
+    assert stale.get('generated') == 1
+    assert stale.get('snapshot_stale') is True
+    assert stale.get('snapshot_revalidating') is True
+    assert rebuild_started.wait(timeout=5)
+
+    # A second stale read while the rebuild is in flight is deduplicated.
+    again = notebook_service.fetch_actor_notebook_wrapper_core(actor_id='actor-1', deps=swr_deps)
+    assert again.get('generated') == 1
+    release_rebuild.set()
+    notebook_service.stop_notebook_revalidation_core(wait=True)
+    assert calls['count'] == 2
+
+    fresh = notebook_service.fetch_actor_notebook_wrapper_core(actor_id='actor-1', deps=deps)
+    assert fresh.get('generated') == 2
+    assert fresh.get('snapshot_stale') is False
+
+
+def test_stale_while_revalidate_respects_max_staleness_and_cooldown(tmp_path):
+    db_path = tmp_path / 'app.db'
+    _init_db(db_path)
+    notebook_service.stop_notebook_revalidation_core()
+    calls = {'count': 0}
+
+    def fake_pipeline_fetch(actor_id, **_kwargs):
+        calls['count'] += 1
+        return {'actor': {'id': actor_id}, 'generated': calls['count']}
+
+    deps = _deps_for_cache_test(str(db_path), fake_pipeline_fetch)
+    notebook_service.fetch_actor_notebook_wrapper_core(actor_id='actor-1', deps=deps)
+    with sqlite3.connect(db_path) as connection:
+        connection.execute(
+            "UPDATE notebook_cache SET updated_at = '2020-01-01T00:00:00+00:00' WHERE actor_id = 'actor-1'"
+        )
+        connection.commit()
+    _insert_source(db_path, name='Old Source', url='https://example.com/old', text='old text')
+
+    swr_deps = dict(deps)
+    swr_deps['stale_while_revalidate'] = True
+    swr_deps['swr_max_stale_seconds'] = 60
+    too_old = notebook_service.fetch_actor_notebook_wrapper_core(actor_id='actor-1', deps=swr_deps)
+    assert too_old.get('generated') == 2
+    assert calls['count'] == 2
+
+    # Routes also pass allow_stale_cache: a snapshot past the bound is still shown, flagged, and revalidated.
+    with sqlite3.connect(db_path) as connection:
+        connection.execute(
+            "UPDATE notebook_cache SET updated_at = '2020-01-01T00:00:00+00:00' WHERE actor_id = 'actor-1'"
+        )
+        connection.commit()
+    _insert_source(db_path, name='Older Source', url='https://example.com/older', text='older text')
+    route_shaped = notebook_service.fetch_actor_notebook_wrapper_core(
+        actor_id='actor-1',
+        deps={**swr_deps, 'build_on_cache_miss': False, 'allow_stale_cache': True, 'swr_actor_cooldown_seconds': 0},
+    )
+    assert not route_shaped.get('cache_miss')
+    assert route_shaped.get('generated') == 2
+    assert route_shaped.get('snapshot_stale') is True
+    assert route_shaped.get('snapshot_over_max_age') is True
+    assert route_shaped.get('snapshot_revalidating') is True
+    # Expired cooldowns are pruned, so start times do not accumulate per actor.
+    assert 'actor-1' not in notebook_service._REVALIDATE_LAST_STARTED  # noqa: SLF001
+    notebook_service.stop_notebook_revalidation_core(wait=True)
+    assert calls['count'] == 3
+
+    assert notebook_service.schedule_notebook_revalidation_core(
+        actor_id='actor-2',
+        cache_key='key',
+        deps={**swr_deps, 'swr_actor_cooldown_seconds': 3600, 'pipeline_fetch_actor_notebook_core': lambda *_a, **_k: None},
+    )
+    notebook_service.stop_notebook_revalidation_core(wait=True)
+    notebook_service._REVALIDATE_LAST_STARTED['actor-2'] = time.monotonic()  # noqa: SLF001
+    assert not notebook_service.schedule_notebook_revalidation_core(
+        actor_id='actor-2',
+        cache_key='key',
+        deps={**swr_deps, 'swr_actor_cooldown_seconds': 3600},
+    )
+    notebook_service.stop_notebook_revalidation_core()
+
+
+def test_llm_enrichment_patches_cached_snapshot_without_rebuild(tmp_path):
+    db_path = tmp_path / 'app.db'
+    _init_db(db_path)
+    recent_iso = datetime.now(timezone.utc).isoformat()
+    calls = {'pipeline': 0, 'review': 0, 'synthesis': 0}
+
+    def fake_pipeline_fetch(actor_id, **_kwargs):
+        calls['pipeline'] += 1
+        return {
+            'actor': {'id': actor_id, 'display_name': 'Actor One'},
+            'sources': [
+                {
+                    'id': 'src-1',
+                    'url': 'https://example.com/vpn',
+                    'published_at': recent_iso,
+                    'confidence_weight': 3,
+                    'pasted_text': 'Actor One exploited VPN appliances.',
+                }
+            ],
+            'recent_activity_highlights': [
+                {'source_url': 'https://example.com/vpn', 'date': recent_iso, 'text': 'VPN exploitation'}
+            ],
+            'source_quality_filters': {'source_tier': '', 'min_confidence_weight': '1', 'source_days': '365'},
+            'top_change_signals': [{'change_summary': 'deterministic'}],
+            'recent_activity_synthesis': [{'label': 'deterministic'}],
+            'llm_change_signals_degraded': True,
+            'llm_recent_synthesis_degraded': True,
+        }
+
+    def fake_review(_actor_name, source_items, _highlights):
+        calls['review'] += 1
+        assert [item['id'] for item in source_items] == ['src-1']
+        return [
+            {
+                'change_summary': 'New VPN exploitation',
+                'validated_sources': [{'source_url': 'https://example.com/vpn', 'source_date': recent_iso}],
+            }
+        ]
+
+    def fake_synthesis(_actor_name, _highlights):
+        calls['synthesis'] += 1
+        # The first attempt fails, so the worker's retry has to re-run this stage only.
+        return [] if calls['synthesis'] == 1 else [{'label': 'What changed', 'text': 'VPN exploitation'}]
+
+    deps = _deps_for_cache_test(str(db_path), fake_pipeline_fetch)
+    deps['parse_published_datetime'] = lambda value: datetime.fromisoformat(value) if value else None
+    deps['pipeline_enrich_notebook_llm_sections_core'] = enrich_notebook_llm_sections_core
+    deps['ollama_review_change_signals'] = fake_review
+    deps['ollama_synthesize_recent_activity'] = fake_synthesis
+    notebook_service.fetch_actor_notebook_wrapper_core(actor_id='actor-1', deps=deps)
+    with sqlite3.connect(db_path) as connection:
+        cached_fingerprint = connection.execute(
+            "SELECT data_fingerprint FROM notebook_cache WHERE actor_id = 'actor-1'"
+        ).fetchone()[0]
+
+    first = notebook_service.enrich_actor_notebook_llm_wrapper_core(actor_id='actor-1', deps=deps)
+    assert first['llm_change_signals_degraded'] is False
+    assert first['top_change_signals'][0]['change_summary'].lower() == 'new vpn exploitation'
+    assert first['llm_recent_synthesis_degraded'] is True
+
+    second = notebook_service.enrich_actor_notebook_llm_wrapper_core(actor_id='actor-1', deps=deps)
+    assert second['llm_recent_synthesis_degraded'] is False
+    assert calls == {'pipeline': 1, 'review': 1, 'synthesis': 2}
+
+    with sqlite3.connect(db_path) as connection:
+        assert connection.execute(
+            "SELECT data_fingerprint FROM notebook_cache WHERE actor_id = 'actor-1'"
+        ).fetchall() == [(cached_fingerprint,)]
+    cached = notebook_service.fetch_actor_notebook_wrapper_core(actor_id='actor-1', deps=deps)
+    assert cached['llm_recent_synthesis_degraded'] is False
+    assert cached['recent_activity_synthesis'][0]['label'] == 'What changed'
+    assert calls['pipeline'] == 1
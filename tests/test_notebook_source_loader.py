@@ -0,0 +1,51 @@
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+from pipelines import notebook_source_loader
+from services import db_schema_service
+
+
+def _parse(value: str):
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _seed(connection: sqlite3.Connection) -> None:
+    db_schema_service.ensure_schema(connection)
+    connection.execute(
+        "INSERT INTO actor_profiles (id, display_name, created_at, is_tracked) VALUES ('actor-1', 'Actor One', '2026-01-01', 1)"
+    )
+    now = datetime.now(timezone.utc)
+    rows = [
+        ('src-new', (now - timedelta(days=2)).isoformat(), 'recent body text'),
+        ('src-old', (now - timedelta(days=900)).isoformat(), 'old body text'),
+    ]
+    for source_id, published_at, text in rows:
+        connection.execute(
+            '''
+            INSERT INTO sources (id, actor_id, source_name, url, published_at, retrieved_at, pasted_text)
+            VALUES (?, 'actor-1', 'Vendor', ?, ?, ?, ?)
+            ''',
+            (source_id, f'https://example.com/{source_id}', published_at, published_at, text),
+        )
+    connection.commit()
+
+
+def test_source_metadata_loads_without_text_and_hydrates_on_demand(tmp_path):
+    with sqlite3.connect(tmp_path / 'app.db') as connection:
+        _seed(connection)
+        items = notebook_source_loader.load_source_metadata_core(connection, 'actor-1')
+        assert [item['id'] for item in items] == ['src-new', 'src-old']
+        assert all(item['pasted_text'] is None for item in items)
+
+        recent = notebook_source_loader.sources_within_days_core(items, days=365, parse_published_datetime=_parse)
+        assert [item['id'] for item in recent] == ['src-new']
+        assert notebook_source_loader.hydrate_source_text_core(connection, recent) == 1
+        assert items[0]['pasted_text'] == 'recent body text'
+        assert items[1]['pasted_text'] is None
+
+        # Already-loaded items are skipped; only the missing body is read.
+        assert notebook_source_loader.hydrate_source_text_core(connection, items) == 1
+        assert items[1]['pasted_text'] == 'old body text'
@@ -358,3 +358,96 @@ def test_partial_match_source_can_surface_recent_activity_highlight(tmp_path):
     highlights = notebook.get('recent_activity_highlights', [])
     assert isinstance(highlights, list)
     assert len(highlights) >= 1
+
+
+def test_source_quality_filter_switch_reuses_notebook_base(tmp_path, monkeypatch):
+    import pipelines.notebook_pipeline_core as notebook_pipeline_core
+
+    _setup_db(tmp_path)
+    actor = app_module.create_actor_profile('APT-Filter-Base', 'Filter projection reuse test')
+    with sqlite3.connect(app_module.DB_PATH) as connection:
+        app_module._upsert_source_for_actor(  # noqa: SLF001
+            connection,
+            actor['id'],
+            'CISA',
+            'https://www.cisa.gov/news-events/cybersecurity-advisories/example-base',
+            '2026-02-20T00:00:00+00:00',
+            'APT-Filter-Base exploited CVE-2026-0002 against healthcare organizations.',
+            'APT-Filter-Base exploited CVE-2026-0002 against healthcare organizations.',
+        )
+        connection.commit()
+
+    base_builds: list[str] = []
+    original_build_base = notebook_pipeline_core.build_actor_notebook_base_core
+
+    def _counting_build_base(actor_id, **kwargs):
+        base_builds.append(actor_id)
+        return original_build_base(actor_id, **kwargs)
+
+    monkeypatch.setattr(app_module, 'NOTEBOOK_BASE_CACHE_TTL_SECONDS', 300)
+    monkeypatch.setattr(notebook_pipeline_core, 'build_actor_notebook_base_core', _counting_build_base)
+    notebook_pipeline_core.clear_notebook_base_cache_core()
+
+    notebook_all = app_module._fetch_actor_notebook(actor['id'], source_days=3650)  # noqa: SLF001
+    notebook_high = app_module._fetch_actor_notebook(actor['id'], source_tier='high')  # noqa: SLF001
+    notebook_weight = app_module._fetch_actor_notebook(actor['id'], min_confidence_weight=4)  # noqa: SLF001
+    assert base_builds == [actor['id']]
+    assert notebook_all['source_quality_filters']['source_days'] == '3650'
+    assert notebook_high['source_quality_filters']['source_tier'] == 'high'
+    assert notebook_weight['source_quality_filters']['min_confidence_weight'] == '4'
+    assert notebook_all['actor_profile_summary'] == notebook_high['actor_profile_summary']
+
+    with sqlite3.connect(app_module.DB_PATH) as connection:
+        app_module._upsert_source_for_actor(  # noqa: SLF001
+            connection,
+            actor['id'],
+            'Unit42',
+            'https://unit42.paloaltonetworks.com/apt-filter-base-followup',
+            '2026-02-21T00:00:00+00:00',
+            'APT-Filter-Base used PowerShell execution against finance entities.',
+            'APT-Filter-Base used PowerShell execution against finance entities.',
+        )
+        connection.commit()
+    refreshed = app_module._fetch_actor_notebook(actor['id'], source_tier='high')  # noqa: SLF001
+    assert len(base_builds) == 2
+    assert refreshed['source_quality_filters']['total_sources'] == '2'
+    notebook_pipeline_core.clear_notebook_base_cache_core()
+
+
+def test_notebook_base_retries_degraded_llm_synthesis(tmp_path, monkeypatch):
+    import pipelines.notebook_pipeline_core as notebook_pipeline_core
+
+    _setup_db(tmp_path)
+    actor = app_module.create_actor_profile('APT-Memo-Retry', 'LLM memo retry test')
+    with sqlite3.connect(app_module.DB_PATH) as connection:
+        app_module._upsert_source_for_actor(  # noqa: SLF001
+            connection,
+            actor['id'],
+            'CISA',
+            'https://www.cisa.gov/news-events/cybersecurity-advisories/example-memo',
+            '2026-02-20T00:00:00+00:00',
+            'APT-Memo-Retry exploited CVE-2026-0003 against healthcare organizations.',
+            'APT-Memo-Retry exploited CVE-2026-0003 against healthcare organizations.',
+        )
+        connection.commit()
+
+    synthesis_calls: list[str] = []
+
+    def _flaky_synthesis(actor_name, _highlights):
+        synthesis_calls.append(actor_name)
+        if len(synthesis_calls) == 1:
+            return []
+        return [{'label': 'What changed', 'text': 'New CVE exploitation observed.', 'confidence': 'Medium'}]
+
+    monkeypatch.setattr(app_module, 'NOTEBOOK_BASE_CACHE_TTL_SECONDS', 300)
+    monkeypatch.setattr(app_module, '_ollama_synthesize_recent_activity', _flaky_synthesis)
+    notebook_pipeline_core.clear_notebook_base_cache_core()
+
+    degraded = app_module._fetch_actor_notebook(actor['id'], source_days=3650)  # noqa: SLF001
+    recovered = app_module._fetch_actor_notebook(actor['id'], source_days=3650, prefer_cached=False)  # noqa: SLF001
+    cached = app_module._fetch_actor_notebook(actor['id'], source_days=3650, prefer_cached=False)  # noqa: SLF001
+    assert degraded['llm_recent_synthesis_degraded'] is True
+    assert recovered['llm_recent_synthesis_degraded'] is False
+    assert cached['llm_recent_synthesis_degraded'] is False
+    assert len(synthesis_calls) == 2
+    notebook_pipeline_core.clear_notebook_base_cache_core()
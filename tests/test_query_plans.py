@@ -0,0 +1,94 @@
+import sqlite3
+
+import pytest
+
+from pipelines import notebook_source_loader
+from services import db_schema_service
+from services import notebook_cache_service
+from services import search_service
+from services import source_evidence_service
+
+# Hot read paths, either run through the real helper or mirrored from the
+# notebook pipeline and builder. Each catalog entry's statements must be
+# answered from an index; a plain table scan here means a missing index.
+HOT_QUERY_CATALOG = {
+    'actor_data_fingerprint': lambda connection: notebook_cache_service.actor_data_fingerprint_core(
+        connection, 'actor-1'
+    ),
+    'source_metadata_by_recency': lambda connection: notebook_source_loader.load_source_metadata_core(
+        connection, 'actor-1'
+    ),
+    'corroboration_source_count': lambda connection: source_evidence_service._corroboration_source_count(  # noqa: SLF001
+        connection,
+        actor_id='actor-1',
+        source_id='source-1',
+        entities=[('domain', 'evil.example', 'evil.example'), ('ipv4', '203.0.113.7', '203.0.113.7')],
+    ),
+    'search_by_actor': lambda connection: search_service.search_corpus_core(
+        connection, query='ivanti vpn', actor_id='actor-1'
+    ),
+    'timeline_by_actor': lambda connection: connection.execute(
+        '''
+        SELECT id, occurred_at, category, title, summary, source_id, target_text, ttp_ids_json
+        FROM timeline_events
+        WHERE actor_id = ?
+        ORDER BY occurred_at ASC
+        ''',
+        ('actor-1',),
+    ).fetchall(),
+    'timeline_summaries_by_actor': lambda connection: connection.execute(
+        'SELECT id, occurred_at, summary FROM timeline_events WHERE actor_id = ? ORDER BY occurred_at DESC',
+        ('actor-1',),
+    ).fetchall(),
+    'question_threads_by_actor': lambda connection: connection.execute(
+        '''
+        SELECT id, question_text, status, created_at, updated_at
+        FROM question_threads
+        WHERE actor_id = ?
+        ORDER BY updated_at DESC
+        ''',
+        ('actor-1',),
+    ).fetchall(),
+    'question_updates_by_actor': lambda connection: connection.execute(
+        '''
+        SELECT qu.thread_id, qu.id, qu.trigger_excerpt, s.source_name, s.url, s.published_at
+        FROM question_updates qu
+        JOIN question_threads qt ON qt.id = qu.thread_id
+        JOIN sources s ON s.id = qu.source_id
+        WHERE qt.actor_id = ?
+        ORDER BY qu.created_at DESC
+        LIMIT 16
+        ''',
+        ('actor-1',),
+    ).fetchall(),
+}
+
+
+def _full_table_scans(connection: sqlite3.Connection, statement: str) -> list[str]:
+    scans: list[str] = []
+    for row in connection.execute(f'EXPLAIN QUERY PLAN {statement}').fetchall():
+        detail = str(row[3])
+        if not detail.startswith('SCAN ') or detail.startswith('SCAN CONSTANT ROW'):
+            continue
+        if 'INDEX' in detail or 'INTEGER PRIMARY KEY' in detail or '(subquery' in detail:
+            continue
+        scans.append(detail)
+    return scans
+
+
+@pytest.mark.parametrize('query_name', sorted(HOT_QUERY_CATALOG))
+def test_hot_queries_do_not_regress_to_full_table_scans(query_name):
+    connection = sqlite3.connect(':memory:')
+    try:
+        db_schema_service.ensure_schema(connection)
+        statements: list[str] = []
+        connection.set_trace_callback(statements.append)
+        HOT_QUERY_CATALOG[query_name](connection)
+        connection.set_trace_callback(None)
+
+        selects = [statement for statement in statements if statement.lstrip().upper().startswith('SELECT')]
+        assert selects, f'{query_name} issued no SELECT statements'
+        regressions = {statement: _full_table_scans(connection, statement) for statement in selects}
+        assert not any(regressions.values()), f'{query_name} scans full tables: {regressions}'
+    finally:
+        connection.close()
@@ -0,0 +1,59 @@
+import sqlite3
+
+import pytest
+
+from services import db_schema_service
+from services import search_service
+
+
+def _insert_source(connection, source_id: str, actor_id: str, title: str, text: str) -> None:
+    connection.execute(
+        '''
+        INSERT INTO sources (id, actor_id, source_name, url, retrieved_at, pasted_text, title)
+        VALUES (?, ?, 'Feed', ?, '2026-01-01T00:00:00+00:00', ?, ?)
+        ''',
+        (source_id, actor_id, f'https://example.com/{source_id}', text, title),
+    )
+
+
+def test_build_match_query_quotes_terms_and_keeps_phrases_and_prefixes():
+    assert search_service.build_match_query_core('Ivanti  VPN') == '"Ivanti" "VPN"'
+    assert search_service.build_match_query_core('"connect secure" evil.example') == '"connect secure" "evil.example"'
+    assert search_service.build_match_query_core('ivan* NEAR( ") -') == '"ivan"* "NEAR" "-"'
+    assert search_service.build_match_query_core('  "" ') == ''
+
+
+def test_search_indexes_follow_writes_and_rank_across_kinds():
+    connection = sqlite3.connect(':memory:')
+    try:
+        db_schema_service.ensure_schema(connection)
+        _insert_source(connection, 'src-1', 'actor-1', 'Edge report', 'The actor abused <b>Ivanti</b> VPN appliances.')
+        _insert_source(connection, 'src-2', 'actor-2', 'Other report', 'Ivanti exploitation elsewhere.')
+        _insert_source(connection, 'src-3', 'actor-1', 'Unrelated', 'Phishing lures with invoices.')
+        connection.execute(
+            '''
+            INSERT INTO timeline_events (id, actor_id, occurred_at, category, title, summary)
+            VALUES ('evt-1', 'actor-1', '2026-01-02', 'initial_access', 'VPN exploitation', 'Ivanti VPN exploited')
+            '''
+        )
+
+        result = search_service.search_corpus_core(connection, query='ivanti', actor_id='actor-1')
+        items = {(item['kind'], item['id']): item for item in result['items']}
+        assert set(items) == {('timeline', 'evt-1'), ('sources', 'src-1')}
+        assert '&lt;b&gt;<mark>Ivanti</mark>&lt;/b&gt;' in items[('sources', 'src-1')]['snippet_html']
+        assert [item['score'] for item in result['items']] == sorted((item['score'] for item in result['items']), reverse=True)
+
+        connection.execute("UPDATE sources SET pasted_text = 'Fortinet appliances' WHERE id = 'src-1'")
+        connection.execute("DELETE FROM timeline_events WHERE id = 'evt-1'")
+        assert search_service.search_corpus_core(connection, query='ivanti', actor_id='actor-1')['items'] == []
+        assert [item['id'] for item in search_service.search_corpus_core(connection, query='fortinet')['items']] == ['src-1']
+
+        first_page = search_service.search_corpus_core(connection, query='report', kinds=['sources'], limit=1)
+        second_page = search_service.search_corpus_core(connection, query='report', kinds=['sources'], limit=1, offset=1)
+        assert first_page['has_more'] is True and second_page['has_more'] is False
+        assert {first_page['items'][0]['id'], second_page['items'][0]['id']} == {'src-2', 'src-1'}
+        with pytest.raises(ValueError):
+            search_service.search_corpus_core(connection, query='report', kinds=['bogus'])
+        connection.execute("INSERT INTO sources_fts (sources_fts) VALUES ('integrity-check')")
+    finally:
+        connection.close()
@@ -0,0 +1,96 @@
+import sqlite3
+
+import services.db_schema_service as db_schema_service
+import services.source_ioc_service as source_ioc_service
+
+
+def _insert_source(connection: sqlite3.Connection, source_id: str, url: str, text: str) -> None:
+    connection.execute(
+        '''
+        INSERT INTO sources (id, actor_id, source_name, url, published_at, retrieved_at, pasted_text, source_tier)
+        VALUES (?, 'actor-1', 'Threat Research', ?, '2026-02-22', '2026-02-22T00:00:00+00:00', ?, 'high')
+        ''',
+        (source_id, url, text),
+    )
+
+
+def test_extract_pending_source_iocs_marks_sources_and_skips_rescans(tmp_path):
+    with sqlite3.connect(tmp_path / 'ioc.db') as connection:
+        db_schema_service.ensure_schema(connection)
+        _insert_source(
+            connection,
+            'src-1',
+            'https://intel.example/qilin-update',
+            'Qilin infrastructure observed contacting beacon.qilin-test.net and 185.88.1.45 over HTTPS during the intrusion.',
+        )
+        connection.commit()
+
+        derived = source_ioc_service.extract_pending_source_iocs_core(
+            connection,
+            actor_id='actor-1',
+            now_iso='2026-02-23T00:00:00+00:00',
+        )
+        assert derived >= 1
+        values = {
+            str(row[0]).lower()
+            for row in connection.execute("SELECT ioc_value FROM ioc_items WHERE actor_id = 'actor-1'").fetchall()
+        }
+        assert any(value.endswith('qilin-test.net') for value in values)
+        assert not any('intel.example' in value for value in values)
+        marker = connection.execute("SELECT iocs_extracted_at FROM sources WHERE id = 'src-1'").fetchone()[0]
+        assert marker == '2026-02-23T00:00:00+00:00'
+
+        assert source_ioc_service.extract_pending_source_iocs_core(connection, actor_id='actor-1') == 0
+
+        connection.execute("UPDATE sources SET iocs_extracted_at = NULL WHERE id = 'src-1'")
+        assert source_ioc_service.extract_pending_source_iocs_core(
+            connection,
+            actor_id='actor-1',
+            source_ids=['src-other'],
+        ) == 0
+        assert source_ioc_service.extract_pending_source_iocs_core(
+            connection,
+            actor_id='actor-1',
+            source_ids=['src-1'],
+        ) >= 1
+
+
+def test_extract_pending_source_iocs_persists_every_candidate_across_sources(tmp_path):
+    with sqlite3.connect(tmp_path / 'ioc.db') as connection:
+        db_schema_service.ensure_schema(connection)
+        _insert_source(
+            connection,
+            'src-report',
+            'https://www.vendor-report.example/qilin',
+            'Earlier vendor report already scanned for this actor.',
+        )
+        connection.execute("UPDATE sources SET iocs_extracted_at = '2026-02-20T00:00:00+00:00'")
+        expected_ips: set[str] = set()
+        for source_index in range(3):
+            ips = [f'185.{90 + source_index}.{octet}.7' for octet in range(1, 41)]
+            expected_ips.update(ips)
+            _insert_source(
+                connection,
+                f'src-{source_index}',
+                f'https://intel{source_index}.example/qilin-{source_index}',
+                'Qilin beacon infrastructure observed at '
+                + ', '.join(ips)
+                + '. Malicious domain vendor-report.example was cited as the original report.',
+            )
+        connection.commit()
+
+        derived = source_ioc_service.extract_pending_source_iocs_core(
+            connection,
+            actor_id='actor-1',
+            now_iso='2026-02-23T00:00:00+00:00',
+        )
+
+        assert derived >= 120
+        values = {
+            str(row[0]).lower()
+            for row in connection.execute("SELECT ioc_value FROM ioc_items WHERE actor_id = 'actor-1'").fetchall()
+        }
+        assert expected_ips <= values
+        assert 'vendor-report.example' not in values
+        pending = connection.execute('SELECT COUNT(*) FROM sources WHERE iocs_extracted_at IS NULL').fetchone()[0]
+        assert pending == 0
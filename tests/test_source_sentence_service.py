@@ -0,0 +1,60 @@
+import sqlite3
+
+import services.db_schema_service as db_schema_service
+import services.source_sentence_service as source_sentence_service
+
+
+def _insert_source(connection: sqlite3.Connection, source_id: str, text: str) -> None:
+    connection.execute(
+        '''
+        INSERT INTO sources (id, actor_id, source_name, url, published_at, retrieved_at, pasted_text)
+        VALUES (?, 'actor-1', 'Threat Research', ?, '2026-02-22', '2026-02-22T00:00:00+00:00', ?)
+        ''',
+        (source_id, f'https://intel.example/{source_id}', text),
+    )
+
+
+def test_source_sentences_are_indexed_once_and_mentions_follow_actor_terms(tmp_path):
+    with sqlite3.connect(tmp_path / 'sentences.db') as connection:
+        db_schema_service.ensure_schema(connection)
+        _insert_source(
+            connection,
+            'src-1',
+            'Qilin affiliates exploited VPN appliances using T1190 for initial access. '
+            'Defenders should hunt for suspicious PowerShell execution on exposed hosts.',
+        )
+        connection.commit()
+
+        assert source_sentence_service.index_source_sentences_core(connection, actor_id='actor-1') == 1
+        assert source_sentence_service.index_source_sentences_core(connection, actor_id='actor-1') == 0
+
+        assert source_sentence_service.refresh_sentence_actor_mentions_core(
+            connection,
+            actor_id='actor-1',
+            actor_terms=['qilin'],
+        ) == 1
+        assert source_sentence_service.refresh_sentence_actor_mentions_core(
+            connection,
+            actor_id='actor-1',
+            actor_terms=['qilin'],
+        ) == 0
+
+        rows = source_sentence_service.load_source_sentences_core(connection, actor_id='actor-1')['src-1']
+        assert [row['position'] for row in rows] == [0, 1]
+        assert rows[0]['mentions_actor'] is True
+        assert rows[0]['category'] == 'initial_access'
+        assert rows[0]['is_activity'] is True
+        assert rows[0]['ttp_ids'] == ['T1190']
+        assert rows[1]['mentions_actor'] is False
+
+        source_sentence_service.refresh_sentence_actor_mentions_core(
+            connection,
+            actor_id='actor-1',
+            actor_terms=['defenders'],
+        )
+        rows = source_sentence_service.load_source_sentences_core(connection, actor_id='actor-1')['src-1']
+        assert [row['mentions_actor'] for row in rows] == [False, True]
+
+        connection.execute("UPDATE sources SET pasted_text = 'Short.', sentences_indexed_at = NULL WHERE id = 'src-1'")
+        assert source_sentence_service.index_source_sentences_core(connection, actor_id='actor-1') == 1
+        assert source_sentence_service.load_source_sentences_core(connection, actor_id='actor-1') == {}
@@ -0,0 +1,88 @@
+import services.text_utils_service as text_utils_service
+
+
+def _token_set(value: str) -> set[str]:
+    return text_utils_service.token_set_core(value, normalize_text=text_utils_service.normalize_text_core)
+
+
+def _token_overlap(a: str, b: str) -> float:
+    return text_utils_service.token_overlap_core(a, b, token_set=_token_set)
+
+
+def test_token_overlap_index_matches_pairwise_overlap():
+    corpus = [
+        'Qilin affiliates exploited VPN appliances for initial access.',
+        'Qilin affiliates exploited edge VPN appliances for initial access.',
+        'Beacon traffic to new C2 domains was observed over DNS.',
+        'Ransom notes referenced a leak site.',
+        'an as of',
+        'Operators staged payloads with scheduled tasks and PowerShell.',
+    ]
+    index = text_utils_service.TokenOverlapIndex(token_set=_token_set)
+    for text in corpus:
+        index.add(text)
+    assert len(index) == len(corpus)
+
+    queries = [
+        'Which VPN appliances did Qilin affiliates exploit for initial access?',
+        'What C2 domains and DNS beacon traffic were observed?',
+        'Did operators use PowerShell scheduled tasks?',
+        'Nothing in common here',
+        '',
+    ]
+    for query in queries:
+        scores = [_token_overlap(query, text) for text in corpus]
+        expected_score = max(scores)
+        position, score = index.best_match(query)
+        assert score == expected_score
+        assert index.max_overlap(query) == expected_score
+        if expected_score > 0:
+            # Ties resolve to the earliest entry, like a strict ``>`` scan.
+            assert position == scores.index(expected_score)
+        else:
+            assert position is None
+
+
+def test_minhash_lsh_index_finds_near_duplicates_with_exact_scores():
+    index = text_utils_service.MinHashLSHIndex(token_set=_token_set)
+    kept = [
+        'Qilin affiliates exploited edge VPN appliances at regional hospitals for initial access last week.',
+        'Beacon traffic to newly registered C2 domains was observed over DNS tunnelling channels.',
+    ]
+    for text in kept:
+        index.add(text)
+
+    near_duplicate = 'Qilin affiliates exploited edge VPN appliances at regional hospitals for initial access this week.'
+    position, score = index.best_match(near_duplicate)
+    assert position == 0
+    assert score == _token_overlap(near_duplicate, kept[0])
+    assert score >= 0.75
+
+    assert index.max_overlap('Ransom notes referenced a new leak site hosted on Tor.') < 0.75
+    assert index.best_match('') == (None, 0.0)
+
+
+def test_near_duplicate_index_switches_to_lsh_above_crossover():
+    small = text_utils_service.near_duplicate_index_core(expected_items=10, token_set=_token_set, lsh_min_items=100)
+    large = text_utils_service.near_duplicate_index_core(expected_items=100, token_set=_token_set, lsh_min_items=100)
+    assert isinstance(small, text_utils_service.TokenOverlapIndex)
+    assert isinstance(large, text_utils_service.MinHashLSHIndex)
+
+
+def test_tokenize_text_memoizes_and_reports_hit_rate():
+    text_utils_service.clear_text_cache_core()
+    first = text_utils_service.tokenize_text_core('Qilin exploited VPN appliances.')
+    second = text_utils_service.tokenize_text_core('Qilin exploited VPN appliances.')
+    other = text_utils_service.tokenize_text_core('Qilin exploited edge appliances.')
+
+    assert second is first
+    assert isinstance(first.tokens, frozenset)
+    assert first.normalized == text_utils_service.normalize_text_core('Qilin exploited VPN appliances.')
+    assert first.overlap(other) == _token_overlap('Qilin exploited VPN appliances.', 'Qilin exploited edge appliances.')
+
+    stats = text_utils_service.text_cache_stats_core()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 2
+    assert stats['entries'] == 2
+    assert stats['hit_rate'] == round(1 / 3, 4)
+    text_utils_service.clear_text_cache_core()